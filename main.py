@@ -1,5 +1,6 @@
 """Main FastAPI application entry point."""
 
+import asyncio
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -38,12 +39,32 @@ async def startup_event():
     from src.utils.database import init_db
 
     init_db()
+
+    if settings.KNOWLEDGE_BASE_RELOAD_SECONDS > 0:
+        # Watch the store the scorers actually hold: resolve the scorer the
+        # same way services/scoring_service.py resolves algorithms.*, so a
+        # second copy of the module is never the one being reloaded
+        try:
+            from algorithms.university_match_scorer import UniversityMatchScorer
+        except ImportError:
+            from src.algorithms.university_match_scorer import UniversityMatchScorer
+
+        # Pick up knowledge base edits without a restart
+        app.state.knowledge_base_watcher = asyncio.create_task(
+            UniversityMatchScorer.knowledge_base.watch(
+                settings.KNOWLEDGE_BASE_RELOAD_SECONDS
+            )
+        )
+
     print(f"{settings.APP_NAME} v{settings.APP_VERSION} started successfully")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event."""
+    watcher = getattr(app.state, "knowledge_base_watcher", None)
+    if watcher is not None:
+        watcher.cancel()
     print(f"{settings.APP_NAME} shutting down")
 
 
@@ -0,0 +1,132 @@
+# ASR动态微批调度实现代码
+# 文件路径: ai/asr_batcher.py
+
+from typing import Dict, Any, List, Tuple, Callable, Awaitable
+import asyncio
+
+
+BatchRunner = Callable[[List[str], str, int, bool], Awaitable[List[Dict[str, Any]]]]
+
+
+class ASRMicroBatcher:
+    """
+    ASR动态微批调度器
+
+    收集短时间窗口内到达的转写请求，凑满 max_batch_size 或等待超过
+    max_wait_ms 后作为一个批次送入模型，再把结果分发回各调用方。
+    只有解码参数（语言、beam大小、VAD）相同的请求才会合并。
+    """
+
+    def __init__(
+        self,
+        run_batch: BatchRunner,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 50
+    ):
+        """
+        初始化调度器
+
+        Args:
+            run_batch: 批量转写函数 (audio_paths, language, beam_size, vad_filter) -> 结果列表
+            max_batch_size: 单批最大请求数
+            max_wait_ms: 首个请求到达后的最长等待时间（毫秒）
+        """
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._pending: Dict[Tuple[str, int, bool], List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[str, int, bool], asyncio.TimerHandle] = {}
+        self._running: set = set()
+
+        self.batches = 0
+        self.items = 0
+
+    async def submit(
+        self,
+        audio_path: str,
+        language: str = "en",
+        beam_size: int = 5,
+        vad_filter: bool = True
+    ) -> Dict[str, Any]:
+        """
+        提交单个转写请求并等待所在批次完成
+
+        Args:
+            audio_path: 本地音频文件路径
+            language: 语言
+            beam_size: beam大小
+            vad_filter: 是否使用VAD过滤
+
+        Returns:
+            转写结果
+        """
+        loop = asyncio.get_running_loop()
+        key = (language, beam_size, vad_filter)
+        future = loop.create_future()
+
+        pending = self._pending.setdefault(key, [])
+        pending.append((audio_path, future))
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(key)
+        elif len(pending) == 1:
+            self._timers[key] = loop.call_later(self.max_wait, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: Tuple[str, int, bool]):
+        """取出当前批次并启动执行"""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(key, [])
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(key, batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(
+        self,
+        key: Tuple[str, int, bool],
+        batch: List[Tuple[str, asyncio.Future]]
+    ):
+        """执行批次并分发结果"""
+        language, beam_size, vad_filter = key
+        paths = [path for path, _ in batch]
+
+        self.batches += 1
+        self.items += len(batch)
+
+        try:
+            results = await self.run_batch(paths, language, beam_size, vad_filter)
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch returned {len(results)} results for {len(batch)} inputs"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        获取批处理指标
+
+        Returns:
+            批次数、请求数、平均批大小和当前等待数
+        """
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "pending": sum(len(batch) for batch in self._pending.values())
+        }
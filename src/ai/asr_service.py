@@ -1,9 +1,15 @@
 # ASR服务实现代码（Mock版本，用于测试）
 # 文件路径: ai/asr_service.py
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, ContextManager, AsyncContextManager
 import asyncio
+import contextlib
+import numpy as np
 from unittest.mock import MagicMock, AsyncMock
+from ai.asr_worker_pool import ASRWorkerPool
+from ai.asr_batcher import ASRMicroBatcher
+from ai.streaming_asr import StreamingRecognizer
+from ai.audio_fetcher import AudioFetcher
 
 
 class ASRConfig:
@@ -12,6 +18,21 @@ class ASRConfig:
     DEFAULT_LANGUAGE = "en"
     DEFAULT_MODEL_SIZE = "base"
     DEFAULT_DEVICE = "cpu"
+    SAMPLE_RATE = 16000
+
+    # 工作进程池配置
+    WORKER_POOL = {
+        "num_workers": None,  # 默认CPU核数
+        "max_queue_size": 64,
+        "queue_timeout": 30.0
+    }
+
+    # 动态微批配置（仅在配置了工作进程池时生效）
+    MICRO_BATCH = {
+        "enabled": True,
+        "max_batch_size": 8,
+        "max_wait_ms": 50
+    }
 
     # 语言代码映射
     LANGUAGES = {
@@ -26,13 +47,13 @@ class ASRConfig:
 
     # 模型大小配置
     MODEL_SIZES = {
-        "tiny": {"parameters": 39M, "speed": "realtime"},
-        "base": {"parameters": 74M, "speed": "realtime"},
-        "small": {"parameters": 244M, "speed": "realtime"},
-        "medium": {"parameters": 769M, "speed": "realtime"},
-        "large": {"parameters": 1550M, "speed": "realtime"},
-        "large-v2": {"parameters": 3050M, "speed": "realtime"},
-        "large-v3": {"parameters": 8265M, "speed": "realtime"}
+        "tiny": {"parameters": "39M", "speed": "realtime"},
+        "base": {"parameters": "74M", "speed": "realtime"},
+        "small": {"parameters": "244M", "speed": "realtime"},
+        "medium": {"parameters": "769M", "speed": "realtime"},
+        "large": {"parameters": "1550M", "speed": "realtime"},
+        "large-v2": {"parameters": "3050M", "speed": "realtime"},
+        "large-v3": {"parameters": "8265M", "speed": "realtime"}
     }
 
     VAD_CONFIG = {
@@ -41,11 +62,23 @@ class ASRConfig:
         "min_silence_ms": 2000
     }
 
+    @classmethod
+    def get_sample_rate(cls) -> int:
+        """获取模型输入采样率"""
+        return cls.SAMPLE_RATE
+
 
 class ASRService:
     """ASR服务（Mock版本）"""
 
-    def __init__(self, model_size: str = "base", device: str = "cpu", config: Optional[ASRConfig] = None):
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: str = "cpu",
+        config: Optional[ASRConfig] = None,
+        worker_pool: Optional[ASRWorkerPool] = None,
+        audio_fetcher: Optional[AudioFetcher] = None
+    ):
         """
         初始化ASR服务
 
@@ -53,16 +86,37 @@ class ASRService:
             model_size: 模型大小
             device: 设备
             config: 配置（可选）
+            worker_pool: ASR工作进程池（可选，多个服务实例可共享）
+            audio_fetcher: 音频获取层（可选，与评分器共享下载和解码结果）
         """
         self.config = config or ASRConfig()
         self.model_size = model_size
         self.device = device
+        self.worker_pool = worker_pool
+        self.audio_fetcher = audio_fetcher
+
+        # 并发到达的请求合并为批次送入进程池
+        self.batcher = None
+        if worker_pool is not None and self.config.MICRO_BATCH["enabled"]:
+            self.batcher = ASRMicroBatcher(
+                run_batch=worker_pool.transcribe_batch,
+                max_batch_size=self.config.MICRO_BATCH["max_batch_size"],
+                max_wait_ms=self.config.MICRO_BATCH["max_wait_ms"]
+            )
 
         self.sample_rate = self.config.get_sample_rate() or 16000
 
-    def _download_audio(self, audio_url: str) -> str:
-        """下载音频文件（Mock）"""
-        return f"/tmp/temp_audio_{audio_url.split('/')[-1]}.wav"
+    def _download_audio(self, audio_url: str) -> ContextManager[str]:
+        """下载音频文件，with 块内得到本地路径（期间文件不会被spool淘汰）"""
+        if self.audio_fetcher is not None:
+            return self.audio_fetcher.open_path(audio_url)
+        return contextlib.nullcontext(f"/tmp/temp_audio_{audio_url.split('/')[-1]}.wav")
+
+    def _download_audio_async(self, audio_url: str) -> AsyncContextManager[str]:
+        """下载音频文件（不阻塞事件循环），async with 块内得到本地路径"""
+        if self.audio_fetcher is not None:
+            return self.audio_fetcher.open_path_async(audio_url)
+        return contextlib.nullcontext(f"/tmp/temp_audio_{audio_url.split('/')[-1]}.wav")
 
     def transcribe(
         self,
@@ -93,10 +147,43 @@ class ASRService:
     async def transcribe_async(
         self,
         audio_url: str,
-        language: str = "en"
-        beam_size: int = 5
+        language: str = "en",
+        beam_size: int = 5,
+        vad_filter: bool = True
     ) -> Dict[str, Any]:
-        """异步语音转写"""
+        """
+        异步语音转写
+
+        配置了工作进程池时在池中转写，等待期间不阻塞事件循环；
+        启用微批时与同一时间窗口内的其他请求合并为一个批次。
+
+        Args:
+            audio_url: 音频文件URL
+            language: 语言
+            beam_size: beam大小
+            vad_filter: 是否使用VAD过滤
+
+        Returns:
+            转写结果
+        """
+        if self.batcher is not None:
+            async with self._download_audio_async(audio_url) as audio_path:
+                return await self.batcher.submit(
+                    audio_path,
+                    language=language,
+                    beam_size=beam_size,
+                    vad_filter=vad_filter
+                )
+
+        if self.worker_pool is not None:
+            async with self._download_audio_async(audio_url) as audio_path:
+                return await self.worker_pool.transcribe(
+                    audio_path,
+                    language=language,
+                    beam_size=beam_size,
+                    vad_filter=vad_filter
+                )
+
         await asyncio.sleep(0.1)
         return {
             "text": f"Mock async transcribed text for {audio_url}",
@@ -104,12 +191,71 @@ class ASRService:
             "confidence": 0.95
         }
 
-    def transcribe_stream(self, audio_stream: Any, language: str = "en") -> Dict[str, Any]:
-        """流式语音转写"""
+    def get_pool_metrics(self) -> Optional[Dict[str, Any]]:
+        """获取工作进程池指标（未配置进程池时返回None）"""
+        if self.worker_pool is None:
+            return None
+
+        metrics = self.worker_pool.metrics()
+        if self.batcher is not None:
+            metrics["micro_batch"] = self.batcher.metrics()
+        return metrics
+
+    def create_stream(self, language: str = "en") -> StreamingRecognizer:
+        """
+        创建流式识别器
+
+        Args:
+            language: 语言
+
+        Returns:
+            按 VAD_CONFIG 切分语音段的增量识别器
+        """
+        async def decode(audio: np.ndarray) -> Dict[str, Any]:
+            return await self._decode_pcm(audio, language)
+
+        return StreamingRecognizer(
+            decode=decode,
+            sample_rate=self.sample_rate,
+            vad_config=self.config.VAD_CONFIG,
+            language=language
+        )
+
+    async def transcribe_stream(
+        self,
+        audio_stream: AsyncIterator[bytes],
+        language: str = "en"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        流式语音转写
+
+        Args:
+            audio_stream: 16-bit 单声道PCM音频块的异步迭代器
+            language: 语言
+
+        Yields:
+            partial/final 识别事件，说话过程中即开始输出
+        """
+        recognizer = self.create_stream(language)
+        async for chunk in audio_stream:
+            for event in await recognizer.accept_chunk(chunk):
+                yield event
+
+        for event in await recognizer.finish():
+            yield event
+
+    async def _decode_pcm(self, audio: np.ndarray, language: str) -> Dict[str, Any]:
+        """解码一段 float32 波形（VAD已在流式识别器中完成）"""
+        if self.worker_pool is not None:
+            return await self.worker_pool.transcribe(
+                audio,
+                language=language,
+                vad_filter=False
+            )
+
         return {
             "text": "Mock streaming transcription",
             "language": language
-            "is_final": False
         }
 
     def batch_transcribe(
@@ -118,7 +264,28 @@ class ASRService:
         language: str = "en",
         vad_filter: bool = False
     ) -> List[Dict[str, Any]]:
-        """批量语音转写"""
+        """
+        批量语音转写
+
+        配置了工作进程池时按 max_batch_size 分批送入进程池。
+        """
+        if self.worker_pool is not None:
+            batch_size = self.config.MICRO_BATCH["max_batch_size"]
+            results = []
+            for i in range(0, len(audio_urls), batch_size):
+                # 本批音频在转写完成前保持固定在spool中
+                with contextlib.ExitStack() as stack:
+                    audio_paths = [
+                        stack.enter_context(self._download_audio(url))
+                        for url in audio_urls[i:i + batch_size]
+                    ]
+                    results.extend(self.worker_pool.transcribe_batch_sync(
+                        audio_paths,
+                        language=language,
+                        vad_filter=vad_filter
+                    ))
+            return results
+
         results = []
         for url in audio_urls:
             results.append({
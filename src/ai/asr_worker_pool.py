@@ -0,0 +1,491 @@
+# ASR工作进程池实现代码
+# 文件路径: ai/asr_worker_pool.py
+
+from typing import Dict, Any, Optional, Callable, List
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+from functools import partial
+import asyncio
+import math
+import os
+import threading
+import time
+
+
+# 工作进程内的模型实例（由 _init_worker 在进程启动时加载）
+_worker_model = None
+
+
+class ASRPoolBusyError(RuntimeError):
+    """ASR任务队列已满"""
+
+
+class _QueueSlots:
+    """
+    进程池的队列位置（同步与异步调用方共用，按到达顺序分配）
+
+    释放的位置直接交给最早的等待者；异步等待者在各自的事件循环中被唤醒，
+    因此不绑定某一个事件循环。
+    """
+
+    def __init__(self, size: int):
+        self._free = size
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    def _try_acquire_locked(self) -> bool:
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            return True
+        return False
+
+    def _withdraw(self, waiter: list) -> bool:
+        """放弃等待；返回等待者是否已经被分配了位置"""
+        with self._lock:
+            if waiter[0]:
+                return True
+            self._waiters.remove(waiter)
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        获取一个位置（阻塞当前线程）
+
+        Returns:
+            是否在超时前获得位置
+        """
+        event = threading.Event()
+        waiter = [False, event.set]
+        with self._lock:
+            if self._try_acquire_locked():
+                return True
+            self._waiters.append(waiter)
+
+        return event.wait(timeout) or self._withdraw(waiter)
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        获取一个位置（等待期间不阻塞事件循环）
+
+        Returns:
+            是否在超时前获得位置
+        """
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+
+        def wake():
+            loop.call_soon_threadsafe(
+                lambda: granted.done() or granted.set_result(None)
+            )
+
+        waiter = [False, wake]
+        with self._lock:
+            if self._try_acquire_locked():
+                return True
+            self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(granted), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return self._withdraw(waiter)
+        except asyncio.CancelledError:
+            if self._withdraw(waiter):
+                self.release()
+            raise
+
+    def release(self):
+        """释放一个位置（有等待者时直接交给最早的等待者）"""
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._free += 1
+                    return
+                waiter = self._waiters.popleft()
+                waiter[0] = True
+            try:
+                waiter[1]()
+                return
+            except RuntimeError:
+                # 等待者的事件循环已关闭，位置交给下一个
+                continue
+
+
+def load_whisper_model(model_size: str, device: str):
+    """
+    加载 faster-whisper 模型
+
+    Args:
+        model_size: 模型大小
+        device: 设备
+
+    Returns:
+        WhisperModel 实例
+    """
+    from faster_whisper import WhisperModel
+
+    compute_type = "float16" if device == "cuda" else "int8"
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+def _init_worker(model_factory: Callable, model_size: str, device: str):
+    """工作进程初始化：预加载模型，之后的任务直接复用"""
+    global _worker_model
+    _worker_model = model_factory(model_size, device)
+
+
+def _warmup_job() -> int:
+    """预热任务：确认模型已加载"""
+    if _worker_model is None:
+        raise RuntimeError("ASR model not loaded in worker")
+    return os.getpid()
+
+
+def _format_result(segments, info) -> Dict[str, Any]:
+    """将模型输出整理为转写结果"""
+    texts = []
+    logprobs = []
+    for segment in segments:
+        texts.append(segment.text.strip())
+        logprobs.append(segment.avg_logprob)
+
+    confidence = math.exp(sum(logprobs) / len(logprobs)) if logprobs else 0.0
+
+    return {
+        "text": " ".join(t for t in texts if t),
+        "language": info.language,
+        "confidence": round(confidence, 4),
+        "duration": info.duration
+    }
+
+
+def _transcribe_job(
+    audio_path: str,
+    language: str,
+    beam_size: int,
+    vad_filter: bool
+) -> Dict[str, Any]:
+    """
+    在工作进程中执行转写
+
+    Returns:
+        转写结果
+    """
+    segments, info = _worker_model.transcribe(
+        audio_path,
+        language=language,
+        beam_size=beam_size,
+        vad_filter=vad_filter
+    )
+    return _format_result(segments, info)
+
+
+def _transcribe_batch_job(
+    audio_paths: List[str],
+    language: str,
+    beam_size: int,
+    vad_filter: bool
+) -> List[Dict[str, Any]]:
+    """
+    在工作进程中批量转写
+
+    模型提供 transcribe_batch 时整批一次推理，否则在同一进程内依次转写。
+
+    Returns:
+        与输入顺序一致的转写结果
+    """
+    transcribe_batch = getattr(_worker_model, "transcribe_batch", None)
+    if transcribe_batch is not None:
+        outputs = transcribe_batch(
+            audio_paths,
+            language=language,
+            beam_size=beam_size,
+            vad_filter=vad_filter
+        )
+    else:
+        outputs = [
+            _worker_model.transcribe(
+                path,
+                language=language,
+                beam_size=beam_size,
+                vad_filter=vad_filter
+            )
+            for path in audio_paths
+        ]
+
+    return [_format_result(segments, info) for segments, info in outputs]
+
+
+class ASRWorkerPool:
+    """
+    ASR工作进程池
+
+    N 个工作进程各自在启动时加载一次模型，转写任务在进程中执行，
+    不阻塞事件循环。同时等待和执行的任务数受 max_queue_size 限制，
+    同步与异步接口共用同一队列上限、等待超时和运行指标。
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        model_size: str = "base",
+        device: str = "cpu",
+        max_queue_size: int = 64,
+        queue_timeout: float = 30.0,
+        model_factory: Callable = load_whisper_model
+    ):
+        """
+        初始化进程池
+
+        Args:
+            num_workers: 工作进程数，默认CPU核数
+            model_size: 模型大小
+            device: 设备
+            max_queue_size: 同时提交到进程池的最大任务数
+            queue_timeout: 队列已满时的最长等待时间（秒）
+            model_factory: 模型加载函数 (model_size, device) -> model，须可被pickle
+        """
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.model_size = model_size
+        self.device = device
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.model_factory = model_factory
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = _QueueSlots(max_queue_size)
+        # 指标可能在多个线程（同步调用方）中更新
+        self._metrics_lock = threading.Lock()
+
+        self.waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.restarts = 0
+        self._total_latency = 0.0
+
+    def start(self, warm: bool = True):
+        """
+        启动进程池
+
+        Args:
+            warm: 是否等待所有工作进程完成模型加载
+        """
+        if self._executor is not None:
+            return
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=_init_worker,
+            initargs=(self.model_factory, self.model_size, self.device)
+        )
+
+        if warm:
+            futures = [
+                self._executor.submit(_warmup_job) for _ in range(self.num_workers)
+            ]
+            for future in futures:
+                future.result()
+
+    def shutdown(self, wait: bool = True):
+        """关闭进程池"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def _restart(self):
+        """工作进程异常退出后重建进程池"""
+        self.shutdown(wait=False)
+        self.restarts += 1
+        self.start(warm=False)
+
+    async def transcribe(
+        self,
+        audio_path: Any,
+        language: str = "en",
+        beam_size: int = 5,
+        vad_filter: bool = True
+    ) -> Dict[str, Any]:
+        """
+        提交转写任务并等待结果
+
+        Args:
+            audio_path: 本地音频文件路径，或 16kHz float32 波形数组
+            language: 语言
+            beam_size: beam大小
+            vad_filter: 是否使用VAD过滤
+
+        Returns:
+            转写结果
+
+        Raises:
+            ASRPoolBusyError: 队列已满且等待超时
+        """
+        job = partial(_transcribe_job, audio_path, language, beam_size, vad_filter)
+        return await self._run_job(job)
+
+    async def transcribe_batch(
+        self,
+        audio_paths: List[str],
+        language: str = "en",
+        beam_size: int = 5,
+        vad_filter: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        提交批量转写任务（整批占用一个队列位置，在同一工作进程中执行）
+
+        Args:
+            audio_paths: 本地音频文件路径列表
+            language: 语言
+            beam_size: beam大小
+            vad_filter: 是否使用VAD过滤
+
+        Returns:
+            与输入顺序一致的转写结果
+        """
+        job = partial(_transcribe_batch_job, audio_paths, language, beam_size, vad_filter)
+        return await self._run_job(job)
+
+    def transcribe_batch_sync(
+        self,
+        audio_paths: List[str],
+        language: str = "en",
+        beam_size: int = 5,
+        vad_filter: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        批量转写（同步接口，供非异步调用方使用）
+
+        与异步接口共用队列上限、等待超时和运行指标。
+
+        Raises:
+            ASRPoolBusyError: 队列已满且等待超时
+        """
+        job = partial(_transcribe_batch_job, audio_paths, language, beam_size, vad_filter)
+        return self._run_job_sync(job)
+
+    def _count(self, name: str, delta: int):
+        """更新计数指标"""
+        with self._metrics_lock:
+            setattr(self, name, getattr(self, name) + delta)
+
+    def _reject(self) -> ASRPoolBusyError:
+        """记录一次拒绝，返回要抛出的异常"""
+        self._count("rejected", 1)
+        return ASRPoolBusyError(
+            f"ASR queue full ({self.max_queue_size} jobs in flight)"
+        )
+
+    def _finish(self, started: float):
+        """记录一次成功完成"""
+        with self._metrics_lock:
+            self.completed += 1
+            self._total_latency += time.perf_counter() - started
+
+    async def _run_job(self, job: Callable) -> Any:
+        """
+        在进程池中执行任务（受队列上限约束）
+
+        Raises:
+            ASRPoolBusyError: 队列已满且等待超时
+        """
+        if self._executor is None:
+            self.start(warm=False)
+
+        self._count("waiting", 1)
+        try:
+            admitted = await self._slots.acquire_async(timeout=self.queue_timeout)
+        finally:
+            self._count("waiting", -1)
+        if not admitted:
+            raise self._reject()
+
+        self._count("in_flight", 1)
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._executor
+            try:
+                result = await loop.run_in_executor(executor, job)
+            except BrokenProcessPool:
+                # 并发任务同时失败时只重建一次
+                if self._executor is executor:
+                    self._restart()
+                result = await loop.run_in_executor(self._executor, job)
+        except Exception:
+            self._count("failed", 1)
+            raise
+        finally:
+            self._count("in_flight", -1)
+            self._slots.release()
+
+        self._finish(started)
+        return result
+
+    def _run_job_sync(self, job: Callable) -> Any:
+        """
+        在进程池中执行任务并阻塞等待结果（与 _run_job 共用队列上限和指标）
+
+        Raises:
+            ASRPoolBusyError: 队列已满且等待超时
+        """
+        if self._executor is None:
+            self.start(warm=False)
+
+        self._count("waiting", 1)
+        try:
+            admitted = self._slots.acquire(timeout=self.queue_timeout)
+        finally:
+            self._count("waiting", -1)
+        if not admitted:
+            raise self._reject()
+
+        self._count("in_flight", 1)
+        started = time.perf_counter()
+        try:
+            executor = self._executor
+            try:
+                result = executor.submit(job).result()
+            except BrokenProcessPool:
+                if self._executor is executor:
+                    self._restart()
+                result = self._executor.submit(job).result()
+        except Exception:
+            self._count("failed", 1)
+            raise
+        finally:
+            self._count("in_flight", -1)
+            self._slots.release()
+
+        self._finish(started)
+        return result
+
+    def is_healthy(self) -> bool:
+        """进程池是否可用"""
+        return self._executor is not None and not getattr(
+            self._executor, "_broken", False
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        获取运行指标
+
+        Returns:
+            健康状态、队列深度、吞吐和平均耗时
+        """
+        return {
+            "healthy": self.is_healthy(),
+            "workers": self.num_workers,
+            "queue_depth": self.waiting + max(0, self.in_flight - self.num_workers),
+            "in_flight": self.in_flight,
+            "max_queue_size": self.max_queue_size,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "restarts": self.restarts,
+            "avg_latency_ms": round(
+                self._total_latency / self.completed * 1000, 2
+            ) if self.completed else 0.0
+        }
@@ -0,0 +1,690 @@
+# 音频获取层实现代码
+# 文件路径: ai/audio_fetcher.py
+
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, Callable, Tuple, TYPE_CHECKING
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from urllib.parse import urlsplit, urlunsplit
+import asyncio
+import hashlib
+import io
+import os
+import posixpath
+import subprocess
+import tempfile
+import threading
+import time
+import wave
+import numpy as np
+
+if TYPE_CHECKING:
+    from ai.tts_cache import FileAudioStore
+
+
+# 内容版本缓存的URL条数上限
+MAX_CACHED_VERSIONS = 4096
+
+
+def decode_audio(data: bytes, sample_rate: int = 16000) -> np.ndarray:
+    """
+    将音频文件解码为单声道 float32 波形（-1~1）
+
+    WAV 直接用标准库解析，其他格式（mp3/webm等）交给 ffmpeg。
+
+    Args:
+        data: 音频文件内容
+        sample_rate: 目标采样率
+
+    Returns:
+        波形数组
+    """
+    if data[:4] == b"RIFF":
+        return _decode_wav(data, sample_rate)
+
+    process = subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-f", "s16le", "-ac", "1", "-ar", str(sample_rate),
+            "pipe:1"
+        ],
+        input=data,
+        capture_output=True,
+        check=True
+    )
+    return np.frombuffer(process.stdout, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def _decode_wav(data: bytes, sample_rate: int) -> np.ndarray:
+    """解析 PCM WAV，混合为单声道并重采样"""
+    with wave.open(io.BytesIO(data)) as wav:
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        rate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+
+    if width == 1:
+        audio = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128.0
+    elif width == 2:
+        audio = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 4:
+        audio = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width}")
+
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+
+    if rate != sample_rate and len(audio) > 0:
+        target_length = int(round(len(audio) * sample_rate / rate))
+        positions = np.linspace(0, len(audio) - 1, target_length)
+        audio = np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+
+    return audio
+
+
+class AudioBuffer:
+    """
+    解码后的单声道 float32 波形
+
+    底层为只读 numpy 数组（可以是从 spool 文件映射的 np.memmap），
+    在 ASR、发音评分、流利度评分之间传递时不复制数据。
+    """
+
+    __slots__ = ("samples", "sample_rate", "path")
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        sample_rate: int = 16000,
+        path: Optional[str] = None
+    ):
+        """
+        初始化缓冲区
+
+        Args:
+            samples: 波形数组（float32 时不复制）
+            sample_rate: 采样率
+            path: 映射的spool文件路径（内存数组为None）
+        """
+        samples = np.asarray(samples)
+        if samples.dtype != np.float32 or samples.ndim != 1:
+            samples = np.ascontiguousarray(samples, dtype=np.float32).reshape(-1)
+        if samples.flags.writeable:
+            samples = samples.view()
+            samples.flags.writeable = False
+
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.path = path
+
+    @classmethod
+    def from_pcm16(cls, data: bytes, sample_rate: int = 16000) -> "AudioBuffer":
+        """从 16-bit little-endian PCM 构建"""
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+        return cls(samples, sample_rate)
+
+    @classmethod
+    def open(cls, path: str, sample_rate: int = 16000) -> "AudioBuffer":
+        """
+        以只读内存映射方式打开 raw float32 文件
+
+        Args:
+            path: 由 save() 写出的文件
+            sample_rate: 采样率
+
+        Returns:
+            缓冲区（数据按需从页缓存读取）
+        """
+        if os.path.getsize(path) == 0:
+            return cls(np.zeros(0, dtype=np.float32), sample_rate, path)
+        return cls(np.memmap(path, dtype="<f4", mode="r"), sample_rate, path)
+
+    def tobytes(self) -> bytes:
+        """raw float32 (little-endian) 内容，可由 open() 映射回来"""
+        return self.samples.astype("<f4", copy=False).tobytes()
+
+    @property
+    def duration(self) -> float:
+        """时长（秒）"""
+        return len(self.samples) / self.sample_rate
+
+    def slice(self, start: float, end: Optional[float] = None) -> "AudioBuffer":
+        """
+        截取时间区间（视图，不复制）
+
+        Args:
+            start: 起始时间（秒）
+            end: 结束时间（秒），None表示到结尾
+
+        Returns:
+            新的缓冲区
+        """
+        begin = int(start * self.sample_rate)
+        stop = None if end is None else int(end * self.sample_rate)
+        return AudioBuffer(self.samples[begin:stop], self.sample_rate, self.path)
+
+    def frames(self, frame_length: int, hop_length: Optional[int] = None) -> np.ndarray:
+        """
+        分帧（基于步长的视图，不复制）
+
+        Args:
+            frame_length: 帧长（采样点）
+            hop_length: 帧移（采样点），默认等于帧长
+
+        Returns:
+            形状为 (帧数, 帧长) 的只读数组，不足一帧的尾部丢弃
+        """
+        hop_length = hop_length or frame_length
+        if len(self.samples) < frame_length:
+            return np.zeros((0, frame_length), dtype=np.float32)
+
+        windows = np.lib.stride_tricks.sliding_window_view(self.samples, frame_length)
+        return windows[::hop_length]
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+
+class AudioSourceError(ValueError):
+    """音频URL不在允许的来源内"""
+
+
+class HTTPAudioClient:
+    """
+    音频下载客户端
+
+    复用同一个连接池下载 minio:// 与允许来源内的 http(s) 音频。
+    音频URL来自客户端消息，只接受对象存储地址和 allowed_url_prefixes 中的前缀，
+    其他URL一律拒绝；本地路径只在显式开启 allow_local_files 时读取（测试用）。
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        max_connections: int = 32,
+        timeout: float = 10.0,
+        allowed_url_prefixes: Optional[List[str]] = None,
+        allow_local_files: bool = False
+    ):
+        """
+        初始化客户端
+
+        Args:
+            endpoint: 对象存储地址（minio://bucket/key 解析为 {endpoint}/bucket/key）
+            max_connections: 连接池大小
+            timeout: 请求超时（秒）
+            allowed_url_prefixes: 除对象存储外允许下载的 http(s) URL 前缀，
+                默认取 settings.AUDIO_ALLOWED_URL_PREFIXES
+            allow_local_files: 是否允许读取本地路径 / file:// URL
+        """
+        if endpoint is None or allowed_url_prefixes is None:
+            from utils.config import settings
+            if endpoint is None:
+                endpoint = settings.MINIO_ENDPOINT
+            if allowed_url_prefixes is None:
+                allowed_url_prefixes = settings.AUDIO_ALLOWED_URL_PREFIXES
+
+        self.endpoint = endpoint.rstrip("/")
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.allow_local_files = allow_local_files
+        self._allowed = [
+            self._split_prefix(prefix)
+            for prefix in [self.endpoint + "/", *allowed_url_prefixes]
+        ]
+
+        self._client = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _split_prefix(url: str) -> Tuple[str, str, str]:
+        """URL前缀拆分为 (scheme, host[:port], 路径前缀)"""
+        parts = urlsplit(url)
+        return parts.scheme.lower(), parts.netloc.lower(), parts.path or "/"
+
+    def _local_path(self, audio_url: str) -> Optional[str]:
+        """本地路径 / file:// URL 对应的文件路径（不是本地路径时返回None）"""
+        if audio_url.startswith("file://"):
+            path = audio_url[len("file://"):]
+        elif os.path.isabs(audio_url):
+            path = audio_url
+        else:
+            return None
+
+        if not self.allow_local_files:
+            raise AudioSourceError("Local audio paths are not allowed")
+        return path
+
+    def resolve(self, audio_url: str) -> str:
+        """
+        将音频URL解析为实际下载地址
+
+        Raises:
+            AudioSourceError: 解析后的地址不在对象存储或允许的前缀内
+        """
+        url = audio_url
+        if audio_url.startswith("minio://"):
+            url = f"{self.endpoint}/{audio_url[len('minio://'):]}"
+
+        parts = urlsplit(url)
+        if parts.scheme in ("http", "https") and not parts.username and not parts.password:
+            scheme, netloc = parts.scheme.lower(), parts.netloc.lower()
+            path = posixpath.normpath(parts.path or "/")
+            for allowed_scheme, allowed_netloc, allowed_path in self._allowed:
+                if (
+                    scheme == allowed_scheme
+                    and netloc == allowed_netloc
+                    and (path + "/").startswith(allowed_path)
+                ):
+                    # 使用规范化后的路径，"../" 不能跳出允许的前缀
+                    return urlunsplit(parts._replace(path=path))
+
+        raise AudioSourceError(f"Audio URL is not from an allowed source: {audio_url}")
+
+    def _get_client(self):
+        """按需创建连接池（线程安全）"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import httpx
+
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_connections
+                        )
+                    )
+        return self._client
+
+    def get(self, audio_url: str) -> bytes:
+        """
+        下载音频
+
+        Args:
+            audio_url: 音频URL（或开启 allow_local_files 时的本地路径）
+
+        Returns:
+            音频文件内容
+
+        Raises:
+            AudioSourceError: URL不在允许的来源内
+        """
+        path = self._local_path(audio_url)
+        if path is not None:
+            with open(path, "rb") as f:
+                return f.read()
+
+        response = self._get_client().get(self.resolve(audio_url))
+        response.raise_for_status()
+        return response.content
+
+    def version(self, audio_url: str) -> Optional[str]:
+        """
+        获取音频内容版本，用于判断同一URL下的内容是否变化
+
+        本地文件使用修改时间和大小；远程文件发送 HEAD 请求，
+        使用 ETag（没有时用 Last-Modified 和 Content-Length）。
+
+        Args:
+            audio_url: 音频URL（或开启 allow_local_files 时的本地路径）
+
+        Returns:
+            版本字符串，无法获取（文件不存在、网络错误、无版本头）时返回None
+
+        Raises:
+            AudioSourceError: URL不在允许的来源内
+        """
+        path = self._local_path(audio_url)
+        if path is not None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+        import httpx
+
+        url = self.resolve(audio_url)
+        try:
+            response = self._get_client().head(url)
+        except httpx.HTTPError:
+            return None
+        if response.status_code >= 400:
+            return None
+        headers = response.headers
+        if "etag" in headers:
+            return headers["etag"]
+        if "last-modified" in headers:
+            return f"{headers['last-modified']}:{headers.get('content-length', '')}"
+        return None
+
+    def close(self):
+        """关闭连接池"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class AudioFetcher:
+    """
+    音频获取层
+
+    同一回答音频会被 ASR、发音评分和流利度评分同时使用：
+    - 原始文件只下载一次，落盘到本地 spool（按容量LRU淘汰，重试时直接复用）；
+      spool键包含客户端报告的内容版本（ETag/修改时间），同一URL内容变化时重新下载；
+      版本按URL缓存 version_ttl 秒，同一轮次内的多个调用方只查询一次
+    - open_path 在使用期间固定spool条目，文件不会被其他下载淘汰删除
+    - 解码后的PCM按URL缓存，各调用方共享同一个只读 AudioBuffer
+    - 配置 pcm_spool 时解码结果写成 raw float32 文件并以 mmap 方式映射，
+      释放后重试无需重新解码
+    - 并发请求同一URL时只有一个调用方真正下载/解码，其余等待结果
+    """
+
+    def __init__(
+        self,
+        client: Optional[HTTPAudioClient] = None,
+        spool: Optional["FileAudioStore"] = None,
+        pcm_spool: Optional["FileAudioStore"] = None,
+        sample_rate: int = 16000,
+        max_decoded_items: int = 32,
+        decoder: Callable[[bytes, int], np.ndarray] = decode_audio,
+        version_ttl: float = 30.0
+    ):
+        """
+        初始化获取层
+
+        Args:
+            client: 下载客户端
+            spool: 本地磁盘缓存，默认使用系统临时目录（上限1GB）
+            pcm_spool: 解码结果的磁盘缓存（可选，启用后以 mmap 方式共享PCM）
+            sample_rate: 解码采样率
+            max_decoded_items: 内存中保留的已解码音频条数
+            decoder: 解码函数 (data, sample_rate) -> 波形
+            version_ttl: 内容版本的缓存时间（秒）
+        """
+        if spool is None:
+            from ai.tts_cache import FileAudioStore
+
+            spool = FileAudioStore(
+                os.path.join(tempfile.gettempdir(), "empenglish-audio-spool"),
+                max_bytes=1024 ** 3,
+                url_prefix="file://spool",
+                suffix=".audio"
+            )
+
+        self.client = client or HTTPAudioClient()
+        self.spool = spool
+        self.pcm_spool = pcm_spool
+        self.sample_rate = sample_rate
+        self.max_decoded_items = max_decoded_items
+        self.decoder = decoder
+        self.version_ttl = version_ttl
+
+        self._lock = threading.Lock()
+        self._decoded: "OrderedDict[str, AudioBuffer]" = OrderedDict()
+        # URL -> (查询时间, 内容版本)
+        self._versions: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+        self._inflight: Dict[Any, Future] = {}
+
+        self.downloads = 0
+        self.spool_hits = 0
+        self.decodes = 0
+        self.decoded_hits = 0
+
+    @staticmethod
+    def spool_key(audio_url: str, version: Optional[str] = None) -> str:
+        """
+        音频URL对应的spool键
+
+        Args:
+            audio_url: 音频URL
+            version: 内容版本（ETag等），None表示只按URL区分
+        """
+        payload = audio_url if version is None else f"{audio_url}\x1f{version}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def content_version(self, audio_url: str) -> Optional[str]:
+        """
+        音频内容版本（ETag/修改时间等，不下载内容）
+
+        结果按URL缓存 version_ttl 秒：同一轮次中ASR、评分器和评分缓存
+        取同一URL时只发送一次 HEAD 请求。
+
+        Returns:
+            版本字符串，客户端不支持或无法获取时返回None
+        """
+        version_of = getattr(self.client, "version", None)
+        if version_of is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._versions.get(audio_url)
+            if cached is not None and now - cached[0] < self.version_ttl:
+                return cached[1]
+
+        version = self._single_flight(("version", audio_url), partial(version_of, audio_url))
+        with self._lock:
+            self._versions[audio_url] = (now, version)
+            self._versions.move_to_end(audio_url)
+            while len(self._versions) > MAX_CACHED_VERSIONS:
+                self._versions.popitem(last=False)
+        return version
+
+    def _content_key(self, audio_url: str) -> str:
+        """按URL和内容版本计算spool键（无版本时只按URL）"""
+        return self.spool_key(audio_url, self.content_version(audio_url))
+
+    def _single_flight(self, key: Any, func: Callable[[], Any]) -> Any:
+        """同一key并发调用时只执行一次 func，其余调用方共享结果"""
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _fetch_pinned(self, audio_url: str, key: Optional[str] = None) -> str:
+        """
+        确保音频在spool中并固定该条目（未缓存时下载）
+
+        Args:
+            audio_url: 音频URL
+            key: 已计算的spool键（None时按内容版本计算）
+
+        Returns:
+            spool键，调用方使用完毕后需 self.spool.unpin(key)
+        """
+        if key is None:
+            key = self._content_key(audio_url)
+        # 先固定再检查，下载写入后到调用方打开文件之间不会被淘汰
+        self.spool.pin(key)
+        try:
+            if self.spool.get(key) is not None:
+                with self._lock:
+                    self.spool_hits += 1
+                return key
+
+            def download() -> None:
+                if self.spool.get(key) is None:
+                    data = self.client.get(audio_url)
+                    self.spool.put(key, data)
+                    with self._lock:
+                        self.downloads += 1
+
+            self._single_flight(("fetch", key), download)
+            return key
+        except BaseException:
+            self.spool.unpin(key)
+            raise
+
+    @contextmanager
+    def open_path(self, audio_url: str) -> Iterator[str]:
+        """
+        获取音频的本地文件路径（未缓存时下载到spool）
+
+        with 块内spool条目被固定，文件不会被其他下载淘汰删除；
+        退出后路径不再保证有效。
+
+        Args:
+            audio_url: 音频URL
+
+        Yields:
+            本地文件路径
+        """
+        key = self._fetch_pinned(audio_url)
+        try:
+            yield self.spool.path_for(key)
+        finally:
+            self.spool.unpin(key)
+
+    @asynccontextmanager
+    async def open_path_async(self, audio_url: str) -> AsyncIterator[str]:
+        """获取音频本地路径（在线程中执行下载，async with 块内固定spool条目）"""
+        fetch = asyncio.ensure_future(asyncio.to_thread(self._fetch_pinned, audio_url))
+        try:
+            key = await asyncio.shield(fetch)
+        except asyncio.CancelledError:
+            # 下载线程仍会完成并固定条目，完成后解除
+            fetch.add_done_callback(self._unpin_fetched)
+            raise
+
+        try:
+            yield self.spool.path_for(key)
+        finally:
+            self.spool.unpin(key)
+
+    def _unpin_fetched(self, fetch: "asyncio.Future"):
+        """解除已取消等待的下载所固定的条目"""
+        if not fetch.cancelled() and fetch.exception() is None:
+            self.spool.unpin(fetch.result())
+
+    def fetch_bytes(self, audio_url: str) -> bytes:
+        """
+        获取音频文件内容
+
+        Args:
+            audio_url: 音频URL
+
+        Returns:
+            音频文件内容
+        """
+        return self._read_pinned(audio_url, self._content_key(audio_url))
+
+    def _read_pinned(self, audio_url: str, key: str) -> bytes:
+        """按spool键读取音频内容（读取期间固定条目）"""
+        self._fetch_pinned(audio_url, key)
+        try:
+            with open(self.spool.path_for(key), "rb") as f:
+                return f.read()
+        finally:
+            self.spool.unpin(key)
+
+    def load(self, audio_url: str) -> AudioBuffer:
+        """
+        获取解码后的波形
+
+        Args:
+            audio_url: 音频URL
+
+        Returns:
+            只读波形缓冲区（采样率为 self.sample_rate），调用方之间共享
+        """
+        with self._lock:
+            audio = self._decoded.get(audio_url)
+            if audio is not None:
+                self._decoded.move_to_end(audio_url)
+                self.decoded_hits += 1
+                return audio
+
+        def decode() -> AudioBuffer:
+            with self._lock:
+                cached = self._decoded.get(audio_url)
+            if cached is not None:
+                return cached
+
+            # 原始文件和解码结果共用按内容版本计算的键，内容变化时重新解码
+            key = self._content_key(audio_url)
+            audio = self._load_pcm_spool(key)
+            if audio is None:
+                audio = AudioBuffer(
+                    self.decoder(self._read_pinned(audio_url, key), self.sample_rate),
+                    self.sample_rate
+                )
+                with self._lock:
+                    self.decodes += 1
+                if self.pcm_spool is not None:
+                    self.pcm_spool.put(key, audio.tobytes())
+                    audio = AudioBuffer.open(self.pcm_spool.path_for(key), self.sample_rate)
+
+            with self._lock:
+                self._decoded[audio_url] = audio
+                while len(self._decoded) > self.max_decoded_items:
+                    self._decoded.popitem(last=False)
+            return audio
+
+        return self._single_flight(("decode", audio_url), decode)
+
+    def _load_pcm_spool(self, key: str) -> Optional[AudioBuffer]:
+        """从解码结果spool映射PCM（未命中返回None）"""
+        if self.pcm_spool is None:
+            return None
+
+        if self.pcm_spool.get(key) is None:
+            return None
+
+        try:
+            return AudioBuffer.open(self.pcm_spool.path_for(key), self.sample_rate)
+        except FileNotFoundError:
+            return None
+
+    async def load_async(self, audio_url: str) -> AudioBuffer:
+        """获取解码后的波形（在线程中执行下载和解码）"""
+        return await asyncio.to_thread(self.load, audio_url)
+
+    def release(self, audio_url: str):
+        """
+        释放本轮次的解码缓存（spool中的原始文件保留，供重试使用）
+
+        Args:
+            audio_url: 音频URL
+        """
+        with self._lock:
+            self._decoded.pop(audio_url, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取统计信息
+
+        Returns:
+            下载、spool命中、解码和解码缓存命中次数
+        """
+        with self._lock:
+            return {
+                "downloads": self.downloads,
+                "spool_hits": self.spool_hits,
+                "decodes": self.decodes,
+                "decoded_hits": self.decoded_hits,
+                "decoded_items": len(self._decoded),
+                "spool_items": len(self.spool),
+                "spool_bytes": self.spool.total_bytes
+            }
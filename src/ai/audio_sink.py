@@ -0,0 +1,131 @@
+# 音频流接收端实现代码
+# 文件路径: ai/audio_sink.py
+
+from typing import Optional
+import asyncio
+
+
+class AudioSink:
+    """音频块接收端（TTS合成时按块写入）"""
+
+    async def write(self, chunk: bytes):
+        """
+        写入一个音频块
+
+        Args:
+            chunk: 音频数据
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """合成结束"""
+        pass
+
+
+class BufferSink(AudioSink):
+    """
+    内存缓冲接收端
+
+    使用 bytearray 追加（均摊 O(1)），避免 bytes 反复拼接带来的二次方拷贝。
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    async def write(self, chunk: bytes):
+        self.buffer += chunk
+
+    def getvalue(self) -> memoryview:
+        """
+        获取完整音频（不拷贝）
+
+        Returns:
+            缓冲区的只读视图
+        """
+        return memoryview(self.buffer).toreadonly()
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+
+class WebSocketAudioSink(AudioSink):
+    """
+    WebSocket转发接收端
+
+    音频块到达即以二进制帧推送给客户端，前后分别发送
+    {type}_start / {type}_end 控制帧。
+    """
+
+    def __init__(
+        self,
+        websocket,
+        turn_id: str,
+        frame_type: str = "feedback_audio",
+        send_lock: Optional[asyncio.Lock] = None
+    ):
+        """
+        初始化接收端
+
+        Args:
+            websocket: WebSocket连接
+            turn_id: 轮次ID
+            frame_type: 控制帧类型前缀
+            send_lock: 与其他帧共享的发送锁，保证帧不交错
+        """
+        self.websocket = websocket
+        self.turn_id = turn_id
+        self.frame_type = frame_type
+        self.send_lock = send_lock or asyncio.Lock()
+        self.started = False
+        self.bytes_sent = 0
+
+    async def write(self, chunk: bytes):
+        async with self.send_lock:
+            if not self.started:
+                self.started = True
+                await self.websocket.send_json({
+                    "type": f"{self.frame_type}_start",
+                    "turn_id": self.turn_id
+                })
+            await self.websocket.send_bytes(bytes(chunk))
+        self.bytes_sent += len(chunk)
+
+    async def close(self):
+        if not self.started:
+            return
+        async with self.send_lock:
+            await self.websocket.send_json({
+                "type": f"{self.frame_type}_end",
+                "turn_id": self.turn_id,
+                "bytes": self.bytes_sent
+            })
+
+
+class TeeSink(AudioSink):
+    """将音频块同时写入多个接收端"""
+
+    def __init__(self, *sinks: AudioSink):
+        self.sinks = sinks
+
+    async def write(self, chunk: bytes):
+        for sink in self.sinks:
+            await sink.write(chunk)
+
+    async def close(self):
+        for sink in self.sinks:
+            await sink.close()
+
+
+class SegmentSink(AudioSink):
+    """
+    分段写入接收端
+
+    多段音频（如逐句合成）依次写入同一个接收端：转发音频块但忽略
+    每段结束时的 close，由调用方在全部结束后关闭底层接收端。
+    """
+
+    def __init__(self, sink: AudioSink):
+        self.sink = sink
+
+    async def write(self, chunk: bytes):
+        await self.sink.write(chunk)
@@ -0,0 +1,154 @@
+# LLM输出解析实现代码
+# 文件路径: ai/llm_output.py
+
+from typing import Any, Dict, List, Optional
+import json
+import re
+
+
+# 模型输出中的JSON（可能包在 ```json 代码块或说明文字中）
+JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+JSON_BLOCK = re.compile(r"\{.*\}|\[.*\]", re.DOTALL)
+
+# 追问行首的列表标记，如 "1." "(2)" "-" "•" "Q1:" "Follow-up question 2:"
+LIST_MARKER = re.compile(
+    r"^(?:[-*•]+|\(?\d+[.):]"
+    r"|(?:q|question|follow[- ]?up(?: question)?)\s*\d*\s*[:.)])\s*",
+    re.IGNORECASE
+)
+
+# 同一行中多个问句的分隔位置
+QUESTION_BREAK = re.compile(r"(?<=\?)\s+")
+
+
+def extract_json(text: str) -> Any:
+    """
+    从模型输出中解析JSON
+
+    依次尝试整段文本、```json 代码块、文本中第一个 {...} 或 [...]。
+
+    Args:
+        text: 模型输出
+
+    Returns:
+        解析结果，无法解析时返回None
+    """
+    candidates = [text]
+    fence = JSON_FENCE.search(text)
+    if fence:
+        candidates.append(fence.group(1))
+    block = JSON_BLOCK.search(text)
+    if block:
+        candidates.append(block.group())
+
+    for candidate in candidates:
+        try:
+            return json.loads(candidate)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_follow_up(text: str) -> List[str]:
+    """
+    解析追问文本
+
+    支持JSON数组、含 follow_up_questions / questions 的JSON对象，
+    以及带编号、项目符号、Markdown加粗或引导语的纯文本。
+
+    Args:
+        text: 模型输出
+
+    Returns:
+        去重后的追问列表
+    """
+    # 1. 结构化输出
+    data = extract_json(text)
+    if isinstance(data, dict):
+        data = data.get("follow_up_questions", data.get("questions"))
+    if isinstance(data, list):
+        questions = [q.strip() for q in data if isinstance(q, str) and q.strip()]
+        if questions:
+            return list(dict.fromkeys(questions))
+
+    # 2. 纯文本：逐行去掉列表标记、Markdown加粗和引号
+    lines = []
+    for line in text.splitlines():
+        line = LIST_MARKER.sub("", line.replace("**", "").strip())
+        line = line.strip().strip('"“”').strip()
+        # 跳过 "Here are two follow-up questions:" 之类的引导语
+        if line and not line.endswith(":"):
+            lines.append(line)
+
+    # 3. 有问句时只保留问句（一行中的多个问题分开）
+    questions = [
+        part
+        for line in lines if line.endswith("?")
+        for part in QUESTION_BREAK.split(line)
+        if part
+    ]
+    return list(dict.fromkeys(questions or lines))
+
+
+class FeedbackWithFollowUp:
+    """合并生成（反馈 + 追问）的结构化输出"""
+
+    __slots__ = ("feedback", "follow_up_questions")
+
+    def __init__(self, feedback: str, follow_up_questions: List[str]):
+        self.feedback = feedback
+        self.follow_up_questions = follow_up_questions
+
+    @classmethod
+    def validate(cls, data: Any) -> "FeedbackWithFollowUp":
+        """
+        按结构校验解析后的JSON
+
+        Args:
+            data: {"feedback": str, "follow_up_questions": [str, ...]}
+
+        Returns:
+            校验后的结果（去掉首尾空白和空追问）
+
+        Raises:
+            ValueError: 结构不符合要求
+        """
+        if not isinstance(data, dict):
+            raise ValueError("expected a JSON object")
+
+        feedback = data.get("feedback")
+        if not isinstance(feedback, str) or not feedback.strip():
+            raise ValueError("feedback must be a non-empty string")
+
+        questions = data.get("follow_up_questions")
+        if not isinstance(questions, list) or not all(
+            isinstance(question, str) for question in questions
+        ):
+            raise ValueError("follow_up_questions must be a list of strings")
+        questions = [question.strip() for question in questions if question.strip()]
+        if not questions:
+            raise ValueError("at least one follow-up question is required")
+
+        return cls(feedback.strip(), questions)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "feedback": self.feedback,
+            "follow_up_questions": self.follow_up_questions
+        }
+
+
+def parse_feedback_and_follow_up(text: str) -> Optional[Dict[str, Any]]:
+    """
+    解析合并生成结果
+
+    Args:
+        text: 模型输出
+
+    Returns:
+        {"feedback": ..., "follow_up_questions": [...]}，不符合结构时返回None
+    """
+    try:
+        return FeedbackWithFollowUp.validate(extract_json(text)).to_dict()
+    except ValueError:
+        return None
@@ -1,20 +1,40 @@
 # LLM服务伪代码
 # 文件路径: ai/llm_service.py
 
-from typing import Dict, Any, List, Optional
-from langchain.chat_models import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
-from langchain.schema import HumanMessage, SystemMessage
+from typing import Dict, Any, AsyncIterator, List, Optional
+import asyncio
+
+try:
+    from langchain.chat_models import ChatOpenAI
+    from langchain.schema import BaseMessage, HumanMessage, SystemMessage
+except ImportError:  # 只使用异步接口（OpenAI兼容客户端）时不需要langchain
+    ChatOpenAI = None
+
+try:
+    from ai.llm_output import extract_json, parse_feedback_and_follow_up, parse_follow_up
+except ImportError:
+    from src.ai.llm_output import extract_json, parse_feedback_and_follow_up, parse_follow_up
+
+
+class LLMTimeoutError(TimeoutError):
+    """LLM调用超时（含排队等待时间）"""
 
 
 class LLMService:
     """LLM服务"""
 
+    TEMPERATURE = 0.7
+    MAX_TOKENS = 1000
+
     def __init__(
         self,
         model_name: str = "qwen2.5-7b",
         api_key: Optional[str] = None,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        max_concurrency: int = 64,
+        max_connections: int = 100,
+        timeout: float = 30.0,
+        async_client=None
     ):
         """
         初始化LLM服务
@@ -23,17 +43,45 @@ class LLMService:
             model_name: 模型名称
             api_key: API密钥
             base_url: API基础URL
+            max_concurrency: 异步接口同时进行的最大调用数（按实例、按事件循环计数，
+                需要全局限制时进程内共享一个服务实例）
+            max_connections: 异步连接池大小
+            timeout: 异步调用默认超时（秒，含排队等待）
+            async_client: OpenAI兼容的异步客户端（需支持 chat.completions.create），
+                默认按需创建带连接池的 AsyncOpenAI
         """
         self.model_name = model_name
-
-        # 初始化LLM
-        self.llm = ChatOpenAI(
-            model=model_name,
-            api_key=api_key,
-            base_url=base_url,
-            temperature=0.7,
-            max_tokens=1000
-        )
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self.timeout = timeout
+
+        # 初始化LLM（同步接口）
+        self.llm = None
+        if ChatOpenAI is not None:
+            self.llm = ChatOpenAI(
+                model=model_name,
+                api_key=api_key,
+                base_url=base_url,
+                temperature=self.TEMPERATURE,
+                max_tokens=self.MAX_TOKENS
+            )
+
+        # 异步接口的连接池与并发信号量（绑定到首次使用的事件循环）
+        self._async_client = async_client
+        self._owns_async_client = async_client is None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: set = set()
+
+        self.waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.combined_fallbacks = 0
 
     def chat(self, messages: List[Dict[str, str]]) -> str:
         """
@@ -45,17 +93,50 @@ class LLMService:
         Returns:
             回复内容
         """
-        # 转换消息格式
+        return self._complete(messages)
+
+    async def chat_async(
+        self,
+        messages: List[Dict[str, str]],
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        对话（异步接口）
+
+        Args:
+            messages: 消息列表
+            timeout: 超时（秒），默认使用服务配置
+
+        Returns:
+            回复内容
+        """
+        return await self._acomplete(messages, timeout)
+
+    def _complete(self, messages: List[Dict[str, str]]) -> str:
+        """
+        通过langchain同步调用LLM
+
+        Args:
+            messages: OpenAI格式的消息列表
+
+        Returns:
+            回复内容
+        """
+        if self.llm is None:
+            raise RuntimeError("langchain is required for the synchronous LLM interface")
+        response = self.llm(self._to_langchain_messages(messages))
+        return response.content
+
+    @staticmethod
+    def _to_langchain_messages(messages: List[Dict[str, str]]) -> List["BaseMessage"]:
+        """转换为langchain消息格式"""
         langchain_messages = []
         for msg in messages:
             if msg["role"] == "system":
                 langchain_messages.append(SystemMessage(content=msg["content"]))
             else:
                 langchain_messages.append(HumanMessage(content=msg["content"]))
-
-        # 调用LLM
-        response = self.llm(langchain_messages)
-        return response.content
+        return langchain_messages
 
     def generate_question(
         self,
@@ -70,10 +151,21 @@ class LLMService:
         Returns:
             题目内容
         """
-        # 构建提示词
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="You are an English interview examiner for graduate school admission."),
-            HumanMessage(content=f"""
+        return self._complete(self._question_messages(context))
+
+    async def generate_question_async(
+        self,
+        context: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> str:
+        """生成题目（异步接口）"""
+        return await self._acomplete(self._question_messages(context), timeout)
+
+    def _question_messages(self, context: Dict[str, Any]) -> List[Dict[str, str]]:
+        """构建生成题目的提示词"""
+        return [
+            {"role": "system", "content": "You are an English interview examiner for graduate school admission."},
+            {"role": "user", "content": f"""
             Based on the following context, generate an interview question:
 
             Context:
@@ -85,14 +177,8 @@ class LLMService:
 
             Generate a relevant and challenging question.
             Keep it concise and clear.
-            """)
-        ])
-
-        # 调用LLM
-        messages = prompt.format_messages(**context)
-        response = self.llm(messages)
-
-        return response.content
+            """}
+        ]
 
     def generate_feedback(
         self,
@@ -111,10 +197,54 @@ class LLMService:
         Returns:
             反馈内容
         """
-        # 构建提示词
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="You are an English speaking examiner providing feedback."),
-            HumanMessage(content=f"""
+        return self._complete(self._feedback_messages(question, answer, score))
+
+    async def generate_feedback_async(
+        self,
+        question: str,
+        answer: str,
+        score: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> str:
+        """生成反馈（异步接口）"""
+        return await self._acomplete(
+            self._feedback_messages(question, answer, score), timeout
+        )
+
+    async def stream_feedback_async(
+        self,
+        question: str,
+        answer: str,
+        score: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        流式生成反馈
+
+        Args:
+            question: 题目
+            answer: 回答
+            score: 评分结果
+            timeout: 整个流的超时（秒），默认使用服务配置
+
+        Yields:
+            反馈文本片段（按模型输出的token到达顺序）
+        """
+        async for token in self._astream(
+            self._feedback_messages(question, answer, score), timeout
+        ):
+            yield token
+
+    def _feedback_messages(
+        self,
+        question: str,
+        answer: str,
+        score: Dict[str, Any]
+    ) -> List[Dict[str, str]]:
+        """构建生成反馈的提示词"""
+        return [
+            {"role": "system", "content": "You are an English speaking examiner providing feedback."},
+            {"role": "user", "content": f"""
             Question: {question}
             Answer: {answer}
 
@@ -127,18 +257,8 @@ class LLMService:
 
             Please provide constructive feedback in 2-3 sentences.
             Focus on the strengths and areas for improvement.
-            """)
-        ])
-
-        # 调用LLM
-        messages = prompt.format_messages(
-            question=question,
-            answer=answer,
-            score=score
-        )
-        response = self.llm(messages)
-
-        return response.content
+            """}
+        ]
 
     def generate_follow_up(
         self,
@@ -159,16 +279,41 @@ class LLMService:
         Returns:
             追问列表
         """
-        # 构建提示词
+        content = self._complete(
+            self._follow_up_messages(question, answer, pressure_level)
+        )
+        return parse_follow_up(content)
+
+    async def generate_follow_up_async(
+        self,
+        question: str,
+        answer: str,
+        pressure_level: int = 2,
+        tutor_style_id: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> List[str]:
+        """生成追问（异步接口）"""
+        content = await self._acomplete(
+            self._follow_up_messages(question, answer, pressure_level), timeout
+        )
+        return parse_follow_up(content)
+
+    def _follow_up_messages(
+        self,
+        question: str,
+        answer: str,
+        pressure_level: int
+    ) -> List[Dict[str, str]]:
+        """构建生成追问的提示词"""
         pressure_desc = {
             1: "gentle and encouraging",
             2: "normal and professional",
             3: "challenging and probing"
         }
 
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="You are an English interview examiner."),
-            HumanMessage(content=f"""
+        return [
+            {"role": "system", "content": "You are an English interview examiner."},
+            {"role": "user", "content": f"""
             Question: {question}
             Answer: {answer}
             Pressure level: {pressure_desc.get(pressure_level, 'normal')}
@@ -176,22 +321,119 @@ class LLMService:
             Generate 1-2 follow-up questions based on the answer.
             The questions should be relevant and challenging.
             If the pressure level is high, ask more probing questions.
-            """)
-        ])
-
-        # 调用LLM
-        messages = prompt.format_messages(
-            question=question,
-            answer=answer,
-            pressure_level=pressure_level
+            """}
+        ]
+
+    def generate_feedback_and_follow_up(
+        self,
+        question: str,
+        answer: str,
+        score: Dict[str, Any],
+        pressure_level: int = 2,
+        tutor_style_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        一次调用同时生成反馈和追问
+
+        模型按JSON结构返回两部分内容，题目和回答只在提示词中出现一次。
+        输出不符合结构时退回分别调用 generate_feedback 和 generate_follow_up。
+
+        Args:
+            question: 题目
+            answer: 回答
+            score: 评分结果
+            pressure_level: 压力等级
+            tutor_style_id: 导师风格ID
+
+        Returns:
+            {"feedback": 反馈内容, "follow_up_questions": 追问列表}
+        """
+        content = self._complete(self._feedback_and_follow_up_messages(
+            question, answer, score, pressure_level
+        ))
+        result = parse_feedback_and_follow_up(content)
+        if result is not None:
+            return result
+
+        self.combined_fallbacks += 1
+        return {
+            "feedback": self.generate_feedback(question, answer, score),
+            "follow_up_questions": self.generate_follow_up(
+                question, answer, pressure_level, tutor_style_id
+            )
+        }
+
+    async def generate_feedback_and_follow_up_async(
+        self,
+        question: str,
+        answer: str,
+        score: Dict[str, Any],
+        pressure_level: int = 2,
+        tutor_style_id: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """一次调用同时生成反馈和追问（异步接口，退回时两次调用并发进行）"""
+        content = await self._acomplete(
+            self._feedback_and_follow_up_messages(
+                question, answer, score, pressure_level
+            ),
+            timeout
+        )
+        result = parse_feedback_and_follow_up(content)
+        if result is not None:
+            return result
+
+        self.combined_fallbacks += 1
+        feedback, follow_up = await asyncio.gather(
+            self.generate_feedback_async(question, answer, score, timeout=timeout),
+            self.generate_follow_up_async(
+                question, answer, pressure_level, tutor_style_id, timeout=timeout
+            )
         )
-        response = self.llm(messages)
+        return {"feedback": feedback, "follow_up_questions": follow_up}
 
-        # 解析追问
-        follow_up_text = response.content
-        follow_up_questions = self._parse_follow_up(follow_up_text)
+    def _feedback_and_follow_up_messages(
+        self,
+        question: str,
+        answer: str,
+        score: Dict[str, Any],
+        pressure_level: int
+    ) -> List[Dict[str, str]]:
+        """构建合并生成的提示词"""
+        pressure_desc = {
+            1: "gentle and encouraging",
+            2: "normal and professional",
+            3: "challenging and probing"
+        }
+        dimensions = score.get('dimensions', {})
+
+        return [
+            {"role": "system", "content": "You are an English interview examiner providing feedback and follow-up questions."},
+            {"role": "user", "content": f"""
+            Question: {question}
+            Answer: {answer}
+
+            Scores:
+            - Overall: {score.get('overall_score', 0)}
+            - Pronunciation: {dimensions.get('pronunciation', {}).get('score', 0)}
+            - Fluency: {dimensions.get('fluency', {}).get('score', 0)}
+            - Vocabulary: {dimensions.get('vocabulary', {}).get('score', 0)}
+            - Grammar: {dimensions.get('grammar', {}).get('score', 0)}
+            Pressure level: {pressure_desc.get(pressure_level, 'normal')}
 
-        return follow_up_questions
+            1. Provide constructive feedback in 2-3 sentences, focusing on
+               the strengths and areas for improvement.
+            2. Generate 1-2 relevant and challenging follow-up questions based
+               on the answer. If the pressure level is high, ask more probing
+               questions.
+
+            Return only JSON in this format:
+            {{
+                "feedback": "feedback text",
+                "follow_up_questions": ["question 1", "question 2"]
+            }}
+            """}
+        ]
 
     def enhance_expression(
         self,
@@ -208,10 +450,24 @@ class LLMService:
         Returns:
             增强后的表达
         """
-        # 构建提示词
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="You are an English language expert."),
-            HumanMessage(content=f"""
+        content = self._complete(self._enhance_messages(original_text))
+        return self._parse_enhanced(content, original_text)
+
+    async def enhance_expression_async(
+        self,
+        original_text: str,
+        context: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """增强表达（异步接口）"""
+        content = await self._acomplete(self._enhance_messages(original_text), timeout)
+        return self._parse_enhanced(content, original_text)
+
+    def _enhance_messages(self, original_text: str) -> List[Dict[str, str]]:
+        """构建增强表达的提示词"""
+        return [
+            {"role": "system", "content": "You are an English language expert."},
+            {"role": "user", "content": f"""
             Original text: {original_text}
 
             Please enhance this text to make it more academic and professional.
@@ -226,18 +482,13 @@ class LLMService:
                 "improvements": ["improvement 1", "improvement 2"],
                 "advanced_vocabulary": ["word1", "word2"]
             }}
-            """)
-        ])
-
-        # 调用LLM
-        messages = prompt.format_messages(original_text=original_text)
-        response = self.llm(messages)
+            """}
+        ]
 
-        # 解析结果
-        import json
-        try:
-            result = json.loads(response.content)
-        except:
+    def _parse_enhanced(self, content: str, original_text: str) -> Dict[str, Any]:
+        """解析增强表达结果（解析失败时返回原文）"""
+        result = extract_json(content)
+        if not isinstance(result, dict):
             result = {
                 "enhanced": original_text,
                 "improvements": [],
@@ -246,19 +497,207 @@ class LLMService:
 
         return result
 
-    def _parse_follow_up(self, text: str) -> List[str]:
+    async def _acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        timeout: Optional[float] = None
+    ) -> str:
         """
-        解析追问文本
+        通过共享连接池异步调用LLM
+
+        排队等待与请求本身共用一个截止时间。超时或调用方取消时
+        请求被中止，占用的并发名额立即释放。
 
         Args:
-            text: 追问文本
+            messages: 提示词消息
+            timeout: 超时（秒），默认使用服务配置
 
         Returns:
-            追问列表
+            回复内容
+
+        Raises:
+            LLMTimeoutError: 超时
+        """
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(self._call(messages), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise LLMTimeoutError(f"LLM call timed out after {timeout}s")
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+    async def _call(self, messages: List[Dict[str, str]]) -> str:
+        """占用一个并发名额并发送请求"""
+        client, slots = self._async_resources()
+
+        self.waiting += 1
+        try:
+            await slots.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        try:
+            response = await client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                temperature=self.TEMPERATURE,
+                max_tokens=self.MAX_TOKENS
+            )
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            slots.release()
+
+        self.completed += 1
+        return response.choices[0].message.content or ""
+
+    async def _astream(
+        self,
+        messages: List[Dict[str, str]],
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        通过共享连接池流式调用LLM
+
+        与 _acomplete 共用并发名额，整个流（含排队）共用一个截止时间；
+        流结束、超时、调用方取消或提前停止迭代时释放名额。
+
+        Args:
+            messages: 提示词消息
+            timeout: 超时（秒），默认使用服务配置
+
+        Yields:
+            文本片段
+
+        Raises:
+            LLMTimeoutError: 超时
+        """
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        client, slots = self._async_resources()
+
+        async def before_deadline(awaitable):
+            try:
+                return await asyncio.wait_for(
+                    awaitable, timeout=max(deadline - loop.time(), 0)
+                )
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                raise LLMTimeoutError(f"LLM stream timed out after {timeout}s")
+
+        self.waiting += 1
+        try:
+            await before_deadline(slots.acquire())
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        stream = None
+        try:
+            stream = await before_deadline(client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                temperature=self.TEMPERATURE,
+                max_tokens=self.MAX_TOKENS,
+                stream=True
+            ))
+            chunks = stream.__aiter__()
+            while True:
+                try:
+                    chunk = await before_deadline(chunks.__anext__())
+                except StopAsyncIteration:
+                    break
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        except LLMTimeoutError:
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        else:
+            self.completed += 1
+        finally:
+            self.in_flight -= 1
+            slots.release()
+            if stream is not None and hasattr(stream, "close"):
+                await stream.close()
+
+    def _async_resources(self):
+        """
+        获取当前事件循环的连接池与信号量
+
+        信号量和连接都绑定事件循环，切换循环（如测试中多次 asyncio.run）时重建，
+        自建的旧连接池随之关闭。并发上限只对本实例在当前循环上的调用生效，
+        不是进程级限制：多个实例或多个事件循环各自计数。
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._owns_async_client and self._async_client is not None:
+                self._retire_client(self._async_client, self._loop)
+                self._async_client = None
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+
+        if self._async_client is None:
+            self._async_client = self._create_async_client()
+        return self._async_client, self._slots
+
+    def _create_async_client(self):
+        """创建带连接池的 AsyncOpenAI 客户端"""
+        import httpx
+        from openai import AsyncOpenAI
+
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http_client=httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        )
+
+    def _retire_client(self, client, old_loop: Optional[asyncio.AbstractEventLoop]):
+        """
+        关闭旧事件循环上创建的连接池
+
+        旧循环仍在其他线程运行时在该循环上关闭；已结束时在当前循环后台关闭，
+        连接已随旧循环失效，只释放连接池资源，关闭出错时忽略。
         """
-        # 简单实现：按行分割
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        return lines
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.close(), old_loop)
+            return
+
+        async def close_quietly():
+            try:
+                await client.close()
+            except Exception:
+                pass
+
+        task = asyncio.ensure_future(close_quietly())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def aclose(self):
+        """关闭异步连接池（含尚未关闭完成的旧连接池）"""
+        if self._owns_async_client and self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        self._loop = None
 
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -269,8 +708,26 @@ class LLMService:
         """
         return {
             "model_name": self.model_name,
-            "temperature": 0.7,
-            "max_tokens": 1000
+            "temperature": self.TEMPERATURE,
+            "max_tokens": self.MAX_TOKENS
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取异步调用统计
+
+        Returns:
+            排队、进行中、完成、失败、超时与取消次数，以及合并生成退回两次调用的次数
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "combined_fallbacks": self.combined_fallbacks
         }
 
 
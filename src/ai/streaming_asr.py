@@ -0,0 +1,220 @@
+# 流式语音识别实现代码
+# 文件路径: ai/streaming_asr.py
+
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+import numpy as np
+
+
+PCMDecoder = Callable[[np.ndarray], Awaitable[Dict[str, Any]]]
+
+
+class StreamingRecognizer:
+    """
+    增量流式识别器
+
+    接收 16-bit 单声道 PCM 音频块，按帧能量做VAD切分语音段：
+    说话过程中定期解码当前语音段输出 partial 结果，
+    静音超过 min_silence_ms 或调用 finish() 时输出该段的 final 结果。
+    """
+
+    def __init__(
+        self,
+        decode: PCMDecoder,
+        sample_rate: int = 16000,
+        vad_config: Optional[Dict[str, Any]] = None,
+        language: str = "en",
+        frame_ms: int = 30,
+        partial_interval_ms: int = 600,
+        noise_floor: float = 500.0
+    ):
+        """
+        初始化识别器
+
+        Args:
+            decode: 解码函数，输入 float32 波形（-1~1），返回含 text 的结果
+            sample_rate: 采样率
+            vad_config: VAD配置（threshold/min_speech_ms/min_silence_ms）
+            language: 语言
+            frame_ms: VAD帧长（毫秒）
+            partial_interval_ms: 两次 partial 解码之间至少新增的语音时长（毫秒）
+            noise_floor: 能量到语音概率映射的噪声基准（int16 RMS）
+        """
+        vad_config = vad_config or {
+            "threshold": 0.5,
+            "min_speech_ms": 250,
+            "min_silence_ms": 2000
+        }
+
+        self.decode = decode
+        self.sample_rate = sample_rate
+        self.language = language
+        self.threshold = vad_config["threshold"]
+        self.min_speech_ms = vad_config["min_speech_ms"]
+        self.min_silence_ms = vad_config["min_silence_ms"]
+        self.frame_ms = frame_ms
+        self.frame_size = sample_rate * frame_ms // 1000
+        self.partial_interval = sample_rate * partial_interval_ms // 1000
+        self.noise_floor = noise_floor
+
+        self._remainder = b""
+        self._frames_seen = 0
+        self._in_speech = False
+        self._speech_ms = 0
+        self._silence_ms = 0
+        self._onset: List[np.ndarray] = []
+        self._segment: List[np.ndarray] = []
+        self._segment_start = 0
+        self._last_partial_len = 0
+
+        self.finals: List[Dict[str, Any]] = []
+
+    @property
+    def transcript(self) -> str:
+        """已确定部分的完整文本"""
+        return " ".join(f["text"] for f in self.finals if f["text"])
+
+    def speech_probability(self, frames: np.ndarray) -> np.ndarray:
+        """
+        按帧计算语音概率（向量化）
+
+        Args:
+            frames: 形状为 (帧数, 帧长) 的 int16 数组
+
+        Returns:
+            每帧的语音概率
+        """
+        rms = np.sqrt(np.mean(frames.astype(np.float32) ** 2, axis=1))
+        return rms / (rms + self.noise_floor)
+
+    async def accept_chunk(self, pcm: bytes) -> List[Dict[str, Any]]:
+        """
+        输入一个PCM音频块
+
+        Args:
+            pcm: 16-bit little-endian 单声道PCM数据
+
+        Returns:
+            本次产生的识别事件（partial/final）
+        """
+        data = self._remainder + pcm
+        frame_bytes = self.frame_size * 2
+        usable = len(data) - len(data) % frame_bytes
+        self._remainder = data[usable:]
+        if usable == 0:
+            return []
+
+        frames = np.frombuffer(data[:usable], dtype="<i2").reshape(-1, self.frame_size)
+        is_speech = self.speech_probability(frames) >= self.threshold
+
+        events = []
+        for frame, speech in zip(frames, is_speech):
+            event = await self._process_frame(frame, bool(speech))
+            if event is not None:
+                events.append(event)
+            self._frames_seen += 1
+
+        new_audio = self._segment_length() - self._last_partial_len
+        if self._in_speech and new_audio >= self.partial_interval:
+            events.append(await self._emit(is_final=False))
+
+        return events
+
+    async def finish(self) -> List[Dict[str, Any]]:
+        """
+        输入结束，输出未完成语音段的 final 结果
+
+        Returns:
+            识别事件
+        """
+        if self._in_speech and self._segment:
+            return [await self._close_segment()]
+        return []
+
+    def discard(self):
+        """
+        放弃未完成的输入（客户端断开或放弃本轮），释放缓存的音频
+
+        不解码未完成的语音段；已输出的 final 结果保留。
+        """
+        self._remainder = b""
+        self._in_speech = False
+        self._onset = []
+        self._segment = []
+        self._speech_ms = 0
+        self._silence_ms = 0
+        self._last_partial_len = 0
+
+    async def _process_frame(
+        self,
+        frame: np.ndarray,
+        speech: bool
+    ) -> Optional[Dict[str, Any]]:
+        """推进VAD状态机"""
+        if not self._in_speech:
+            if not speech:
+                self._speech_ms = 0
+                self._onset = []
+                return None
+
+            self._onset.append(frame)
+            self._speech_ms += self.frame_ms
+            if self._speech_ms >= self.min_speech_ms:
+                self._in_speech = True
+                self._segment = self._onset
+                self._segment_start = self._frames_seen - len(self._onset) + 1
+                self._onset = []
+                self._silence_ms = 0
+                self._last_partial_len = 0
+            return None
+
+        self._segment.append(frame)
+        if speech:
+            self._silence_ms = 0
+            return None
+
+        self._silence_ms += self.frame_ms
+        if self._silence_ms >= self.min_silence_ms:
+            return await self._close_segment()
+        return None
+
+    def _segment_length(self) -> int:
+        return len(self._segment) * self.frame_size
+
+    def _segment_audio(self, trim_silence: bool = False) -> np.ndarray:
+        """当前语音段的 float32 波形"""
+        frames = self._segment
+        if trim_silence:
+            trailing = self._silence_ms // self.frame_ms
+            frames = frames[: len(frames) - trailing] if trailing else frames
+        if not frames:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(frames).astype(np.float32) / 32768.0
+
+    async def _emit(self, is_final: bool) -> Dict[str, Any]:
+        """解码当前语音段"""
+        audio = self._segment_audio(trim_silence=is_final)
+        result = await self.decode(audio)
+        self._last_partial_len = self._segment_length()
+
+        start = self._segment_start * self.frame_ms / 1000
+        return {
+            "type": "final" if is_final else "partial",
+            "text": result.get("text", "").strip(),
+            "language": self.language,
+            "is_final": is_final,
+            "segment": len(self.finals),
+            "start": round(start, 3),
+            "end": round(start + len(audio) / self.sample_rate, 3)
+        }
+
+    async def _close_segment(self) -> Dict[str, Any]:
+        """结束当前语音段并输出 final 结果"""
+        event = await self._emit(is_final=True)
+        self.finals.append(event)
+
+        self._in_speech = False
+        self._segment = []
+        self._speech_ms = 0
+        self._silence_ms = 0
+        self._last_partial_len = 0
+        return event
@@ -0,0 +1,64 @@
+# 流式文本分句实现代码
+# 文件路径: ai/text_stream.py
+
+from typing import AsyncIterable, AsyncIterator, List, Tuple
+import re
+
+
+# 句末标点（可跟引号或右括号），且其后已出现空白，才能确认句子结束
+SENTENCE_END = re.compile(r"[.!?。！？]+[\"')\]]*(?=\s)")
+
+# 句点后不断句的缩写
+ABBREVIATIONS = {"e.g", "i.e", "mr", "mrs", "ms", "dr", "prof", "vs"}
+
+
+def split_sentences(buffer: str) -> Tuple[List[str], str]:
+    """
+    从缓冲文本中切出已完整的句子
+
+    Args:
+        buffer: 已收到但尚未切出的文本
+
+    Returns:
+        (完整句子列表, 剩余未结束的文本)
+    """
+    sentences = []
+    start = 0
+    for match in SENTENCE_END.finditer(buffer):
+        words = buffer[start:match.start()].split()
+        abbreviated = words and words[-1].lower() in ABBREVIATIONS
+        if abbreviated and match.group().startswith("."):
+            continue
+        sentence = buffer[start:match.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    return sentences, buffer[start:]
+
+
+async def iter_sentences(tokens: AsyncIterable[str]) -> AsyncIterator[str]:
+    """
+    将流式生成的文本片段按句子重新分组
+
+    每个句子在其后的空白到达时立即产出，流结束时产出剩余文本。
+
+    Args:
+        tokens: 文本片段（如LLM逐token输出）
+
+    Yields:
+        完整句子
+    """
+    buffer = ""
+    async for token in tokens:
+        buffer += token
+        if not any(c.isspace() for c in token):
+            continue
+        sentences, buffer = split_sentences(buffer)
+        for sentence in sentences:
+            yield sentence
+
+    sentences, buffer = split_sentences(buffer + " ")
+    for sentence in sentences:
+        yield sentence
+    if buffer.strip():
+        yield buffer.strip()
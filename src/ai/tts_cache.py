@@ -0,0 +1,331 @@
+# TTS音频缓存实现代码
+# 文件路径: ai/tts_cache.py
+
+from typing import Callable, Dict, Any, List, Optional, Union
+from collections import OrderedDict
+import hashlib
+import os
+import tempfile
+import threading
+
+
+def tts_cache_key(text: str, voice: str, rate: str, pitch: str, volume: str) -> str:
+    """
+    计算TTS缓存键（内容寻址）
+
+    Args:
+        text: 文本内容
+        voice: 音色ID（如 en-US-GuyNeural）
+        rate: 语速
+        pitch: 音调
+        volume: 音量
+
+    Returns:
+        SHA-256 十六进制摘要
+    """
+    payload = "\x1f".join([text, voice, rate, pitch, volume])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FileAudioStore:
+    """
+    持久化音频存储（按总字节数限制容量，LRU淘汰）
+
+    文件名即缓存键，进程重启后从目录重建索引。
+    通过 pin() 固定的条目在 unpin() 之前不会被淘汰，
+    调用方可以安全地按路径读取文件。
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        max_bytes: int = 2 * 1024 ** 3,
+        url_prefix: str = "minio://audio/tts/cache",
+        suffix: str = ".mp3"
+    ):
+        """
+        初始化存储
+
+        Args:
+            root_dir: 存储目录
+            max_bytes: 总容量上限（字节）
+            url_prefix: 返回URL的前缀
+            suffix: 文件后缀
+        """
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self.url_prefix = url_prefix.rstrip("/")
+        self.suffix = suffix
+
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._pins: Dict[str, int] = {}
+        self.total_bytes = 0
+        self.evictions = 0
+        self._eviction_listeners: List[Callable[[str], None]] = []
+
+        os.makedirs(root_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """按最近访问时间重建索引"""
+        entries = []
+        for name in os.listdir(self.root_dir):
+            if not name.endswith(self.suffix):
+                continue
+            stat = os.stat(os.path.join(self.root_dir, name))
+            entries.append((stat.st_mtime, name[: -len(self.suffix)], stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self.total_bytes += size
+
+    def add_eviction_listener(self, listener: Callable[[str], None]):
+        """
+        注册淘汰回调（条目被淘汰或文件已丢失时以缓存键调用）
+
+        Args:
+            listener: 回调函数，参数为缓存键
+        """
+        self._eviction_listeners.append(listener)
+
+    def _notify_evicted(self, keys: List[str]):
+        """通知已淘汰的缓存键"""
+        for key in keys:
+            for listener in self._eviction_listeners:
+                listener(key)
+
+    def pin(self, key: str):
+        """
+        固定条目，固定期间不会被淘汰（可重入，需与 unpin 成对调用）
+
+        可以在条目写入之前固定，随后的 put 不会把它淘汰。
+
+        Args:
+            key: 缓存键
+        """
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, key: str):
+        """
+        解除一次固定（超出的容量在下一次写入时淘汰）
+
+        Args:
+            key: 缓存键
+        """
+        with self._lock:
+            count = self._pins.get(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            else:
+                self._pins.pop(key, None)
+
+    def path_for(self, key: str) -> str:
+        """获取键对应的本地文件路径"""
+        return os.path.join(self.root_dir, f"{key}{self.suffix}")
+
+    def url_for(self, key: str) -> str:
+        """获取键对应的音频URL"""
+        return f"{self.url_prefix}/{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        查询音频
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            音频URL，不存在时返回None
+        """
+        with self._lock:
+            if key not in self._index:
+                return None
+            self._index.move_to_end(key)
+
+        try:
+            os.utime(self.path_for(key))
+        except FileNotFoundError:
+            with self._lock:
+                self.total_bytes -= self._index.pop(key, 0)
+            self._notify_evicted([key])
+            return None
+
+        return self.url_for(key)
+
+    def put(self, key: str, audio_data: Union[bytes, memoryview]) -> str:
+        """
+        写入音频并按容量淘汰最久未使用的条目
+
+        Args:
+            key: 缓存键
+            audio_data: 音频数据
+
+        Returns:
+            音频URL
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(audio_data)
+        os.replace(tmp_path, self.path_for(key))
+
+        with self._lock:
+            self.total_bytes -= self._index.pop(key, 0)
+            self._index[key] = len(audio_data)
+            self.total_bytes += len(audio_data)
+            evicted = self._evict_locked(keep=key)
+
+        for old_key in evicted:
+            try:
+                os.remove(self.path_for(old_key))
+            except FileNotFoundError:
+                pass
+        self._notify_evicted(evicted)
+
+        return self.url_for(key)
+
+    def _evict_locked(self, keep: str) -> list:
+        """淘汰超出容量的条目，跳过刚写入和已固定的条目（调用方持有锁）"""
+        evicted = []
+        if self.total_bytes <= self.max_bytes:
+            return evicted
+
+        for old_key in list(self._index):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if old_key == keep or old_key in self._pins:
+                continue
+            self.total_bytes -= self._index.pop(old_key)
+            evicted.append(old_key)
+        self.evictions += len(evicted)
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class TTSAudioCache:
+    """
+    TTS音频两级缓存
+
+    一级：进程内LRU（缓存键 -> 音频URL）
+    二级：可选的持久化存储（FileAudioStore 或同接口的对象存储）
+
+    持久化存储淘汰条目时通过 add_eviction_listener 通知，
+    一级缓存随之删除对应URL，不会返回已删除音频的地址。
+    """
+
+    def __init__(self, store: Optional[FileAudioStore] = None, max_memory_items: int = 4096):
+        """
+        初始化缓存
+
+        Args:
+            store: 持久化存储，None表示只使用进程内缓存
+            max_memory_items: 进程内缓存条目上限
+        """
+        self.store = store
+        self.max_memory_items = max_memory_items
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+        if store is not None and hasattr(store, "add_eviction_listener"):
+            store.add_eviction_listener(self._forget)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        查询缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            音频URL，未命中返回None
+        """
+        with self._lock:
+            audio_url = self._memory.get(key)
+            if audio_url is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return audio_url
+
+        if self.store is not None:
+            audio_url = self.store.get(key)
+            if audio_url is not None:
+                with self._lock:
+                    self.store_hits += 1
+                    self._remember_locked(key, audio_url)
+                return audio_url
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(
+        self,
+        key: str,
+        audio_data: Union[bytes, memoryview],
+        audio_url: Optional[str] = None
+    ) -> str:
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            audio_data: 音频数据（写入持久化存储）
+            audio_url: 无持久化存储时使用的音频URL
+
+        Returns:
+            缓存的音频URL
+        """
+        if self.store is not None:
+            audio_url = self.store.put(key, audio_data)
+
+        if audio_url is None:
+            raise ValueError("audio_url is required when no persistent store is configured")
+
+        with self._lock:
+            self._remember_locked(key, audio_url)
+        return audio_url
+
+    def _forget(self, key: str):
+        """删除进程内缓存条目（持久化存储已淘汰该键）"""
+        with self._lock:
+            self._memory.pop(key, None)
+
+    def _remember_locked(self, key: str, audio_url: str):
+        """写入进程内LRU（调用方持有锁）"""
+        self._memory[key] = audio_url
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取命中统计
+
+        Returns:
+            命中次数、未命中次数及命中率
+        """
+        with self._lock:
+            hits = self.memory_hits + self.store_hits
+            lookups = hits + self.misses
+            stats = {
+                "memory_hits": self.memory_hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "memory_items": len(self._memory),
+            }
+
+        if self.store is not None:
+            stats["store_items"] = len(self.store)
+            stats["store_bytes"] = self.store.total_bytes
+            stats["store_evictions"] = self.store.evictions
+
+        return stats
@@ -1,18 +1,32 @@
 # TTS服务伪代码
 # 文件路径: ai/tts_service.py
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterable, Optional, List, Union, Coroutine
 import asyncio
+import threading
 import edge_tts
+from ai.tts_cache import TTSAudioCache, tts_cache_key
+from ai.audio_sink import AudioSink, BufferSink, SegmentSink, TeeSink
 
 
 class TTSService:
     """TTS服务"""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[TTSAudioCache] = None):
         """
         初始化TTS服务
+
+        Args:
+            cache: 音频缓存（默认仅使用进程内缓存）
         """
+        # 音频缓存（按文本、音色、语速、音调、音量寻址）
+        self.cache = cache if cache is not None else TTSAudioCache()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+        # 同步接口复用的后台事件循环
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
         # 音色配置
         self.voices = {
             "male_us": "en-US-GuyNeural",
@@ -46,7 +60,8 @@ class TTSService:
     async def synthesize(
         self,
         text: str,
-        style: str = "friendly"
+        style: str = "friendly",
+        sink: Optional[AudioSink] = None
     ) -> str:
         """
         合成语音
@@ -54,6 +69,8 @@ class TTSService:
         Args:
             text: 文本内容
             style: 风格 (academic/friendly/high_pressure)
+            sink: 音频块接收端，合成过程中逐块转发（如推送到WebSocket）；
+                命中缓存时不转发，直接返回URL
 
         Returns:
             音频URL
@@ -62,24 +79,53 @@ class TTSService:
         preset = self.style_presets.get(style, self.style_presets["friendly"])
         voice = self.voices[preset["voice"]]
 
-        # 2. 创建通信对象
-        communicate = edge_tts.Communicate(
+        # 2. 合成（命中缓存时直接返回）
+        return await self._synthesize_cached(
             text,
             voice,
             rate=preset["rate"],
             pitch=preset["pitch"],
-            volume=preset["volume"]
+            volume=preset["volume"],
+            label=style,
+            sink=sink
         )
 
-        # 3. 合成音频
-        audio_data = b""
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                audio_data += chunk["data"]
+    def cache_key(self, text: str, style: str = "friendly") -> str:
+        """
+        计算按风格合成时的缓存键
+
+        Args:
+            text: 文本内容
+            style: 风格
+
+        Returns:
+            缓存键（文本或风格参数变化时随之变化）
+        """
+        preset = self.style_presets.get(style, self.style_presets["friendly"])
+        return tts_cache_key(
+            text,
+            self.voices[preset["voice"]],
+            preset["rate"],
+            preset["pitch"],
+            preset["volume"]
+        )
+
+    def available_url(self, key: str, audio_url: str) -> Optional[str]:
+        """
+        检查之前合成并记录的音频是否仍可用
 
-        # 4. 保存音频文件
-        audio_url = self._save_audio(audio_data, style)
+        配置了持久化存储时以缓存为准（存储按容量淘汰后返回None）；
+        未配置时音频按缓存键保存在对象存储中，不会被删除，直接返回 audio_url。
 
+        Args:
+            key: 合成时的缓存键
+            audio_url: 记录的音频URL
+
+        Returns:
+            可用的音频URL，已被淘汰时返回None
+        """
+        if self.cache.store is not None:
+            return self.cache.get(key)
         return audio_url
 
     def synthesize_sync(self, text: str, style: str = "friendly") -> str:
@@ -93,7 +139,25 @@ class TTSService:
         Returns:
             音频URL
         """
-        return asyncio.run(self.synthesize(text, style))
+        return self._run_sync(self.synthesize(text, style))
+
+    def _run_sync(self, coro: Coroutine) -> Any:
+        """
+        在复用的后台事件循环中执行协程并等待结果
+
+        避免每次同步调用都通过 asyncio.run 新建和销毁事件循环，
+        多个线程可同时调用。
+        """
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="tts-sync-loop",
+                    daemon=True
+                ).start()
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
     async def synthesize_with_voice(
         self,
@@ -101,7 +165,8 @@ class TTSService:
         voice: str = "female_us",
         rate: str = "+0%",
         pitch: str = "+0%",
-        volume: str = "+0%"
+        volume: str = "+0%",
+        sink: Optional[AudioSink] = None
     ) -> str:
         """
         使用自定义音色合成语音
@@ -112,6 +177,7 @@ class TTSService:
             rate: 语速
             pitch: 音调
             volume: 音量
+            sink: 音频块接收端（同 synthesize）
 
         Returns:
             音频URL
@@ -119,7 +185,182 @@ class TTSService:
         # 1. 获取音色
         voice_id = self.voices.get(voice, self.voices["female_us"])
 
-        # 2. 创建通信对象
+        # 2. 合成（命中缓存时直接返回）
+        return await self._synthesize_cached(
+            text,
+            voice_id,
+            rate=rate,
+            pitch=pitch,
+            volume=volume,
+            label=voice,
+            sink=sink
+        )
+
+    async def _synthesize_cached(
+        self,
+        text: str,
+        voice_id: str,
+        rate: str,
+        pitch: str,
+        volume: str,
+        label: str,
+        sink: Optional[AudioSink] = None
+    ) -> str:
+        """
+        带缓存的语音合成
+
+        相同参数的并发请求只触发一次合成（后到的请求不接收音频块）。
+
+        Args:
+            text: 文本内容
+            voice_id: edge-tts音色ID
+            rate: 语速
+            pitch: 音调
+            volume: 音量
+            label: 存储分类（风格或音色名）
+            sink: 音频块接收端
+
+        Returns:
+            音频URL
+        """
+        key = tts_cache_key(text, voice_id, rate, pitch, volume)
+
+        audio_url = self.cache.get(key)
+        if audio_url is not None:
+            return audio_url
+
+        # 进行中的合成按事件循环区分（同步接口使用独立的后台循环）
+        loop = asyncio.get_running_loop()
+        inflight_key = (loop, key)
+        inflight = self._inflight.get(inflight_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = loop.create_future()
+        self._inflight[inflight_key] = future
+        try:
+            audio_data = await self._render(text, voice_id, rate, pitch, volume, sink)
+            audio_url = self._store(key, audio_data, label)
+            future.set_result(audio_url)
+            return audio_url
+        except BaseException as e:
+            future.set_exception(e)
+            # 标记异常已读取，避免无等待方时告警
+            future.exception()
+            raise
+        finally:
+            del self._inflight[inflight_key]
+
+    def _store(
+        self,
+        key: str,
+        audio_data: Union[bytes, memoryview],
+        label: str
+    ) -> str:
+        """
+        保存合成结果并写入缓存
+
+        Args:
+            key: 缓存键
+            audio_data: 音频数据
+            label: 存储分类（风格或音色名）
+
+        Returns:
+            音频URL
+        """
+        if self.cache.store is not None:
+            return self.cache.put(key, audio_data)
+        return self.cache.put(
+            key, audio_data, audio_url=self._save_audio(audio_data, label, key)
+        )
+
+    async def synthesize_stream(
+        self,
+        sentences: AsyncIterable[str],
+        style: str = "friendly",
+        sink: Optional[AudioSink] = None
+    ) -> Optional[str]:
+        """
+        边生成边合成语音
+
+        句子在后台持续读取（如LLM仍在生成后续内容），每读到一句立即合成，
+        音频块按句子顺序连续写入 sink，第一句无需等待全文生成完毕即可播放。
+        全部句子合成后，完整音频按全文缓存，之后以全文调用 synthesize 直接命中。
+
+        Args:
+            sentences: 句子流（如 iter_sentences 切分的LLM输出）
+            style: 风格 (academic/friendly/high_pressure)
+            sink: 音频块接收端，所有句子结束或出错后关闭一次
+
+        Returns:
+            完整语音的音频URL，句子流为空时返回None
+        """
+        preset = self.style_presets.get(style, self.style_presets["friendly"])
+        voice = self.voices[preset["voice"]]
+        segment_sink = SegmentSink(sink) if sink is not None else None
+
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def read_sentences():
+            try:
+                async for sentence in sentences:
+                    await queue.put(sentence)
+            finally:
+                await queue.put(None)
+
+        reader = asyncio.ensure_future(read_sentences())
+        texts = []
+        parts = []
+        try:
+            while True:
+                sentence = await queue.get()
+                if sentence is None:
+                    break
+                texts.append(sentence)
+                parts.append(await self._render(
+                    sentence,
+                    voice,
+                    preset["rate"],
+                    preset["pitch"],
+                    preset["volume"],
+                    segment_sink
+                ))
+            # 句子流出错时抛出其异常
+            await reader
+        finally:
+            if not reader.done():
+                reader.cancel()
+                await asyncio.gather(reader, return_exceptions=True)
+            # 合成或句子流出错时同样关闭，客户端据此结束本轮播放
+            if sink is not None:
+                await sink.close()
+
+        if not texts:
+            return None
+
+        key = tts_cache_key(
+            " ".join(texts), voice, preset["rate"], preset["pitch"], preset["volume"]
+        )
+        return self._store(key, b"".join(parts), style)
+
+    async def _render(
+        self,
+        text: str,
+        voice_id: str,
+        rate: str,
+        pitch: str,
+        volume: str,
+        sink: Optional[AudioSink] = None
+    ) -> memoryview:
+        """
+        调用edge-tts合成音频
+
+        音频块写入内存缓冲，同时转发给 sink（如有）。
+
+        Returns:
+            完整音频的只读视图
+        """
+        # 1. 创建通信对象
         communicate = edge_tts.Communicate(
             text,
             voice_id,
@@ -128,45 +369,98 @@ class TTSService:
             volume=volume
         )
 
-        # 3. 合成音频
-        audio_data = b""
+        # 2. 合成音频
+        buffer = BufferSink()
+        target = TeeSink(buffer, sink) if sink is not None else buffer
         async for chunk in communicate.stream():
             if chunk["type"] == "audio":
-                audio_data += chunk["data"]
+                await target.write(chunk["data"])
+        await target.close()
 
-        # 4. 保存音频文件
-        audio_url = self._save_audio(audio_data, voice)
+        return buffer.getvalue()
 
-        return audio_url
+    async def synthesize_batch_async(
+        self,
+        texts: List[str],
+        style: str = "friendly",
+        concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[Union[str, BaseException]]:
+        """
+        并发批量合成语音
+
+        所有文本在同一个事件循环中调度，由信号量限制并发数，
+        单条失败时按指数退避重试。
+
+        Args:
+            texts: 文本列表
+            style: 风格
+            concurrency: 最大并发合成数，默认 TTSConfig.BATCH_CONCURRENCY
+            max_retries: 单条最大重试次数，默认 TTSConfig.MAX_RETRIES
+            return_exceptions: 为True时失败条目以异常对象返回，否则抛出首个异常
+
+        Returns:
+            与输入顺序一致的音频URL列表
+        """
+        concurrency = concurrency or TTSConfig.BATCH_CONCURRENCY
+        max_retries = TTSConfig.MAX_RETRIES if max_retries is None else max_retries
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def synthesize_one(text: str) -> str:
+            for attempt in range(max_retries + 1):
+                try:
+                    async with semaphore:
+                        return await self.synthesize(text, style)
+                except Exception:
+                    if attempt == max_retries:
+                        raise
+                await asyncio.sleep(TTSConfig.RETRY_BACKOFF * (2 ** attempt))
+
+        return await asyncio.gather(
+            *(synthesize_one(text) for text in texts),
+            return_exceptions=return_exceptions
+        )
 
     def synthesize_batch(
         self,
-        texts: list[str],
-        style: str = "friendly"
-    ) -> list[str]:
+        texts: List[str],
+        style: str = "friendly",
+        concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None
+    ) -> List[str]:
         """
-        批量合成语音
+        批量合成语音（同步接口）
 
         Args:
             texts: 文本列表
             style: 风格
+            concurrency: 最大并发合成数
+            max_retries: 单条最大重试次数
 
         Returns:
-            音频URL列表
+            与输入顺序一致的音频URL列表
         """
-        audio_urls = []
-        for text in texts:
-            audio_url = self.synthesize_sync(text, style)
-            audio_urls.append(audio_url)
-        return audio_urls
-
-    def _save_audio(self, audio_data: bytes, style: str) -> str:
+        return self._run_sync(self.synthesize_batch_async(
+            texts,
+            style=style,
+            concurrency=concurrency,
+            max_retries=max_retries
+        ))
+
+    def _save_audio(
+        self,
+        audio_data: Union[bytes, memoryview],
+        style: str,
+        key: Optional[str] = None
+    ) -> str:
         """
         保存音频文件
 
         Args:
-            audio_data: 音频数据
+            audio_data: 音频数据（bytes 或只读视图）
             style: 风格
+            key: 内容寻址的缓存键（作为文件名）
 
         Returns:
             音频URL
@@ -176,13 +470,13 @@ class TTSService:
         # from services.storage_service import StorageService
         #
         # storage_service = StorageService()
-        # filename = f"tts/{style}/{uuid.uuid4()}.mp3"
+        # filename = f"tts/{style}/{key or uuid.uuid4()}.mp3"
         # audio_url = storage_service.upload_audio(filename, audio_data)
         #
         # return audio_url
 
         # 模拟返回
-        return f"minio://audio/tts/{style}/temp.mp3"
+        return f"minio://audio/tts/{style}/{key or 'temp'}.mp3"
 
     def get_available_voices(self) -> Dict[str, str]:
         """
@@ -202,6 +496,15 @@ class TTSService:
         """
         return self.style_presets
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        获取音频缓存命中统计
+
+        Returns:
+            统计字典
+        """
+        return self.cache.stats()
+
 
 class VITSService:
     """VITS本地TTS服务"""
@@ -295,6 +598,11 @@ class TTSConfig:
         "highest": "+50%"
     }
 
+    # 批量合成
+    BATCH_CONCURRENCY = 8
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5  # 首次重试等待（秒），之后指数递增
+
     @classmethod
     def get_voice_info(cls, voice: str) -> Dict[str, str]:
         """
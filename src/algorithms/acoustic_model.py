@@ -0,0 +1,182 @@
+# 声学模型实现代码
+# 文件路径: algorithms/acoustic_model.py
+
+from typing import List, Optional, Sequence
+import os
+
+import numpy as np
+
+
+SAMPLE_RATE = 16000
+FRAME_LENGTH = 400  # 25 ms
+HOP_LENGTH = 160  # 10 ms
+N_FFT = 512
+N_MELS = 40
+LOG_FLOOR = 1e-10
+
+
+def mel_filterbank(
+    sample_rate: int = SAMPLE_RATE, n_fft: int = N_FFT, n_mels: int = N_MELS
+) -> np.ndarray:
+    """Triangular mel filterbank of shape (n_fft // 2 + 1, n_mels)."""
+    def to_mel(hz):
+        return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+    def to_hz(mel):
+        return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+    edges = to_hz(np.linspace(0.0, to_mel(sample_rate / 2), n_mels + 2))
+    bins = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)[:, None]
+    lower, center, upper = edges[:-2], edges[1:-1], edges[2:]
+    rising = (bins - lower) / (center - lower)
+    falling = (upper - bins) / (upper - center)
+    return np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
+
+
+_FILTERBANK = mel_filterbank()
+_WINDOW = np.hanning(FRAME_LENGTH).astype(np.float32)
+
+
+def log_mel_features(samples: np.ndarray) -> np.ndarray:
+    """Log-mel filterbank features, one row per 10 ms frame.
+
+    Args:
+        samples: Mono float32 waveform at SAMPLE_RATE
+
+    Returns:
+        Array of shape (frames, N_MELS); empty if shorter than one frame
+    """
+    if len(samples) < FRAME_LENGTH:
+        return np.zeros((0, N_MELS), dtype=np.float32)
+
+    frames = np.lib.stride_tricks.sliding_window_view(samples, FRAME_LENGTH)[
+        ::HOP_LENGTH
+    ]
+    spectrum = np.fft.rfft(frames * _WINDOW, n=N_FFT)
+    power = spectrum.real ** 2 + spectrum.imag ** 2
+    return np.log(power.astype(np.float32) @ _FILTERBANK + LOG_FLOOR)
+
+
+class GaussianPhoneModel:
+    """Frame-level phone posterior model with one diagonal Gaussian per phone.
+
+    Scores every frame against every phone in a single matrix product, so
+    posteriors for a 30 s answer take a few milliseconds. Any model exposing
+    `phones` and `log_posteriors(samples)` (e.g. a neural acoustic model)
+    can be used by GOPScorer instead.
+
+    Attributes:
+        phones: Phone labels, one per model column
+        path: File the model was loaded from, if any
+    """
+
+    def __init__(
+        self,
+        phones: Sequence[str],
+        means: np.ndarray,
+        variances: np.ndarray,
+        log_priors: Optional[np.ndarray] = None,
+        path: Optional[str] = None,
+    ):
+        self.phones = tuple(phones)
+        self.path = path
+        self.means = np.asarray(means, dtype=np.float32)
+        self.variances = np.asarray(variances, dtype=np.float32)
+        if log_priors is None:
+            log_priors = np.full(len(self.phones), -np.log(len(self.phones)))
+        self.log_priors = np.asarray(log_priors, dtype=np.float32)
+
+        # Expand (x - mu)^2 / var so all frames are scored with one matmul
+        precision = 1.0 / self.variances
+        self._precision = precision
+        self._linear = self.means * precision
+        self._constant = (
+            -0.5
+            * (
+                np.sum(self.means ** 2 * precision, axis=1)
+                + np.sum(np.log(2 * np.pi * self.variances), axis=1)
+            )
+            + self.log_priors
+        )
+
+    @classmethod
+    def fit(
+        cls,
+        features: List[np.ndarray],
+        labels: List[np.ndarray],
+        phones: Sequence[str],
+        variance_floor: float = 1e-2,
+    ) -> "GaussianPhoneModel":
+        """Estimate the model from frame-labelled features.
+
+        Args:
+            features: Feature arrays (frames, N_MELS) per utterance
+            labels: Phone index per frame for each utterance
+            phones: Phone labels indexed by the label values
+            variance_floor: Minimum variance per dimension
+
+        Returns:
+            Fitted model
+        """
+        x = np.concatenate(features)
+        y = np.concatenate(labels)
+        counts = np.bincount(y, minlength=len(phones)).astype(np.float64)
+        if np.any(counts == 0):
+            missing = [phones[i] for i in np.flatnonzero(counts == 0)]
+            raise ValueError(f"No training frames for phones: {missing}")
+
+        sums = np.zeros((len(phones), x.shape[1]))
+        squares = np.zeros((len(phones), x.shape[1]))
+        np.add.at(sums, y, x)
+        np.add.at(squares, y, x.astype(np.float64) ** 2)
+        means = sums / counts[:, None]
+        variances = np.maximum(squares / counts[:, None] - means ** 2, variance_floor)
+
+        return cls(phones, means, variances, np.log(counts / counts.sum()))
+
+    @classmethod
+    def load(cls, path: str) -> "GaussianPhoneModel":
+        """Load a model saved with save()."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                [str(p) for p in data["phones"]],
+                data["means"],
+                data["variances"],
+                data["log_priors"],
+                path=path,
+            )
+
+    def save(self, path: str) -> None:
+        """Save the model as a .npz file."""
+        np.savez(
+            path,
+            phones=np.array(self.phones),
+            means=self.means,
+            variances=self.variances,
+            log_priors=self.log_priors,
+        )
+
+    def log_posteriors(self, samples: np.ndarray) -> np.ndarray:
+        """Log posterior of every phone for every frame.
+
+        Args:
+            samples: Mono float32 waveform at SAMPLE_RATE
+
+        Returns:
+            Array of shape (frames, phones)
+        """
+        x = log_mel_features(samples)
+        log_likelihood = (
+            -0.5 * (x ** 2) @ self._precision.T + x @ self._linear.T + self._constant
+        )
+        peak = log_likelihood.max(axis=1, keepdims=True)
+        log_norm = peak + np.log(
+            np.exp(log_likelihood - peak).sum(axis=1, keepdims=True)
+        )
+        return log_likelihood - log_norm
+
+
+def load_default_model() -> Optional[GaussianPhoneModel]:
+    """Load the acoustic model configured by GOP_MODEL_PATH, if any."""
+    path = os.getenv("GOP_MODEL_PATH")
+    return GaussianPhoneModel.load(path) if path else None
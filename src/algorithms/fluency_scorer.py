@@ -1,7 +1,13 @@
 # 流利度评分器实现代码
 # 文件路径: algorithms/fluency_scorer.py
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
+import numpy as np
+
+from .text_analysis import AnalyzedText
+
+if TYPE_CHECKING:
+    from ai.audio_fetcher import AudioBuffer
 
 
 class FluencyScorer:
@@ -17,20 +23,43 @@ class FluencyScorer:
     OPTIMAL_PAUSE_RATIO = 0.15
     MAX_PAUSE_RATIO = 0.4
 
-    def calculate_fluency_score(self, audio_url: str, text: str) -> Dict[str, Any]:
+    # Energy-based pause detection
+    FRAME_DURATION = 0.02
+    SILENCE_RMS_FLOOR = 0.01
+    SILENCE_RELATIVE_LEVEL = 0.1
+
+    audio_fetcher = None
+
+    def __init__(self, audio_fetcher=None):
+        """Initialize the scorer.
+
+        Args:
+            audio_fetcher: Shared audio fetch layer (optional). When set, the
+                answer audio is loaded from its per-turn PCM cache.
+        """
+        self.audio_fetcher = audio_fetcher
+
+    def calculate_fluency_score(
+        self, audio_url: Union[str, "AudioBuffer"], text: Union[str, AnalyzedText]
+    ) -> Dict[str, Any]:
         """Calculate fluency score.
 
         Args:
-            audio_url: Audio file URL
-            text: Transcript text
+            audio_url: Audio file URL, or an already decoded AudioBuffer
+                (shared read-only, never copied)
+            text: Transcript text, or its shared AnalyzedText
 
         Returns:
             Dict containing fluency metrics
         """
-        words = text.split()
-        word_count = len(words)
+        analysis = AnalyzedText.of(text)
+        word_count = analysis.word_count
 
-        audio_duration = word_count * 0.5 if word_count > 0 else 1.0
+        audio = self._load_audio(audio_url)
+        if audio is not None:
+            audio_duration = audio.duration
+        else:
+            audio_duration = word_count * 0.5 if word_count > 0 else 1.0
 
         if word_count == 0 or audio_duration <= 0:
             return {
@@ -42,16 +71,19 @@ class FluencyScorer:
             }
 
         speech_rate = round((word_count / audio_duration) * 60, 2)
-        pauses = self._detect_pauses(text)
+        if audio is not None:
+            pauses = self._detect_pauses(audio.samples, audio.sample_rate)
+        else:
+            pauses = self._estimate_pauses(analysis)
         pause_count = len(pauses)
         pause_frequency = (
             round(pause_count / (audio_duration / 60), 2) if audio_duration > 0 else 0
         )
 
-        sentences = [s.strip() for s in text.split(".") if s.strip()]
+        sentence_lengths = analysis.sentence_word_counts
         avg_speech_length = (
-            round(sum(len(s.split()) for s in sentences) / len(sentences), 2)
-            if sentences
+            round(sum(sentence_lengths) / len(sentence_lengths), 2)
+            if sentence_lengths
             else 0
         )
 
@@ -66,12 +98,87 @@ class FluencyScorer:
             "pauses": pauses,
         }
 
-    def _detect_pauses(self, transcript: str) -> List[Dict[str, Any]]:
-        """Detect pauses in speech."""
+    def _load_audio(self, audio: Union[str, "AudioBuffer"]) -> Optional["AudioBuffer"]:
+        """Resolve a URL or AudioBuffer to an AudioBuffer (None if unavailable)."""
+        if not isinstance(audio, str):
+            return audio
+        if self.audio_fetcher is None:
+            return None
+        return self.audio_fetcher.load(audio)
+
+    def _detect_pauses(
+        self, samples: np.ndarray, sample_rate: int
+    ) -> List[Dict[str, Any]]:
+        """Detect pauses from frame energies.
+
+        Frames whose RMS falls below an adaptive threshold (relative to the
+        loud frames of the answer, never below an absolute floor) are
+        silent. Silence runs between the first and last speech frame that
+        last at least MIN_PAUSE_DURATION are pauses; runs longer than
+        MAX_PAUSE_DURATION are reported as long pauses. Everything is
+        computed with array operations, no per-frame Python loop.
+
+        Args:
+            samples: Mono float32 waveform in [-1, 1]
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Pauses ordered by start time
+        """
+        frame_length = max(1, int(sample_rate * self.FRAME_DURATION))
+        frame_count = len(samples) // frame_length
+        if frame_count == 0:
+            return []
+
+        frames = samples[: frame_count * frame_length].reshape(
+            frame_count, frame_length
+        )
+        rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_length)
+
+        threshold = max(
+            self.SILENCE_RMS_FLOOR,
+            self.SILENCE_RELATIVE_LEVEL * float(np.percentile(rms, 95)),
+        )
+        silent = rms < threshold
+
+        speech = np.flatnonzero(~silent)
+        if len(speech) == 0:
+            return []
+
+        # Only silence between speech counts; leading/trailing silence does not
+        inner = silent[speech[0]: speech[-1] + 1].astype(np.int8)
+        edges = np.diff(np.concatenate(([0], inner, [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        frame_seconds = frame_length / sample_rate
+        durations = (ends - starts) * frame_seconds
+        keep = durations >= self.MIN_PAUSE_DURATION
+
+        offset = speech[0]
+        pauses = []
+        for position, (start, end, duration) in enumerate(
+            zip(starts[keep], ends[keep], durations[keep])
+        ):
+            pauses.append(
+                {
+                    "position": position,
+                    "start": round(float((start + offset) * frame_seconds), 3),
+                    "end": round(float((end + offset) * frame_seconds), 3),
+                    "duration": round(float(duration), 3),
+                    "type": (
+                        "long_pause" if duration > self.MAX_PAUSE_DURATION else "pause"
+                    ),
+                }
+            )
+
+        return pauses
+
+    def _estimate_pauses(self, analysis: AnalyzedText) -> List[Dict[str, Any]]:
+        """Estimate pauses from sentence boundaries when no audio is available."""
         pauses = []
-        sentences = [s.strip() for s in transcript.split(".") if s.strip()]
 
-        for i in range(len(sentences) - 1):
+        for i in range(analysis.sentence_count - 1):
             pauses.append({"position": i, "duration": 0.5, "type": "sentence_boundary"})
 
         return pauses
@@ -1,7 +1,23 @@
 # GOP发音评分器实现代码
 # 文件路径: algorithms/gop_scorer.py
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple, Union, TYPE_CHECKING
+import logging
+import re
+
+import numpy as np
+
+from .acoustic_model import HOP_LENGTH, SAMPLE_RATE, load_default_model
+from .pronunciation import DEFAULT_DICTIONARY, SILENCE, PronunciationDictionary
+from .text_analysis import AnalyzedText
+
+if TYPE_CHECKING:
+    from ai.audio_fetcher import AudioBuffer
+
+
+logger = logging.getLogger(__name__)
+
+NON_LETTERS = re.compile(r"[^a-z']")
 
 
 class GOPScorer:
@@ -12,21 +28,239 @@ class GOPScorer:
     MIN_SCORE = 0
     MAX_SCORE = 100
 
-    def calculate_gop_score(self, audio_url: str, text: str) -> Dict[str, Any]:
+    audio_fetcher = None
+    # Loaded once at import from GOP_MODEL_PATH; None means audio cannot be
+    # scored and the text estimate is used
+    acoustic_model = load_default_model()
+    dictionary: PronunciationDictionary = DEFAULT_DICTIONARY
+    # The missing model is reported once per process, not once per answer
+    _missing_model_logged = False
+
+    def __init__(self, audio_fetcher=None, acoustic_model=None, dictionary=None):
+        """Initialize the scorer.
+
+        Args:
+            audio_fetcher: Shared audio fetch layer (optional). When set, the
+                answer audio is loaded from its per-turn PCM cache.
+            acoustic_model: Frame-level phone posterior model exposing
+                `phones` and `log_posteriors(samples)`; defaults to the model
+                configured by GOP_MODEL_PATH
+            dictionary: Pronunciation dictionary; defaults to the bundled one
+        """
+        self.audio_fetcher = audio_fetcher
+        if acoustic_model is not None:
+            self.acoustic_model = acoustic_model
+        if dictionary is not None:
+            self.dictionary = dictionary
+
+    def calculate_gop_score(
+        self, audio_url: Union[str, "AudioBuffer"], text: Union[str, AnalyzedText]
+    ) -> Dict[str, Any]:
         """Calculate GOP pronunciation score.
 
+        The transcript is converted to phonemes, force-aligned against the
+        audio, and each phoneme is scored by its average log posterior ratio
+        (the log posterior of the expected phone minus that of the best
+        competing phone, per frame). Without audio or an acoustic model the
+        score is estimated from the text only; the result's `method` tells
+        the two apart ("gop" or "heuristic").
+
         Args:
-            audio_url: Audio file URL
-            text: Reference text
+            audio_url: Audio file URL, or an already decoded AudioBuffer
+                (shared read-only, never copied)
+            text: Reference text, or its shared AnalyzedText
 
         Returns:
-            Dict containing overall_score and phoneme_scores
+            Dict containing overall_score, phoneme_scores, method and, for
+            audio scoring, word_scores
         """
-        words = text.lower().split()
+        words = AnalyzedText.of(text).lower_tokens
+
+        audio = self._load_audio(audio_url)
+        if audio is not None and len(audio) == 0:
+            words = []
 
         if not words:
             return {"overall_score": 0, "phoneme_scores": []}
 
+        if self.acoustic_model is None:
+            self._log_missing_model()
+        elif audio is not None:
+            result = self._score_audio(audio, words)
+            if result is not None:
+                return result
+
+        return self._estimate_from_text(words)
+
+    def _score_audio(
+        self, audio: "AudioBuffer", tokens: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Score pronunciation from audio (None if the audio cannot be aligned)."""
+        if audio.sample_rate != SAMPLE_RATE:
+            return None
+
+        model = self.acoustic_model
+        phone_index = {phone: i for i, phone in enumerate(model.phones)}
+        silence = phone_index.get(SILENCE)
+
+        words = [w for w in (NON_LETTERS.sub("", t) for t in tokens) if w]
+        states, state_words = self._build_states(words, phone_index, silence)
+        if not any(w >= 0 for w in state_words):
+            return None
+
+        log_posteriors = model.log_posteriors(audio.samples)
+        skippable = np.array([w < 0 for w in state_words])
+        if len(log_posteriors) < int(np.sum(~skippable)):
+            return None
+
+        path = self._force_align(log_posteriors, np.array(states), skippable)
+        if path is None:
+            return None
+
+        # Per-frame log posterior ratio of the aligned phone against the best phone
+        frames = np.arange(len(path))
+        aligned = log_posteriors[frames, np.array(states)[path]]
+        ratios = aligned - log_posteriors.max(axis=1)
+
+        # Consecutive frames in the same state form one phone segment
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(path)) + 1))
+        lengths = np.diff(np.append(starts, len(path)))
+        gop = np.add.reduceat(ratios, starts) / lengths
+        segment_states = path[starts]
+
+        spoken = np.array([state_words[s] >= 0 for s in segment_states])
+        scores = np.clip(
+            self.MAX_SCORE * np.exp(gop[spoken]), self.MIN_SCORE, self.MAX_SCORE
+        )
+        segment_words = np.array([state_words[s] for s in segment_states[spoken]])
+        seconds = HOP_LENGTH / SAMPLE_RATE
+
+        phoneme_scores = [
+            {
+                "phoneme": model.phones[states[state]],
+                "word": words[word],
+                "score": round(float(score), 2),
+                "start": round(float(start) * seconds, 2),
+                "end": round(float(start + length) * seconds, 2),
+            }
+            for state, word, score, start, length in zip(
+                segment_states[spoken],
+                segment_words,
+                scores,
+                starts[spoken],
+                lengths[spoken],
+            )
+        ]
+
+        word_totals = np.bincount(
+            segment_words, weights=scores, minlength=len(words)
+        )
+        word_counts = np.bincount(segment_words, minlength=len(words))
+        scored_words = np.flatnonzero(word_counts)
+        word_means = word_totals[scored_words] / word_counts[scored_words]
+        word_scores = [
+            {"word": words[i], "score": round(float(score), 2)}
+            for i, score in zip(scored_words, word_means)
+        ]
+
+        overall_score = (
+            self.PHONEME_WEIGHT * float(scores.mean())
+            + self.WORD_WEIGHT * float(word_means.mean())
+        )
+
+        return {
+            "overall_score": round(overall_score, 2),
+            "phoneme_scores": phoneme_scores,
+            "word_scores": word_scores,
+            "method": "gop",
+        }
+
+    def _build_states(
+        self, words: List[str], phone_index: Dict[str, int], silence: Optional[int]
+    ) -> Tuple[List[int], List[int]]:
+        """Alignment states: the phones of each word, with optional silence
+        before, between and after words.
+
+        Returns:
+            (model phone index per state, word index per state or -1 for silence)
+        """
+        states: List[int] = []
+        state_words: List[int] = []
+        if silence is not None:
+            states.append(silence)
+            state_words.append(-1)
+
+        pronunciations = self.dictionary.phonemes_many(words)
+        for i, phones in enumerate(pronunciations):
+            for phone in phones:
+                if phone in phone_index:
+                    states.append(phone_index[phone])
+                    state_words.append(i)
+            if silence is not None:
+                states.append(silence)
+                state_words.append(-1)
+
+        return states, state_words
+
+    @staticmethod
+    def _force_align(
+        log_posteriors: np.ndarray, states: np.ndarray, skippable: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Viterbi alignment of frames to a left-to-right state sequence.
+
+        Each frame stays in its state or moves to the next one; skippable
+        (silence) states may also be jumped over. All states are updated
+        together per frame.
+
+        Returns:
+            State index per frame, or None if no complete path exists
+        """
+        frames, count = len(log_posteriors), len(states)
+        emissions = log_posteriors[:, states]
+        back = np.zeros((frames, count), dtype=np.int8)
+
+        score = np.full(count, -np.inf)
+        score[0] = emissions[0, 0]
+        if skippable[0] and count > 1:
+            score[1] = emissions[0, 1]
+
+        can_jump = np.zeros(count, dtype=bool)
+        can_jump[2:] = skippable[1:-1]
+        candidates = np.full((3, count), -np.inf)
+        columns = np.arange(count)
+
+        for t in range(1, frames):
+            candidates[0] = score
+            candidates[1, 1:] = score[:-1]
+            candidates[2, 2:] = np.where(can_jump[2:], score[:-2], -np.inf)
+            moves = candidates.argmax(axis=0)
+            score = candidates[moves, columns] + emissions[t]
+            back[t] = moves
+
+        end = count - 1
+        if skippable[end] and count > 1 and score[end - 1] > score[end]:
+            end -= 1
+        if not np.isfinite(score[end]):
+            return None
+
+        path = np.empty(frames, dtype=np.int64)
+        path[-1] = end
+        for t in range(frames - 1, 0, -1):
+            path[t - 1] = path[t] - back[t, path[t]]
+        return path
+
+    @staticmethod
+    def _log_missing_model() -> None:
+        if GOPScorer._missing_model_logged:
+            return
+        GOPScorer._missing_model_logged = True
+        logger.warning(
+            "No acoustic model configured (GOP_MODEL_PATH); pronunciation is "
+            "estimated from the answer text, not scored from audio"
+        )
+
+    def _estimate_from_text(self, words: List[str]) -> Dict[str, Any]:
+        """Text-only estimate used when the audio cannot be scored."""
         phoneme_scores = []
         for word in words[: min(10, len(words))]:
             phoneme_scores.append(
@@ -40,4 +274,16 @@ class GOPScorer:
         )
         overall_score = round(avg_score, 2)
 
-        return {"overall_score": overall_score, "phoneme_scores": phoneme_scores}
+        return {
+            "overall_score": overall_score,
+            "phoneme_scores": phoneme_scores,
+            "method": "heuristic",
+        }
+
+    def _load_audio(self, audio: Union[str, "AudioBuffer"]) -> Optional["AudioBuffer"]:
+        """Resolve a URL or AudioBuffer to an AudioBuffer (None if unavailable)."""
+        if not isinstance(audio, str):
+            return audio
+        if self.audio_fetcher is None:
+            return None
+        return self.audio_fetcher.load(audio)
@@ -0,0 +1,212 @@
+# 语法规则引擎实现代码
+# 文件路径: algorithms/grammar_rules.py
+
+from typing import Dict, Any, List, Optional, Tuple
+import hashlib
+import json
+import os
+import re
+
+from .text_analysis import AnalyzedText
+
+
+DEFAULT_RULES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "grammar_rules.json"
+)
+
+WORD_START = re.compile(r"\w+")
+
+
+class GrammarRule:
+    """A single grammar rule loaded from the rule set."""
+
+    __slots__ = (
+        "index",
+        "id",
+        "error_type",
+        "pattern",
+        "regex",
+        "triggers",
+        "correct_form",
+    )
+
+    def __init__(
+        self,
+        index: int,
+        rule_id: str,
+        error_type: str,
+        pattern: str,
+        triggers: Optional[List[str]] = None,
+        correct_form: str = "",
+    ):
+        self.index = index
+        self.id = rule_id
+        self.error_type = error_type
+        self.pattern = pattern
+        self.regex = re.compile(pattern, re.IGNORECASE)
+        self.triggers = [t.lower() for t in triggers or []]
+        self.correct_form = correct_form
+
+
+class RuleMatch:
+    """A rule match inside an answer."""
+
+    __slots__ = ("rule", "sentence", "start", "end", "text")
+
+    def __init__(
+        self, rule: GrammarRule, sentence: int, start: int, end: int, text: str
+    ):
+        self.rule = rule
+        self.sentence = sentence
+        self.start = start
+        self.end = end
+        self.text = text
+
+
+class GrammarRuleEngine:
+    """Precompiled multi-rule matcher.
+
+    Rules that declare trigger words (the lowercase word a match starts
+    with) are indexed by trigger: scanning an answer walks its words once
+    and only tries the rules keyed by each word, anchored at that word, so
+    the per-answer cost depends on the answer length and the few rules
+    sharing a trigger, not on the size of the rule set. Rules without
+    triggers are each scanned over the sentence with their own finditer,
+    so they should be kept few.
+
+    Each rule reports the same non-overlapping matches it would find on
+    its own with re.finditer, sentence by sentence.
+    """
+
+    def __init__(self, rules: List[GrammarRule], version: Any = None):
+        self.rules = rules
+        self.version = version
+        # Changes whenever a rule does, even if the version field is not bumped
+        self.fingerprint = hashlib.sha256(
+            json.dumps(
+                [
+                    [r.id, r.error_type, r.pattern, r.triggers, r.correct_form]
+                    for r in rules
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+
+        self._by_trigger: Dict[str, List[GrammarRule]] = {}
+        untriggered = []
+        for rule in rules:
+            if rule.triggers:
+                for trigger in rule.triggers:
+                    self._by_trigger.setdefault(trigger, []).append(rule)
+            else:
+                untriggered.append(rule)
+
+        self._untriggered = untriggered
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "GrammarRuleEngine":
+        """Build an engine from a parsed rule set.
+
+        Args:
+            data: {"version": ..., "rules": [{"id", "error_type", "pattern",
+                "triggers"?, "correct_form"?}, ...]}
+
+        Returns:
+            Compiled engine
+
+        Raises:
+            ValueError: If a rule is missing a field or its pattern is invalid
+        """
+        rules = []
+        for index, spec in enumerate(data.get("rules", [])):
+            try:
+                rules.append(
+                    GrammarRule(
+                        index=index,
+                        rule_id=spec["id"],
+                        error_type=spec["error_type"],
+                        pattern=spec["pattern"],
+                        triggers=spec.get("triggers"),
+                        correct_form=spec.get("correct_form", ""),
+                    )
+                )
+            except (KeyError, re.error) as e:
+                raise ValueError(f"Invalid grammar rule #{index}: {e}") from e
+
+        return cls(rules, version=data.get("version"))
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_RULES_PATH) -> "GrammarRuleEngine":
+        """Load and compile a rule set from a JSON file."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_data(json.load(f))
+
+    def scan(self, text: AnalyzedText) -> List[RuleMatch]:
+        """Find all rule matches in an answer.
+
+        Args:
+            text: Analyzed answer
+
+        Returns:
+            Matches ordered by sentence, then rule order, then position
+        """
+        source = text.text
+        matches: List[Tuple[int, int, int, RuleMatch]] = []
+
+        for sentence, (start, end) in enumerate(text.sentence_spans):
+            last_end: Dict[int, int] = {}
+
+            for word in WORD_START.finditer(source, start, end):
+                candidates = self._by_trigger.get(word.group().lower())
+                if not candidates:
+                    continue
+
+                position = word.start()
+                for rule in candidates:
+                    if position < last_end.get(rule.index, start):
+                        continue
+                    found = rule.regex.match(source, position, end)
+                    if found is None:
+                        continue
+                    # Same resume point as re.finditer: after the match, or
+                    # one past it for an empty match
+                    last_end[rule.index] = max(found.end(), position + 1)
+                    matches.append(
+                        (
+                            sentence,
+                            rule.index,
+                            position,
+                            self._match(rule, sentence, found),
+                        )
+                    )
+
+            if self._untriggered:
+                matches.extend(self._scan_untriggered(source, sentence, start, end))
+
+        matches.sort(key=lambda item: item[:3])
+        return [item[3] for item in matches]
+
+    def _scan_untriggered(
+        self, source: str, sentence: int, start: int, end: int
+    ) -> List[Tuple[int, int, int, RuleMatch]]:
+        """Scan a sentence with each untriggered rule on its own.
+
+        Rules are not merged into one alternation: an alternation reports
+        only the first rule matching at a position, losing overlapping
+        matches of the others.
+        """
+        return [
+            (sentence, rule.index, found.start(), self._match(rule, sentence, found))
+            for rule in self._untriggered
+            for found in rule.regex.finditer(source, start, end)
+        ]
+
+    @staticmethod
+    def _match(rule: GrammarRule, sentence: int, found: "re.Match") -> RuleMatch:
+        return RuleMatch(rule, sentence, found.start(), found.end(), found.group())
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+# Compiled once at import; shared by all GrammarScorer instances
+DEFAULT_ENGINE = GrammarRuleEngine.from_file()
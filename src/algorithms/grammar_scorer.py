@@ -1,8 +1,11 @@
 # 语法评分器实现代码
 # 文件路径: algorithms/grammar_scorer.py
 
-from typing import Dict, Any, List
-import re
+from typing import Dict, Any, List, Optional, Union
+import numpy as np
+
+from .grammar_rules import DEFAULT_ENGINE, GrammarRuleEngine
+from .text_analysis import AnalyzedText
 
 
 class GrammarError:
@@ -29,22 +32,38 @@ class GrammarScorer:
         "punctuation_error": "标点错误",
     }
 
-    def calculate_grammar_score(self, text: str) -> Dict[str, Any]:
+    rule_engine: GrammarRuleEngine = DEFAULT_ENGINE
+
+    def __init__(self, rule_engine: Optional[GrammarRuleEngine] = None):
+        """
+        Args:
+            rule_engine: Compiled grammar rules; defaults to the bundled
+                rule set in data/grammar_rules.json
+        """
+        if rule_engine is not None:
+            self.rule_engine = rule_engine
+
+    def calculate_grammar_score(
+        self, text: Union[str, AnalyzedText]
+    ) -> Dict[str, Any]:
         """Calculate grammar score.
 
         Args:
-            text: Transcript text
+            text: Transcript text, or its shared AnalyzedText
 
         Returns:
             Dict containing grammar metrics
         """
-        errors = self._detect_grammar_errors(text)
+        analysis = AnalyzedText.of(text)
+        sentences = analysis.sentences
+        errors = self._detect_grammar_errors(analysis)
 
         if not errors:
             return {"overall_score": 100, "errors": [], "sentence_variety": 1.0}
 
-        sentences = self._split_sentences(text)
-        sentence_variety = self._calculate_sentence_variety(sentences)
+        sentence_variety = self._calculate_sentence_variety(
+            analysis.sentence_word_counts
+        )
 
         error_list = []
         for error in errors:
@@ -72,45 +91,99 @@ class GrammarScorer:
             "sentence_variety": sentence_variety,
         }
 
-    def _detect_grammar_errors(self, transcript: str) -> List[GrammarError]:
-        """Detect grammar errors (simplified version)."""
-        errors = []
+    def calculate_grammar_score_batch(
+        self, texts: List[Union[str, AnalyzedText]]
+    ) -> List[Dict[str, Any]]:
+        """Calculate grammar scores for many texts at once.
+
+        Each text is scanned once by the rule engine; sentence variety and
+        scores are computed with bincount over sentence-to-text ids. Results
+        are identical to calling calculate_grammar_score on each text.
+
+        Args:
+            texts: Transcript texts or their AnalyzedText
+
+        Returns:
+            Grammar metrics in input order
+        """
+        analyses = [AnalyzedText.of(text) for text in texts]
+        sentence_counts = np.array(
+            [analysis.sentence_count for analysis in analyses], dtype=np.int64
+        )
+        text_ids = np.repeat(np.arange(len(texts)), sentence_counts)
+
+        errors_by_text: List[List[Dict[str, Any]]] = [
+            [
+                {
+                    "error_type": match.rule.error_type,
+                    "position": match.sentence,
+                    "correct_form": match.rule.correct_form,
+                    "error_text": match.text,
+                }
+                for match in self.rule_engine.scan(analysis)
+            ]
+            for analysis in analyses
+        ]
+
+        # Sentence variety from per-text sentence length variance
+        lengths = np.array(
+            [n for analysis in analyses for n in analysis.sentence_word_counts],
+            dtype=np.float64,
+        )
+        safe_counts = np.maximum(sentence_counts, 1)
+        mean_length = (
+            np.bincount(text_ids, weights=lengths, minlength=len(texts)) / safe_counts
+        )
+        deviations = (lengths - mean_length[text_ids]) ** 2
+        variance = (
+            np.bincount(text_ids, weights=deviations, minlength=len(texts))
+            / safe_counts
+        )
+        sentence_variety = np.where(
+            sentence_counts < 3,
+            0.5,
+            np.select([variance > 5, variance > 2], [1.0, 0.8], 0.6),
+        )
 
-        sentences = self._split_sentences(transcript)
+        error_counts = np.array([len(e) for e in errors_by_text], dtype=np.float64)
+        base_score = np.maximum(0, 100 - (error_counts / safe_counts) * 30)
+        raw_score = base_score + np.minimum(10, sentence_variety * 10)
 
-        basic_patterns = [
-            (r"\b(he|she|it)\s+\b(is|are|was)", "subject_verb_agreement"),
-            (r"\b(am|is|are)\s+not\b", "negation_error"),
-            (r"\bthe\s+(cat|dog|car)s\b", "noun_verb_agreement"),
-            (r"\ba\b(an|the)\s+cat\b", "article_error"),
+        results = []
+        for i, errors in enumerate(errors_by_text):
+            if not errors:
+                results.append(
+                    {"overall_score": 100, "errors": [], "sentence_variety": 1.0}
+                )
+                continue
+
+            results.append(
+                {
+                    "overall_score": max(0, min(100, round(float(raw_score[i]), 2))),
+                    "errors": errors,
+                    "sentence_variety": float(sentence_variety[i]),
+                }
+            )
+
+        return results
+
+    def _detect_grammar_errors(self, analysis: AnalyzedText) -> List[GrammarError]:
+        """Detect grammar errors with the compiled rule set."""
+        return [
+            GrammarError(
+                error_type=match.rule.error_type,
+                position=match.sentence,
+                correct_form=match.rule.correct_form,
+                error_text=match.text,
+            )
+            for match in self.rule_engine.scan(analysis)
         ]
 
-        for sentence_idx, sentence in enumerate(sentences):
-            for pattern, error_type in basic_patterns:
-                matches = list(re.finditer(pattern, sentence, re.IGNORECASE))
-                for match in matches:
-                    errors.append(
-                        GrammarError(
-                            error_type=error_type,
-                            position=sentence_idx,
-                            correct_form="",
-                            error_text=match.group(),
-                        )
-                    )
-
-        return errors
-
-    def _split_sentences(self, transcript: str) -> List[str]:
-        """Split text into sentences."""
-        sentences = [s.strip() for s in transcript.split(".") if s.strip()]
-        return sentences
-
-    def _calculate_sentence_variety(self, sentences: List[str]) -> float:
-        """Calculate sentence variety."""
-        if len(sentences) < 3:
+    def _calculate_sentence_variety(self, sentence_lengths: List[int]) -> float:
+        """Calculate sentence variety from per-sentence word counts."""
+        if len(sentence_lengths) < 3:
             return 0.5
 
-        sentence_lengths = [len(s.split()) for s in sentences]
         avg_length = sum(sentence_lengths) / len(sentence_lengths)
         variance = sum((l - avg_length) ** 2 for l in sentence_lengths) / len(
             sentence_lengths
@@ -0,0 +1,165 @@
+# 关键词自动机实现代码
+# 文件路径: algorithms/keyword_automaton.py
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+from bisect import bisect_right
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Lowercase a keyword and collapse its inner whitespace."""
+    return " ".join(keyword.lower().split())
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over normalized keywords.
+
+    Built once per keyword set; find() reports every occurrence of every
+    keyword, including multi-word keywords, in one left-to-right pass over
+    the text, so the cost of a scan depends on the text length and not on
+    the number of keywords.
+
+    Attributes:
+        keywords: Normalized keywords, indexed by keyword id
+        tags: Set of tags for each keyword id (e.g. "domain", "major")
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            keywords: (keyword, tag) pairs; a keyword may carry several tags
+        """
+        self.keywords: List[str] = []
+        self.tags: List[frozenset] = []
+        ids: Dict[str, int] = {}
+        tags: List[set] = []
+
+        for keyword, tag in keywords:
+            keyword = normalize_keyword(keyword)
+            if not keyword:
+                continue
+            if keyword not in ids:
+                ids[keyword] = len(self.keywords)
+                self.keywords.append(keyword)
+                tags.append(set())
+            tags[ids[keyword]].add(tag)
+        self.tags = [frozenset(t) for t in tags]
+        self._lengths = [len(keyword) for keyword in self.keywords]
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        """Build the trie, then failure links and merged outputs breadth-first."""
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (keyword_id,)
+
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] += self._output[self._fail[next_state]]
+                queue.append(next_state)
+
+    def find(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield (start, end, keyword_id) for every keyword occurrence.
+
+        Args:
+            text: Normalized (lowercase) text
+
+        Yields:
+            Occurrences in order of their end offset
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        lengths = self._lengths
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword_id in output[state]:
+                yield position + 1 - lengths[keyword_id], position + 1, keyword_id
+
+    def scan_tokens(self, tokens: List[str]) -> "TokenMatches":
+        """Scan lowercase tokens joined by single spaces.
+
+        Args:
+            tokens: Lowercase whitespace-separated tokens of the answer
+
+        Returns:
+            Matches mapped back to token indices
+        """
+        return TokenMatches(self, tokens)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+class TokenMatches:
+    """Keyword occurrences of one scan, mapped back to answer tokens."""
+
+    __slots__ = ("automaton", "token_count", "occurrences")
+
+    def __init__(self, automaton: KeywordAutomaton, tokens: List[str]):
+        self.automaton = automaton
+        self.token_count = len(tokens)
+
+        starts = []
+        offset = 0
+        for token in tokens:
+            starts.append(offset)
+            offset += len(token) + 1
+
+        # (first_token, last_token, whole_tokens, keyword_id)
+        self.occurrences: List[Tuple[int, int, bool, int]] = []
+        text = " ".join(tokens)
+        for start, end, keyword_id in automaton.find(text):
+            first = bisect_right(starts, start) - 1
+            last = bisect_right(starts, end - 1) - 1
+            whole = starts[first] == start and (
+                end == len(text) or text[end] == " "
+            )
+            self.occurrences.append((first, last, whole, keyword_id))
+
+    def covered_tokens(self, tag: str, whole_tokens: bool) -> int:
+        """Count tokens covered by occurrences of keywords carrying tag.
+
+        Args:
+            tag: Keyword tag to count
+            whole_tokens: Only count occurrences spanning whole tokens;
+                otherwise a keyword inside a token (e.g. "data" in
+                "database") also counts
+
+        Returns:
+            Number of distinct tokens covered
+        """
+        tags = self.automaton.tags
+        covered = set()
+        for first, last, whole, keyword_id in self.occurrences:
+            if tag in tags[keyword_id] and (whole or not whole_tokens):
+                covered.update(range(first, last + 1))
+        return len(covered)
+
+    def keywords(self, tag: str) -> List[Tuple[int, str]]:
+        """Return (first_token, keyword) for whole-token occurrences with tag."""
+        tags, keywords = self.automaton.tags, self.automaton.keywords
+        return [
+            (first, keywords[keyword_id])
+            for first, _, whole, keyword_id in self.occurrences
+            if whole and tag in tags[keyword_id]
+        ]
@@ -0,0 +1,199 @@
+# 院校知识库实现代码
+# 文件路径: algorithms/knowledge_base.py
+
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from .keyword_automaton import KeywordAutomaton, normalize_keyword
+
+
+DEFAULT_KNOWLEDGE_BASE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "university_knowledge.json"
+)
+
+logger = logging.getLogger(__name__)
+
+
+class KnowledgeBase:
+    """Immutable snapshot of the university/major knowledge base.
+
+    Keywords are normalized and every automaton is built when the snapshot
+    is created, so lookups on the scoring path are plain dict reads and a
+    snapshot can be shared by any number of threads without locking.
+
+    Attributes:
+        version: Version string of the source file
+        fingerprint: SHA-256 of the content, changes even if the version
+            field is not bumped
+        universities: University -> {"domain": [...], "keywords": [...]}
+        majors: Major -> [keywords]
+    """
+
+    def __init__(
+        self,
+        version: str,
+        universities: Dict[str, Dict[str, List[str]]],
+        majors: Dict[str, List[str]],
+    ):
+        self.version = version
+        self.fingerprint = self._fingerprint(
+            {"version": version, "universities": universities, "majors": majors}
+        )
+        self.universities: Mapping[str, Mapping[str, Tuple[str, ...]]] = (
+            MappingProxyType(
+                {
+                    name: MappingProxyType(
+                        {
+                            "domain": self._normalize(info.get("domain", [])),
+                            "keywords": self._normalize(info.get("keywords", [])),
+                        }
+                    )
+                    for name, info in universities.items()
+                }
+            )
+        )
+        self.majors: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {name: self._normalize(keywords) for name, keywords in majors.items()}
+        )
+
+        self._university_automata = {
+            name: KeywordAutomaton(
+                [(kw, "domain") for kw in info["domain"]]
+                + [(kw, "keyword") for kw in info["keywords"]]
+            )
+            for name, info in self.universities.items()
+        }
+        self._major_automata = {
+            name: KeywordAutomaton(
+                [(kw, "major") for kw in keywords]
+                + [(kw, "keyword") for kw in keywords]
+            )
+            for name, keywords in self.majors.items()
+        }
+        self._empty = KeywordAutomaton([])
+
+    @staticmethod
+    def _fingerprint(data: Dict[str, Any]) -> str:
+        canonical = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _normalize(keywords: List[str]) -> Tuple[str, ...]:
+        return tuple(kw for kw in map(normalize_keyword, keywords) if kw)
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "KnowledgeBase":
+        """Build a snapshot from a parsed knowledge base file.
+
+        Args:
+            data: {"version": ..., "universities": {...}, "majors": {...}}
+
+        Returns:
+            Knowledge base snapshot
+
+        Raises:
+            ValueError: If a required section is missing
+        """
+        try:
+            return cls(
+                version=str(data["version"]),
+                universities=data["universities"],
+                majors=data["majors"],
+            )
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid knowledge base: {e}") from e
+
+    @classmethod
+    def from_file(cls, path: str) -> "KnowledgeBase":
+        """Load a snapshot from a JSON file."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_data(json.load(f))
+
+    def university_automaton(self, university: Optional[str]) -> KeywordAutomaton:
+        """Automaton for a university's domain and keywords (empty if unknown)."""
+        return self._university_automata.get(university, self._empty)
+
+    def major_automaton(self, major: Optional[str]) -> KeywordAutomaton:
+        """Automaton for a major's keywords (empty if unknown)."""
+        return self._major_automata.get(major, self._empty)
+
+
+class KnowledgeBaseStore:
+    """Holds the current KnowledgeBase and swaps it on reload.
+
+    Readers take `store.current` once per answer and use that snapshot
+    throughout, so a concurrent reload never mixes two versions within one
+    score. Publishing a new snapshot is a single reference assignment; the
+    lock only serializes reloads against each other.
+    """
+
+    def __init__(self, path: str = DEFAULT_KNOWLEDGE_BASE_PATH):
+        self.path = path
+        self._reload_lock = threading.Lock()
+        self._signature = self._stat()
+        self.current: KnowledgeBase = KnowledgeBase.from_file(path)
+
+    def _stat(self) -> Optional[Tuple[float, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def reload(self) -> KnowledgeBase:
+        """Load the file again and publish the new snapshot.
+
+        Returns:
+            The newly published snapshot
+
+        Raises:
+            OSError, ValueError: If the file cannot be read or is invalid;
+                the current snapshot stays in place
+        """
+        with self._reload_lock:
+            signature = self._stat()
+            snapshot = KnowledgeBase.from_file(self.path)
+            self._signature = signature
+            self.current = snapshot
+            return snapshot
+
+    def reload_if_changed(self) -> bool:
+        """Reload only if the file changed since the last load.
+
+        Returns:
+            Whether a new snapshot was published
+        """
+        if self._stat() == self._signature:
+            return False
+        self.reload()
+        return True
+
+    async def watch(self, interval: float) -> None:
+        """Poll the file and reload it when it changes.
+
+        Args:
+            interval: Seconds between checks
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if await asyncio.to_thread(self.reload_if_changed):
+                    logger.info(
+                        "Reloaded knowledge base %s (version %s)",
+                        self.path,
+                        self.current.version,
+                    )
+            except (OSError, ValueError) as e:
+                logger.warning("Keeping previous knowledge base: %s", e)
+
+
+# Loaded once at import; shared by all UniversityMatchScorer instances
+DEFAULT_KNOWLEDGE_BASE = KnowledgeBaseStore(
+    os.getenv("KNOWLEDGE_BASE_PATH") or DEFAULT_KNOWLEDGE_BASE_PATH
+)
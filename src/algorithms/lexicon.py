@@ -0,0 +1,209 @@
+# 词汇分级词典实现代码
+# 文件路径: algorithms/lexicon.py
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import hashlib
+import os
+import sys
+
+import numpy as np
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_LEXICON_PATH = os.path.join(DATA_DIR, "lexicon.npy")
+DEFAULT_LEXICON_SOURCE = os.path.join(DATA_DIR, "lexicon.tsv")
+
+# Band codes stored per entry; 0 means the word is not in the lexicon
+CEFR_BANDS = ("A1", "A2", "B1", "B2", "C1", "C2")
+UNKNOWN_BAND = 0
+BAND_CODES = {band: code for code, band in enumerate(CEFR_BANDS, start=1)}
+
+WORD_WIDTH = 24
+ENTRY_DTYPE = np.dtype(
+    [("word", f"S{WORD_WIDTH}"), ("band", "u1"), ("academic", "u1")]
+)
+
+# Inflection endings tried when a token is not itself a lemma
+LEMMA_SUFFIXES = (
+    ("ies", "y"),
+    ("ied", "y"),
+    ("ily", "y"),
+    ("ing", ""),
+    ("ing", "e"),
+    ("ed", ""),
+    ("ed", "e"),
+    ("es", ""),
+    ("s", ""),
+    ("ly", ""),
+)
+
+
+class Lexicon:
+    """CEFR band and academic-word lexicon stored as a sorted array.
+
+    Entries are fixed-width ASCII lemmas sorted bytewise, so the file can be
+    memory-mapped read-only (every worker shares the same pages) and a whole
+    token list is resolved with one vectorized searchsorted. Tokens that are
+    not lemmas fall back to a few inflection rules (e.g. "analyzed" ->
+    "analyze").
+
+    Attributes:
+        path: File the entries are mapped from, if any
+        fingerprint: SHA-256 of the entries, changes whenever the data does
+    """
+
+    def __init__(self, entries: np.ndarray, path: Optional[str] = None):
+        self._entries = entries
+        self._words = entries["word"]
+        self.path = path
+        self.fingerprint = hashlib.sha256(np.ascontiguousarray(entries)).hexdigest()
+
+    @classmethod
+    def open(cls, path: str = DEFAULT_LEXICON_PATH) -> "Lexicon":
+        """Memory-map a compiled lexicon file."""
+        entries = np.load(path, mmap_mode="r", allow_pickle=False)
+        if entries.dtype != ENTRY_DTYPE:
+            raise ValueError(
+                f"Unexpected lexicon format in {path}: {entries.dtype}"
+            )
+        return cls(entries, path=path)
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, str, bool]]) -> "Lexicon":
+        """Build an in-memory lexicon.
+
+        Args:
+            entries: (lemma, CEFR band, academic) triples; later duplicates
+                override earlier ones
+
+        Returns:
+            Lexicon
+
+        Raises:
+            ValueError: On an unknown band or a lemma that is not short ASCII
+        """
+        records: Dict[bytes, Tuple[int, int]] = {}
+        for word, band, academic in entries:
+            if band not in BAND_CODES:
+                raise ValueError(f"Unknown CEFR band {band!r} for {word!r}")
+            key = word.strip().lower().encode("ascii")
+            if not key or len(key) > WORD_WIDTH:
+                raise ValueError(
+                    f"Lemma must be 1-{WORD_WIDTH} characters: {word!r}"
+                )
+            records[key] = (BAND_CODES[band], int(bool(academic)))
+
+        array = np.array(
+            [(word, band, academic) for word, (band, academic) in records.items()],
+            dtype=ENTRY_DTYPE,
+        )
+        array.sort(order="word")
+        return cls(array)
+
+    @classmethod
+    def from_tsv(cls, path: str) -> "Lexicon":
+        """Build a lexicon from "lemma<TAB>band<TAB>academic" lines."""
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                word, band, academic = line.split("\t")
+                entries.append((word, band, academic == "1"))
+        return cls.build(entries)
+
+    def save(self, path: str) -> None:
+        """Write the lexicon in the memory-mappable format."""
+        np.save(path, np.ascontiguousarray(self._entries), allow_pickle=False)
+
+    def _find(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (entry index, found mask) for fixed-width byte keys."""
+        if len(self._words) == 0:
+            return np.zeros(len(keys), dtype=np.int64), np.zeros(len(keys), bool)
+        index = np.searchsorted(self._words, keys)
+        index = np.minimum(index, len(self._words) - 1)
+        return index, self._words[index] == keys
+
+    def lookup(self, tokens: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Resolve tokens to CEFR band codes and academic flags.
+
+        Args:
+            tokens: Lowercase alphabetic tokens
+
+        Returns:
+            (bands, academic): uint8 band code per token (0 if unknown) and a
+            bool academic-word flag per token
+        """
+        if not len(tokens):
+            return np.zeros(0, dtype=np.uint8), np.zeros(0, dtype=bool)
+
+        # Each distinct token is resolved once
+        unique, inverse = np.unique(
+            np.asarray(tokens, dtype=str), return_inverse=True
+        )
+        unique_bands, unique_academic = self._lookup_unique(unique)
+        return unique_bands[inverse], unique_academic[inverse]
+
+    def _lookup_unique(self, words: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        fits = np.char.str_len(words) <= WORD_WIDTH
+        keys = np.char.encode(words, "ascii", "replace")
+        # Non-ASCII words (e.g. "café") are not in the lexicon
+        plain = np.char.decode(keys, "ascii") == words
+        index, found = self._find(keys.astype(f"S{WORD_WIDTH}"))
+        found &= fits & plain
+
+        # Inflected forms: try lemma candidates for the misses only
+        for i in np.flatnonzero(~found & plain):
+            for candidate in self._lemma_candidates(str(words[i])):
+                key = np.array([candidate], dtype=f"S{WORD_WIDTH}")
+                candidate_index, candidate_found = self._find(key)
+                if candidate_found[0]:
+                    index[i], found[i] = candidate_index[0], True
+                    break
+
+        bands = np.where(found, self._entries["band"][index], UNKNOWN_BAND)
+        academic = found & (self._entries["academic"][index] == 1)
+        return bands.astype(np.uint8), academic
+
+    @staticmethod
+    def _lemma_candidates(word: str) -> List[bytes]:
+        candidates = []
+        for suffix, replacement in LEMMA_SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                stem = word[: -len(suffix)]
+                candidates.append(stem + replacement)
+                # "running" -> "run", "planned" -> "plan"
+                doubled = stem[-1] == stem[-2]
+                if doubled and not replacement and suffix in ("ing", "ed"):
+                    candidates.append(stem[:-1])
+        return [
+            c.encode("ascii", "ignore") for c in candidates if len(c) <= WORD_WIDTH
+        ]
+
+    def band(self, word: str) -> Optional[str]:
+        """CEFR band of a single word, or None if unknown."""
+        code = int(self.lookup([word.lower()])[0][0])
+        return CEFR_BANDS[code - 1] if code else None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Memory-mapped once at import; shared by all VocabularyScorer instances
+DEFAULT_LEXICON = Lexicon.open(os.getenv("LEXICON_PATH") or DEFAULT_LEXICON_PATH)
+
+
+def main(argv: List[str]) -> int:
+    """Compile a TSV source: python -m src.algorithms.lexicon build SRC OUT"""
+    if len(argv) != 3 or argv[0] != "build":
+        print("usage: python -m src.algorithms.lexicon build SOURCE.tsv OUTPUT.npy")
+        return 2
+    lexicon = Lexicon.from_tsv(argv[1])
+    lexicon.save(argv[2])
+    print(f"Wrote {len(lexicon)} lemmas to {argv[2]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,333 @@
+# 发音词典实现代码
+# 文件路径: algorithms/pronunciation.py
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from collections import OrderedDict
+import hashlib
+import os
+import re
+import sys
+import threading
+
+import numpy as np
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_DICTIONARY_PATH = os.path.join(DATA_DIR, "pronunciations.npy")
+DEFAULT_DICTIONARY_SOURCE = os.path.join(DATA_DIR, "pronunciations.dict")
+
+# ARPAbet phone set without stress markers, plus silence
+PHONES = (
+    "AA", "AE", "AH", "AO", "AW", "AY", "B", "CH", "D", "DH", "EH", "ER", "EY",
+    "F", "G", "HH", "IH", "IY", "JH", "K", "L", "M", "N", "NG", "OW", "OY", "P",
+    "R", "S", "SH", "T", "TH", "UH", "UW", "V", "W", "Y", "Z", "ZH",
+)  # fmt: skip
+SILENCE = "SIL"
+
+# Phones are stored as 1-based codes into PHONES; 0 pads unused slots
+PHONE_CODES = {phone: code for code, phone in enumerate(PHONES, start=1)}
+WORD_WIDTH = 32
+MAX_PHONES = 20
+ENTRY_DTYPE = np.dtype(
+    [("word", f"S{WORD_WIDTH}"), ("phones", "u1", (MAX_PHONES,))]
+)
+
+STRESS = re.compile(r"\d")
+
+# Letter-to-sound rules for words missing from the dictionary, longest
+# grapheme first
+LETTER_TO_SOUND = (
+    ("tion", ("SH", "AH", "N")),
+    ("sion", ("ZH", "AH", "N")),
+    ("ture", ("CH", "ER")),
+    ("igh", ("AY",)),
+    ("tch", ("CH",)),
+    ("ch", ("CH",)),
+    ("sh", ("SH",)),
+    ("th", ("TH",)),
+    ("ph", ("F",)),
+    ("ng", ("NG",)),
+    ("ck", ("K",)),
+    ("qu", ("K", "W")),
+    ("wh", ("W",)),
+    ("ee", ("IY",)),
+    ("ea", ("IY",)),
+    ("oo", ("UW",)),
+    ("ai", ("EY",)),
+    ("ay", ("EY",)),
+    ("oa", ("OW",)),
+    ("ou", ("AW",)),
+    ("ow", ("OW",)),
+    ("oi", ("OY",)),
+    ("oy", ("OY",)),
+    ("au", ("AO",)),
+    ("aw", ("AO",)),
+    ("er", ("ER",)),
+    ("ir", ("ER",)),
+    ("ur", ("ER",)),
+    ("ar", ("AA", "R")),
+    ("or", ("AO", "R")),
+    ("a", ("AE",)),
+    ("b", ("B",)),
+    ("c", ("K",)),
+    ("d", ("D",)),
+    ("e", ("EH",)),
+    ("f", ("F",)),
+    ("g", ("G",)),
+    ("h", ("HH",)),
+    ("i", ("IH",)),
+    ("j", ("JH",)),
+    ("k", ("K",)),
+    ("l", ("L",)),
+    ("m", ("M",)),
+    ("n", ("N",)),
+    ("o", ("AA",)),
+    ("p", ("P",)),
+    ("q", ("K",)),
+    ("r", ("R",)),
+    ("s", ("S",)),
+    ("t", ("T",)),
+    ("u", ("AH",)),
+    ("v", ("V",)),
+    ("w", ("W",)),
+    ("x", ("K", "S")),
+    ("y", ("Y",)),
+    ("z", ("Z",)),
+)
+
+
+def letter_to_sound(word: str) -> Tuple[str, ...]:
+    """Rule-based phoneme guess for an out-of-vocabulary word.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        ARPAbet phonemes (empty for words without letters)
+    """
+    word = re.sub(r"[^a-z]", "", word.lower())
+    # Silent final "e" ("make"), but not in short words ("he")
+    if len(word) > 3 and word.endswith("e") and not word.endswith("ee"):
+        word = word[:-1]
+
+    phones: List[str] = []
+    i = 0
+    while i < len(word):
+        for grapheme, sounds in LETTER_TO_SOUND:
+            if word.startswith(grapheme, i):
+                if grapheme == "c" and word[i + 1 : i + 2] in ("e", "i", "y"):
+                    sounds = ("S",)
+                elif grapheme == "y":
+                    sounds = ("Y",) if i == 0 else ("IY",)
+                # Doubled consonants are pronounced once ("ll", "ss")
+                if not phones or len(grapheme) > 1 or phones[-1] != sounds[-1]:
+                    phones.extend(sounds)
+                i += len(grapheme)
+                break
+    return tuple(phones)
+
+
+class RuleBasedG2P:
+    """Grapheme-to-phoneme model built on the letter_to_sound rules.
+
+    Any object with a `predict(word)` method returning ARPAbet phones (e.g. a
+    trained sequence model) can be given to PronunciationDictionary instead.
+    """
+
+    def predict(self, word: str) -> Tuple[str, ...]:
+        return letter_to_sound(word)
+
+
+class PronunciationDictionary:
+    """Word to phoneme lookups backed by a sorted, memory-mappable array.
+
+    Entries are fixed-width ASCII words with up to MAX_PHONES phone codes,
+    sorted bytewise, so a compiled dictionary is memory-mapped read-only and
+    every worker process shares the same pages. Words missing from the
+    dictionary are predicted by a G2P model; predictions are kept in a
+    bounded LRU so repeated out-of-vocabulary words are predicted once.
+
+    Attributes:
+        path: File the entries are mapped from, if any
+        fingerprint: SHA-256 of the entries, changes whenever the data does
+        g2p: Model predicting phones for out-of-vocabulary words
+    """
+
+    def __init__(
+        self,
+        entries: np.ndarray,
+        path: Optional[str] = None,
+        g2p=None,
+        cache_size: int = 10000,
+    ):
+        self._entries = entries
+        self._words = entries["word"]
+        self.path = path
+        self.fingerprint = hashlib.sha256(np.ascontiguousarray(entries)).hexdigest()
+        self.g2p = g2p if g2p is not None else RuleBasedG2P()
+        self.cache_size = cache_size
+
+        self._lock = threading.Lock()
+        self._predicted: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+        self.cache_hits = 0
+        self.predictions = 0
+
+    @classmethod
+    def open(
+        cls, path: str = DEFAULT_DICTIONARY_PATH, **kwargs
+    ) -> "PronunciationDictionary":
+        """Memory-map a compiled dictionary file."""
+        entries = np.load(path, mmap_mode="r", allow_pickle=False)
+        if entries.dtype != ENTRY_DTYPE:
+            raise ValueError(
+                f"Unexpected pronunciation dictionary format in {path}: "
+                f"{entries.dtype}"
+            )
+        return cls(entries, path=path, **kwargs)
+
+    @classmethod
+    def build(
+        cls, entries: Iterable[Tuple[str, Sequence[str]]], **kwargs
+    ) -> "PronunciationDictionary":
+        """Build an in-memory dictionary.
+
+        Args:
+            entries: (word, phones) pairs; the first pronunciation of a word
+                wins
+
+        Returns:
+            PronunciationDictionary
+
+        Raises:
+            ValueError: On an unknown phone, a word that is not short ASCII,
+                or a pronunciation longer than MAX_PHONES
+        """
+        records: Dict[bytes, List[int]] = {}
+        for word, phones in entries:
+            key = word.strip().lower().encode("ascii")
+            if not key or len(key) > WORD_WIDTH:
+                raise ValueError(
+                    f"Word must be 1-{WORD_WIDTH} characters: {word!r}"
+                )
+            if len(phones) > MAX_PHONES:
+                raise ValueError(f"More than {MAX_PHONES} phones for {word!r}")
+            unknown = [p for p in phones if p not in PHONE_CODES]
+            if unknown:
+                raise ValueError(f"Unknown phones {unknown} for {word!r}")
+            records.setdefault(key, [PHONE_CODES[p] for p in phones])
+
+        array = np.zeros(len(records), dtype=ENTRY_DTYPE)
+        for i, (word, codes) in enumerate(records.items()):
+            array["word"][i] = word
+            array["phones"][i, : len(codes)] = codes
+        array.sort(order="word")
+        return cls(array, **kwargs)
+
+    @classmethod
+    def from_file(
+        cls, path: str = DEFAULT_DICTIONARY_SOURCE, **kwargs
+    ) -> "PronunciationDictionary":
+        """Build a dictionary from a CMUdict-format file ("WORD  PH PH ...");
+        stress markers and alternate pronunciations are dropped."""
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith(";;;"):
+                    continue
+                word, *phones = line.split()
+                if re.search(r"\(\d+\)$", word):
+                    continue
+                entries.append((word, [STRESS.sub("", p) for p in phones]))
+        return cls.build(entries, **kwargs)
+
+    def save(self, path: str) -> None:
+        """Write the dictionary in the memory-mappable format."""
+        np.save(path, np.ascontiguousarray(self._entries), allow_pickle=False)
+
+    def lookup(self, word: str) -> Optional[Tuple[str, ...]]:
+        """Dictionary pronunciation of a word, or None if missing."""
+        return self.lookup_many([word])[0]
+
+    def lookup_many(self, words: Sequence[str]) -> List[Optional[Tuple[str, ...]]]:
+        """Dictionary pronunciations of several words in one search.
+
+        Args:
+            words: Words (any case)
+
+        Returns:
+            Phones per word, None for words missing from the dictionary
+        """
+        keys = [word.lower().encode("ascii", "replace") for word in words]
+        if not keys or len(self._words) == 0:
+            return [None] * len(keys)
+
+        fits = np.array([0 < len(k) <= WORD_WIDTH for k in keys])
+        keys = np.array(keys, dtype=f"S{WORD_WIDTH}")
+        index = np.minimum(np.searchsorted(self._words, keys), len(self._words) - 1)
+        found = fits & (self._words[index] == keys)
+        codes = self._entries["phones"][index]
+
+        return [
+            tuple(PHONES[c - 1] for c in row if c) if hit else None
+            for row, hit in zip(codes.tolist(), found)
+        ]
+
+    def phonemes(self, word: str) -> Tuple[str, ...]:
+        """Pronunciation of a word, predicted by the G2P model if missing."""
+        return self.phonemes_many([word])[0]
+
+    def phonemes_many(self, words: Sequence[str]) -> List[Tuple[str, ...]]:
+        """Pronunciations of several words, predicting any that are missing."""
+        return [
+            phones if phones is not None else self._predict(word.lower())
+            for word, phones in zip(words, self.lookup_many(words))
+        ]
+
+    def _predict(self, word: str) -> Tuple[str, ...]:
+        """G2P prediction for an out-of-vocabulary word, memoized in an LRU."""
+        with self._lock:
+            phones = self._predicted.get(word)
+            if phones is not None:
+                self._predicted.move_to_end(word)
+                self.cache_hits += 1
+                return phones
+
+        phones = tuple(self.g2p.predict(word))
+
+        with self._lock:
+            self.predictions += 1
+            self._predicted[word] = phones
+            self._predicted.move_to_end(word)
+            while len(self._predicted) > self.cache_size:
+                self._predicted.popitem(last=False)
+        return phones
+
+    def __contains__(self, word: str) -> bool:
+        return self.lookup(word) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Memory-mapped once at import; shared by all GOPScorer instances
+DEFAULT_DICTIONARY = PronunciationDictionary.open(
+    os.getenv("PRONUNCIATION_DICT_PATH") or DEFAULT_DICTIONARY_PATH
+)
+
+
+def main(argv: List[str]) -> int:
+    """Compile a CMUdict source: python -m src.algorithms.pronunciation build"""
+    if len(argv) != 3 or argv[0] != "build":
+        print(
+            "usage: python -m src.algorithms.pronunciation build "
+            "SOURCE.dict OUTPUT.npy"
+        )
+        return 2
+    dictionary = PronunciationDictionary.from_file(argv[1])
+    dictionary.save(argv[2])
+    print(f"Wrote {len(dictionary)} words to {argv[2]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
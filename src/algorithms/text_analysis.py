@@ -0,0 +1,81 @@
+# 文本分析实现代码
+# 文件路径: algorithms/text_analysis.py
+
+from typing import List, Tuple, Union
+import re
+
+
+WORD_PATTERN = re.compile(r"\b[a-zA-Z]+\b")
+
+
+class AnalyzedText:
+    """Tokenized view of an answer shared by all scorers.
+
+    Built once per answer so that every scorer reads the same tokens,
+    lowercase forms and sentence spans instead of re-splitting the text.
+
+    Attributes:
+        text: Original text
+        tokens: Whitespace-separated tokens
+        lower_tokens: Lowercase form of each token
+        words: Alphabetic words (lowercase, length > 1) for vocabulary analysis
+        sentence_spans: (start, end) offsets of each non-empty sentence in text,
+            sentences being split on "." and stripped
+        sentences: Sentence strings matching sentence_spans
+        sentence_word_counts: Number of tokens in each sentence
+    """
+
+    __slots__ = (
+        "text",
+        "tokens",
+        "lower_tokens",
+        "words",
+        "sentence_spans",
+        "sentences",
+        "sentence_word_counts",
+    )
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[str] = text.split()
+        self.lower_tokens: List[str] = text.lower().split()
+        self.words: List[str] = [
+            w for w in WORD_PATTERN.findall(text.lower()) if len(w) > 1
+        ]
+
+        self.sentence_spans: List[Tuple[int, int]] = []
+        self.sentences: List[str] = []
+        self.sentence_word_counts: List[int] = []
+
+        start = 0
+        for part in text.split("."):
+            stripped = part.strip()
+            if stripped:
+                begin = start + len(part) - len(part.lstrip())
+                self.sentence_spans.append((begin, begin + len(stripped)))
+                self.sentences.append(stripped)
+                self.sentence_word_counts.append(len(stripped.split()))
+            start += len(part) + 1
+
+    @classmethod
+    def of(cls, text: Union[str, "AnalyzedText"]) -> "AnalyzedText":
+        """Return text unchanged if already analyzed, otherwise analyze it."""
+        if isinstance(text, str):
+            return cls(text)
+        return text
+
+    @property
+    def word_count(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentences)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return (
+            f"AnalyzedText(tokens={self.word_count}, sentences={self.sentence_count})"
+        )
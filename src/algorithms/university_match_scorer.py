@@ -1,97 +1,145 @@
 # 院校匹配评分器实现代码
 # 文件路径: algorithms/university_match_scorer.py
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
+
+from .keyword_automaton import KeywordAutomaton
+from .knowledge_base import DEFAULT_KNOWLEDGE_BASE, KnowledgeBaseStore
+from .text_analysis import AnalyzedText
 
 
 class UniversityMatchScorer:
     """University match scorer"""
 
-    XI_AN_UNIVERSITIES = {
-        "西安交通大学": {
-            "domain": [
-                "engineering",
-                "computer",
-                "technology",
-                "mechanical",
-                "materials",
-            ],
-            "keywords": ["innovation", "robotics", "aerospace", "energy"],
-        },
-        "西北工业大学": {
-            "domain": ["aeronautics", "materials", "marine", "computer"],
-            "keywords": ["design", "simulation", "testing"],
-        },
-        "西安电子科技大学": {
-            "domain": ["electronics", "communication", "information", "technology"],
-            "keywords": [
-                "integrated circuit",
-                "microchip",
-                "semiconductor",
-                "signal processing",
-            ],
-        },
-        "西北大学": {
-            "domain": [
-                "archaeology",
-                "history",
-                "literature",
-                "philosophy",
-                "economics",
-            ],
-            "keywords": ["cultural heritage", "ancient", "research methodology"],
-        },
-    }
-
-    MAJOR_KEYWORDS = {
-        "计算机科学与技术": [
-            "computer",
-            "programming",
-            "algorithm",
-            "software",
-            "data",
-            "network",
-            "AI",
-            "machine learning",
-        ],
-        "电子工程": ["circuit", "chip", "hardware", "embedded", "VLSI", "FPGA"],
-        "机械工程": [
-            "mechanical",
-            "design",
-            "CAD",
-            "manufacturing",
-            "materials",
-            "robotics",
-        ],
-        "材料科学": [
-            "materials",
-            "properties",
-            "nanotechnology",
-            "polymer",
-            "composite",
-            "metallurgy",
-        ],
-    }
+    knowledge_base: KnowledgeBaseStore = DEFAULT_KNOWLEDGE_BASE
+
+    def __init__(self, knowledge_base: Optional[KnowledgeBaseStore] = None):
+        """
+        Args:
+            knowledge_base: Store holding the university/major knowledge base;
+                defaults to the bundled data/university_knowledge.json
+        """
+        if knowledge_base is not None:
+            self.knowledge_base = knowledge_base
 
     def calculate_match_score(
-        self, answer: str, university: str, major: str
+        self, answer: Union[str, AnalyzedText], university: str, major: str
     ) -> Dict[str, Any]:
         """Calculate university match score.
 
         Args:
-            answer: Answer text
+            answer: Answer text, or its shared AnalyzedText
             university: Target university
             major: Target major
 
         Returns:
             Dict containing match details
         """
-        words = answer.lower().split()
+        knowledge_base = self.knowledge_base.current
+        return self._score(
+            AnalyzedText.of(answer).lower_tokens,
+            university,
+            major,
+            knowledge_base.university_automaton(university),
+            knowledge_base.major_automaton(major),
+        )
+
+    def calculate_match_score_batch(
+        self,
+        answers: List[Union[str, AnalyzedText]],
+        universities: List[Optional[str]],
+        majors: List[Optional[str]],
+    ) -> List[Dict[str, Any]]:
+        """Calculate university match scores for many answers at once.
 
-        domain_match_score = self._match_university_domain(words, university)
-        major_match_score = self._match_major_domain(words, major)
-        matched_keywords = self._extract_matched_keywords(words, university, major)
+        Answers are grouped by (university, major) so each group looks up
+        its automata once; every answer is then a single linear scan. The
+        whole batch is scored against one knowledge base snapshot. Results
+        are identical to calling calculate_match_score on each answer.
 
+        Args:
+            answers: Answer texts or their AnalyzedText
+            universities: Target university per answer
+            majors: Target major per answer
+
+        Returns:
+            Match details in input order
+        """
+        groups: Dict[tuple, List[int]] = {}
+        for i, key in enumerate(zip(universities, majors)):
+            groups.setdefault(key, []).append(i)
+
+        knowledge_base = self.knowledge_base.current
+        results: List[Optional[Dict[str, Any]]] = [None] * len(answers)
+        for (university, major), indices in groups.items():
+            university_automaton = knowledge_base.university_automaton(university)
+            major_automaton = knowledge_base.major_automaton(major)
+            for i in indices:
+                results[i] = self._score(
+                    AnalyzedText.of(answers[i]).lower_tokens,
+                    university,
+                    major,
+                    university_automaton,
+                    major_automaton,
+                )
+
+        return results
+
+    def _score(
+        self,
+        words: List[str],
+        university: str,
+        major: str,
+        university_automaton: KeywordAutomaton,
+        major_automaton: KeywordAutomaton,
+    ) -> Dict[str, Any]:
+        """Score one answer from a scan with each automaton.
+
+        Domain keywords must cover whole tokens, major keywords may also
+        appear inside a token (e.g. "data" in "database"), and matched
+        keywords are whole-token occurrences of single- or multi-word
+        keywords in answer order.
+        """
+        university_matches = university_automaton.scan_tokens(words)
+        major_matches = major_automaton.scan_tokens(words)
+
+        if words:
+            domain_match_score = min(
+                100,
+                university_matches.covered_tokens("domain", whole_tokens=True)
+                / len(words)
+                * 100,
+            )
+            major_match_score = min(
+                100,
+                major_matches.covered_tokens("major", whole_tokens=False)
+                / len(words)
+                * 100,
+            )
+        else:
+            domain_match_score, major_match_score = 0, 0
+
+        occurrences = sorted(
+            set(
+                university_matches.keywords("keyword")
+                + major_matches.keywords("keyword")
+            )
+        )
+        matched_keywords = [keyword for _, keyword in occurrences]
+
+        return self._build_result(
+            university, major, domain_match_score, major_match_score, matched_keywords
+        )
+
+    def _build_result(
+        self,
+        university: str,
+        major: str,
+        domain_match_score: float,
+        major_match_score: float,
+        matched_keywords: List[str],
+    ) -> Dict[str, Any]:
+        """Combine match components into the result dict."""
         overall_score = round((domain_match_score + major_match_score) / 2, 2)
         relevance = self._determine_relevance(overall_score)
 
@@ -118,49 +166,6 @@ class UniversityMatchScorer:
             "suggestions": suggestions,
         }
 
-    def _match_university_domain(self, words: List[str], university: str) -> float:
-        """Match university domain keywords."""
-        university_info = self.XI_AN_UNIVERSITIES.get(
-            university, {"domain": [], "keywords": []}
-        )
-        domain_keywords = set([kw.lower() for kw in university_info["domain"]])
-
-        words_lower = [w.lower() for w in words]
-        matches = sum(1 for w in words_lower if w in domain_keywords)
-
-        if not words:
-            return 0
-
-        match_ratio = matches / len(words)
-        return min(100, match_ratio * 100)
-
-    def _match_major_domain(self, words: List[str], major: str) -> float:
-        """Match major domain keywords."""
-        major_keywords = set([kw.lower() for kw in self.MAJOR_KEYWORDS.get(major, [])])
-
-        words_lower = [w.lower() for w in words]
-        matches = sum(1 for w in words_lower if any(kw in w for kw in major_keywords))
-
-        if not words:
-            return 0
-
-        match_ratio = matches / len(words)
-        return min(100, match_ratio * 100)
-
-    def _extract_matched_keywords(
-        self, words: List[str], university: str, major: str
-    ) -> List[str]:
-        """Extract matched keywords."""
-        university_info = self.XI_AN_UNIVERSITIES.get(university, {"keywords": []})
-        major_info = self.MAJOR_KEYWORDS.get(major, [])
-
-        all_keywords = set(university_info["keywords"] + major_info)
-
-        words_lower = [w.lower() for w in words]
-        matched = [w for w in words_lower if w in all_keywords]
-
-        return matched
-
     def _determine_relevance(self, score: float) -> str:
         """Determine relevance level."""
         if score >= 85:
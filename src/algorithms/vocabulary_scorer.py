@@ -1,8 +1,11 @@
 # 词汇评分器实现代码
 # 文件路径: algorithms/vocabulary_scorer.py
 
-from typing import Dict, Any, List
-import re
+from typing import Dict, Any, List, Optional, Union
+import numpy as np
+
+from .lexicon import BAND_CODES, CEFR_BANDS, DEFAULT_LEXICON, Lexicon
+from .text_analysis import AnalyzedText
 
 
 class VocabularyScorer:
@@ -11,53 +14,41 @@ class VocabularyScorer:
     BASIC_WORDS = set(
         ["the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "of", "is"]
     )
-    ADVANCED_WORDS = set(
-        [
-            "analyze",
-            "evaluate",
-            "implement",
-            "comprehensive",
-            "sophisticated",
-            "perspective",
-            "consequently",
-            "furthermore",
-            "nevertheless",
-        ]
-    )
-    ACADEMIC_WORDS = set(
-        [
-            "hypothesis",
-            "methodology",
-            "theoretical",
-            "empirical",
-            "quantitative",
-            "qualitative",
-            "subsequently",
-        ]
-    )
+    # Words at or above this CEFR band, or academic words at B2 and above,
+    # count as advanced vocabulary
+    ADVANCED_BAND = BAND_CODES["C1"]
+    ACADEMIC_BAND = BAND_CODES["B2"]
+
+    lexicon: Lexicon = DEFAULT_LEXICON
+
+    def __init__(self, lexicon: Optional[Lexicon] = None):
+        """
+        Args:
+            lexicon: CEFR lexicon; defaults to the bundled data/lexicon.npy
+        """
+        if lexicon is not None:
+            self.lexicon = lexicon
 
-    def calculate_vocabulary_score(self, text: str) -> Dict[str, Any]:
+    def calculate_vocabulary_score(
+        self, text: Union[str, AnalyzedText]
+    ) -> Dict[str, Any]:
         """Calculate vocabulary score.
 
         Args:
-            text: Transcript text
+            text: Transcript text, or its shared AnalyzedText
 
         Returns:
             Dict containing vocabulary metrics
         """
-        words = self._extract_words(text)
+        words = AnalyzedText.of(text).words
 
         if not words:
-            return {
-                "overall_score": 0,
-                "diversity": 0,
-                "advanced_words": [],
-                "word_count": 0,
-            }
+            return self._empty_result()
 
         word_count = len(words)
         unique_words = len(set(words))
-        advanced_words_found = self._identify_advanced_words(words)
+        bands, academic = self.lexicon.lookup(words)
+        advanced_words_found = self._identify_advanced_words(words, bands, academic)
         word_diversity = self._calculate_diversity(words)
 
         score = self._calculate_vocabulary_score(
@@ -70,20 +61,98 @@ class VocabularyScorer:
             "diversity": round(word_diversity, 2),
             "advanced_words": advanced_words_found,
             "word_count": word_count,
+            "cefr_profile": self._cefr_profile(bands),
         }
 
-    def _extract_words(self, transcript: str) -> List[str]:
-        """Extract words from transcript."""
-        words = re.findall(r"\b[a-zA-Z]+\b", transcript.lower())
-        return [w for w in words if len(w) > 1]
-
-    def _identify_advanced_words(self, words: List[str]) -> List[str]:
-        """Identify advanced vocabulary."""
-        advanced_words = []
-        for word in words:
-            if word in self.ADVANCED_WORDS or word in self.ACADEMIC_WORDS:
-                advanced_words.append(word)
-        return advanced_words
+    def calculate_vocabulary_score_batch(
+        self, texts: List[Union[str, AnalyzedText]]
+    ) -> List[Dict[str, Any]]:
+        """Calculate vocabulary scores for many texts at once.
+
+        Each text is tokenized once and all words of the batch are resolved
+        with a single lexicon lookup; the scoring arithmetic runs as array
+        operations over the whole batch. Results are identical to calling
+        calculate_vocabulary_score on each text.
+
+        Args:
+            texts: Transcript texts or their AnalyzedText
+
+        Returns:
+            Vocabulary metrics in input order
+        """
+        word_lists = [AnalyzedText.of(text).words for text in texts]
+        bands, academic = self.lexicon.lookup(
+            [word for words in word_lists for word in words]
+        )
+        splits = np.cumsum([len(words) for words in word_lists])[:-1]
+        band_lists = np.split(bands, splits)
+        academic_lists = np.split(academic, splits)
+        advanced_lists = [
+            self._identify_advanced_words(words, b, a)
+            for words, b, a in zip(word_lists, band_lists, academic_lists)
+        ]
+
+        word_count = np.array([len(words) for words in word_lists], dtype=np.float64)
+        unique_count = np.array(
+            [len(set(words)) for words in word_lists], dtype=np.float64
+        )
+        advanced_count = np.array([len(a) for a in advanced_lists], dtype=np.float64)
+
+        diversity = np.zeros(len(texts))
+        long_texts = word_count > 10
+        diversity[long_texts] = unique_count[long_texts] / word_count[long_texts] * 100
+
+        base_score = np.select([word_count < 10, word_count < 30], [30, 60], 80)
+        score = (
+            base_score
+            + np.minimum(20, diversity * 0.2)
+            + np.minimum(20, advanced_count * 2)
+        )
+        score = np.minimum(100, np.maximum(0, score))
+
+        results = []
+        for i, words in enumerate(word_lists):
+            if not words:
+                results.append(self._empty_result())
+                continue
+
+            results.append(
+                {
+                    "overall_score": round(float(score[i]), 2),
+                    "diversity": round(float(diversity[i]), 2),
+                    "advanced_words": advanced_lists[i],
+                    "word_count": len(words),
+                    "cefr_profile": self._cefr_profile(band_lists[i]),
+                }
+            )
+
+        return results
+
+    def _identify_advanced_words(
+        self, words: List[str], bands: np.ndarray, academic: np.ndarray
+    ) -> List[str]:
+        """Identify advanced vocabulary from per-word CEFR bands."""
+        advanced = (bands >= self.ADVANCED_BAND) | (
+            academic & (bands >= self.ACADEMIC_BAND)
+        )
+        return [words[i] for i in np.flatnonzero(advanced)]
+
+    @staticmethod
+    def _cefr_profile(bands: np.ndarray) -> Dict[str, int]:
+        """Count words per CEFR band ("unknown" for words not in the lexicon)."""
+        counts = np.bincount(bands, minlength=len(CEFR_BANDS) + 1)
+        profile = {band: int(counts[code]) for band, code in BAND_CODES.items()}
+        profile["unknown"] = int(counts[0])
+        return profile
+
+    def _empty_result(self) -> Dict[str, Any]:
+        return {
+            "overall_score": 0,
+            "diversity": 0,
+            "advanced_words": [],
+            "word_count": 0,
+            "cefr_profile": self._cefr_profile(np.zeros(0, dtype=np.uint8)),
+        }
 
     def _calculate_diversity(self, words: List[str]) -> float:
         """Calculate vocabulary diversity."""
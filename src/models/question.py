@@ -2,7 +2,7 @@
 # 文件路径: models/question.py
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from enum import Enum
 from pydantic import BaseModel
 from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, JSON, SQLEnum
@@ -39,6 +39,25 @@ class QuestionCategory(str, Enum):
     GENERAL = "general"  # 通用
 
 
+def prerendered_audio_url(
+    audio_urls: Optional[Dict[str, Any]],
+    style: str,
+    key: Optional[str] = None
+) -> Optional[str]:
+    """
+    从题目的 audio_urls 中取预渲染语音URL
+
+    Args:
+        audio_urls: {style: {key, url}}
+        style: TTS风格
+        key: 期望的TTS缓存键，传入时仅在内容未变化时返回
+    """
+    entry = (audio_urls or {}).get(style)
+    if not entry or (key is not None and entry.get("key") != key):
+        return None
+    return entry.get("url")
+
+
 class Question(Base):
     """题目数据库模型"""
     __tablename__ = "questions"
@@ -63,6 +82,7 @@ class Question(Base):
     tags = Column(JSON, comment="标签列表")
     keywords = Column(JSON, comment="关键词列表，用于追问")
     style_tags = Column(JSON, comment="导师风格标签")
+    audio_urls = Column(JSON, comment="预渲染题目语音，按TTS风格存储 {style: {key, url}}")
     usage_count = Column(Integer, default=0, comment="使用次数")
     avg_score = Column(Integer, comment="平均得分")
     is_active = Column(Boolean, default=True, comment="是否激活")
@@ -88,6 +108,21 @@ class Question(Base):
             else:
                 self.avg_score = (self.avg_score * (self.usage_count - 1) + score) / self.usage_count
 
+    def get_audio_url(self, style: str, key: Optional[str] = None) -> Optional[str]:
+        """
+        获取预渲染的题目语音URL
+
+        Args:
+            style: TTS风格
+            key: 期望的TTS缓存键，传入时仅在内容未变化时返回
+        """
+        return prerendered_audio_url(self.audio_urls, style, key)
+
+    def set_audio_url(self, style: str, key: str, url: str):
+        """记录预渲染的题目语音"""
+        # 重新赋值以触发JSON列的变更检测
+        self.audio_urls = {**(self.audio_urls or {}), style: {"key": key, "url": url}}
+
 
 class QuestionCreate(BaseModel):
     """题目创建DTO"""
@@ -121,10 +156,15 @@ class QuestionResponse(BaseModel):
     style_tags: Optional[List[str]]
     is_premium: bool
     created_at: datetime
+    audio_urls: Optional[Dict[str, Any]] = None
 
     class Config:
         from_attributes = True
 
+    def get_audio_url(self, style: str, key: Optional[str] = None) -> Optional[str]:
+        """获取预渲染的题目语音URL（同 Question.get_audio_url）"""
+        return prerendered_audio_url(self.audio_urls, style, key)
+
 
 class QuestionRecommend(BaseModel):
     """题目推荐DTO"""
@@ -179,6 +219,21 @@ class QuestionRepository:
         # return questions, total
         pass
 
+    @staticmethod
+    def iter_active_questions(batch_size: int = 200):
+        """按批遍历所有激活题目"""
+        page = 1
+        while True:
+            questions, total = QuestionRepository.list_questions(
+                is_active=True,
+                page=page,
+                page_size=batch_size
+            )
+            yield from questions
+            if page * batch_size >= total:
+                break
+            page += 1
+
     @staticmethod
     def get_recommend_questions(
         user_id: str,
@@ -1,39 +1,60 @@
 # 练习服务伪代码
 # 文件路径: services/practice_service.py
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+import asyncio
+import json
 from models.practice import (
     PracticeSession, PracticeTurn,
     SessionCreate, SessionResponse, TurnResponse,
     PracticeMode, PressureLevel, SessionStatus, PracticeRepository
 )
 from models.user import User, UserRepository
-from models.question import Question, QuestionRepository
+from models.question import Question, QuestionResponse, QuestionRepository
 from models.tutor_style import TutorStyle, TutorStyleRepository
 from services.question_service import QuestionService, QuestionCategoryManager
 from services.scoring_service import ScoringService
+from services.turn_pipeline import TurnPipeline, StageCallback
 from ai.asr_service import ASRService
+from ai.streaming_asr import StreamingRecognizer
 from ai.tts_service import TTSService
+from ai.text_stream import iter_sentences
+from ai.audio_sink import AudioSink, WebSocketAudioSink
+from ai.audio_fetcher import AudioFetcher
 from ai.llm_service import LLMService
 
 
 class PracticeService:
     """练习服务"""
 
+    FEEDBACK_MODES = ("combined", "stream", "separate")
+
     def __init__(
         self,
         question_service: QuestionService,
         scoring_service: ScoringService,
         asr_service: ASRService,
         tts_service: TTSService,
-        llm_service: LLMService
+        llm_service: LLMService,
+        audio_fetcher: Optional[AudioFetcher] = None,
+        feedback_mode: str = "combined"
     ):
         self.question_service = question_service
         self.scoring_service = scoring_service
         self.asr_service = asr_service
         self.tts_service = tts_service
         self.llm_service = llm_service
+        # 与ASR、评分器共享的音频获取层（每轮结束后释放解码缓存）
+        self.audio_fetcher = audio_fetcher
+        # 反馈与追问的生成方式：
+        #   combined 一次调用生成反馈和追问（结构化输出，每轮一次LLM调用）
+        #   stream   反馈逐句生成并立即合成语音，追问单独生成（首句语音更早，
+        #            每轮两次LLM调用）
+        #   separate 反馈全文生成后再合成语音，追问单独生成
+        if feedback_mode not in self.FEEDBACK_MODES:
+            raise ValueError(f"Unknown feedback mode: {feedback_mode}")
+        self.feedback_mode = feedback_mode
 
     def create_session(self, user_id: str, session_data: SessionCreate) -> Dict[str, Any]:
         """
@@ -75,11 +96,8 @@ class PracticeService:
         if first_question is None:
             raise ValueError("No questions available")
 
-        # 5. 合成题目语音
-        question_audio_url = self.tts_service.synthesize(
-            text=first_question.content,
-            style="academic"
-        )
+        # 5. 获取题目语音（优先使用预渲染结果）
+        question_audio_url = self._get_question_audio_url(first_question, "academic")
 
         # 6. 返回会话信息
         return {
@@ -106,9 +124,69 @@ class PracticeService:
         turn_id: str,
         audio_url: str,
         duration: int
+    ) -> Dict[str, Any]:
+        """
+        提交答案（同步接口）
+
+        仅供没有运行中事件循环的调用方（脚本、同步任务）使用，
+        异步代码（API路由、WebSocket处理器）应直接 await submit_answer_async。
+
+        Raises:
+            RuntimeError: 在事件循环中调用时
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "submit_answer() cannot be called from a running event loop; "
+                "await submit_answer_async() instead"
+            )
+
+        return asyncio.run(self.submit_answer_async(
+            session_id=session_id,
+            turn_id=turn_id,
+            audio_url=audio_url,
+            duration=duration
+        ))
+
+    async def submit_answer_async(
+        self,
+        session_id: str,
+        turn_id: str,
+        audio_url: str,
+        duration: int,
+        on_stage: Optional[StageCallback] = None,
+        feedback_audio_sink: Optional[AudioSink] = None,
+        asr_result: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         提交答案
+
+        各阶段按依赖关系流水线执行。合并生成模式（默认）下反馈和追问
+        由一次LLM调用返回：
+            transcript -> score -> feedback -> feedback_text -> feedback_audio
+                                           -> follow_up
+        流式反馈和分别生成模式下追问单独生成，在转写完成后即开始，
+        与评分、反馈生成和反馈语音合成并行：
+            transcript -> score -> feedback_text -> feedback_audio
+            transcript -> follow_up
+        流式反馈模式下反馈文本逐句生成，每句完成即送入语音合成，
+        第一句语音在全文生成完毕前即可播放。
+        所有分支完成后再持久化本轮结果。
+
+        Args:
+            session_id: 会话ID
+            turn_id: 轮次ID
+            audio_url: 回答音频URL
+            duration: 回答时长（秒）
+            on_stage: 阶段完成回调，参数为 (阶段名, 阶段结果)
+            feedback_audio_sink: 反馈语音的音频块接收端，合成时逐块转发
+            asr_result: 已有的转写结果（如流式识别已完成），传入时跳过ASR
+
+        Returns:
+            本轮结果
         """
         # 1. 获取会话和轮次
         session = PracticeRepository.get_session_by_id(session_id)
@@ -118,45 +196,153 @@ class PracticeService:
         if session.status != SessionStatus.ONGOING:
             raise ValueError("Session is not ongoing")
 
-        # 2. ASR转写
-        asr_result = self.asr_service.transcribe(audio_url=audio_url)
-
-        # 3. 获取题目
         turn = PracticeRepository.get_turn_by_id(turn_id)
         if turn is None:
             raise ValueError("Turn not found")
 
-        # 4. 评分
-        score_result = self.scoring_service.evaluate(
-            question=turn.question,
-            answer=asr_result["text"],
-            audio_url=audio_url,
-            university=session.university,
-            major=session.major
-        )
+        # 与转写并行预先下载并解码音频，评分器直接命中解码缓存
+        audio_prefetch = None
+        if self.audio_fetcher is not None:
+            audio_prefetch = asyncio.ensure_future(self.audio_fetcher.load_async(audio_url))
 
-        # 5. 生成反馈
-        feedback = self.llm_service.generate_feedback(
-            question=turn.question,
-            answer=asr_result["text"],
-            score=score_result
-        )
+        # 2. ASR转写
+        async def transcribe() -> Dict[str, Any]:
+            if asr_result is not None:
+                return asr_result
+            return await self.asr_service.transcribe_async(audio_url=audio_url)
+
+        # 3. 评分
+        async def score(asr_result: Dict[str, Any]) -> Dict[str, Any]:
+            # 预取成功时各声学评分器共享同一份解码后的波形，
+            # 失败时退回URL，由各评分维度自行重试或降级
+            audio = audio_url
+            if audio_prefetch is not None:
+                prefetched, = await asyncio.gather(audio_prefetch, return_exceptions=True)
+                if not isinstance(prefetched, BaseException):
+                    audio = prefetched
+            return await self.scoring_service.evaluate_async(
+                question=turn.question,
+                answer=asr_result["text"],
+                audio_url=audio,
+                university=session.university,
+                major=session.major
+            )
 
-        # 6. 合成反馈语音
-        feedback_audio_url = self.tts_service.synthesize(
-            text=feedback,
-            style=self._get_tts_style(session.pressure_level)
-        )
+        # 4. 生成反馈
+        async def feedback_text(
+            asr_result: Dict[str, Any],
+            score_result: Dict[str, Any]
+        ) -> str:
+            return await self.llm_service.generate_feedback_async(
+                question=turn.question,
+                answer=asr_result["text"],
+                score=score_result
+            )
 
-        # 7. 生成追问
-        follow_up_questions = self.llm_service.generate_follow_up(
-            question=turn.question,
-            answer=asr_result["text"],
-            pressure_level=session.pressure_level,
-            tutor_style_id=session.tutor_style_id
-        )
+        # 5. 合成反馈语音
+        async def feedback_audio(feedback: str) -> str:
+            return await self.tts_service.synthesize(
+                text=feedback,
+                style=self._get_tts_style(session.pressure_level),
+                sink=feedback_audio_sink
+            )
 
-        # 8. 更新轮次
+        # 4-5. 流式反馈：LLM输出按句切分，每句经队列立即交给语音合成
+        sentence_queue: asyncio.Queue = asyncio.Queue()
+
+        async def streamed_feedback_text(
+            asr_result: Dict[str, Any],
+            score_result: Dict[str, Any]
+        ) -> str:
+            sentences = []
+            try:
+                tokens = self.llm_service.stream_feedback_async(
+                    question=turn.question,
+                    answer=asr_result["text"],
+                    score=score_result
+                )
+                async for sentence in iter_sentences(tokens):
+                    sentences.append(sentence)
+                    sentence_queue.put_nowait(sentence)
+            finally:
+                sentence_queue.put_nowait(None)
+            return " ".join(sentences)
+
+        async def feedback_sentences():
+            while True:
+                sentence = await sentence_queue.get()
+                if sentence is None:
+                    return
+                yield sentence
+
+        async def streamed_feedback_audio(asr_result: Dict[str, Any]) -> Optional[str]:
+            return await self.tts_service.synthesize_stream(
+                feedback_sentences(),
+                style=self._get_tts_style(session.pressure_level),
+                sink=feedback_audio_sink
+            )
+
+        # 6. 生成追问（只依赖转写结果）
+        async def follow_up(asr_result: Dict[str, Any]) -> List[str]:
+            return await self.llm_service.generate_follow_up_async(
+                question=turn.question,
+                answer=asr_result["text"],
+                pressure_level=session.pressure_level,
+                tutor_style_id=session.tutor_style_id
+            )
+
+        # 4-6. 合并生成：一次调用同时返回反馈和追问
+        async def combined_feedback(
+            asr_result: Dict[str, Any],
+            score_result: Dict[str, Any]
+        ) -> Dict[str, Any]:
+            return await self.llm_service.generate_feedback_and_follow_up_async(
+                question=turn.question,
+                answer=asr_result["text"],
+                score=score_result,
+                pressure_level=session.pressure_level,
+                tutor_style_id=session.tutor_style_id
+            )
+
+        async def combined_feedback_text(result: Dict[str, Any]) -> str:
+            return result["feedback"]
+
+        async def combined_follow_up(result: Dict[str, Any]) -> List[str]:
+            return result["follow_up_questions"]
+
+        pipeline = TurnPipeline(on_stage=on_stage)
+        pipeline.add_stage("transcript", transcribe)
+        pipeline.add_stage("score", score, "transcript")
+        if self.feedback_mode == "combined":
+            pipeline.add_stage("feedback", combined_feedback, "transcript", "score")
+            pipeline.add_stage("feedback_text", combined_feedback_text, "feedback")
+            pipeline.add_stage("follow_up", combined_follow_up, "feedback")
+            pipeline.add_stage("feedback_audio", feedback_audio, "feedback_text")
+        elif self.feedback_mode == "stream":
+            pipeline.add_stage("follow_up", follow_up, "transcript")
+            pipeline.add_stage(
+                "feedback_text", streamed_feedback_text, "transcript", "score"
+            )
+            # 与反馈文本同时启动，逐句消费
+            pipeline.add_stage("feedback_audio", streamed_feedback_audio, "transcript")
+        else:
+            pipeline.add_stage("follow_up", follow_up, "transcript")
+            pipeline.add_stage("feedback_text", feedback_text, "transcript", "score")
+            pipeline.add_stage("feedback_audio", feedback_audio, "feedback_text")
+        try:
+            stages = await pipeline.run()
+        finally:
+            if audio_prefetch is not None:
+                await asyncio.gather(audio_prefetch, return_exceptions=True)
+                self.audio_fetcher.release(audio_url)
+
+        asr_result = stages["transcript"]
+        score_result = stages["score"]
+        feedback = stages["feedback_text"]
+        feedback_audio_url = stages["feedback_audio"]
+        follow_up_questions = stages["follow_up"]
+
+        # 7. 更新轮次
         turn.update_score(score_result)
         turn.user_answer_text = asr_result["text"]
         turn.asr_result = asr_result["text"]
@@ -165,15 +351,15 @@ class PracticeService:
         turn.follow_up_questions = follow_up_questions
         PracticeRepository.update_turn(turn)
 
-        # 9. 更新会话
+        # 8. 更新会话
         session.increment_question()
         PracticeRepository.update_session(session)
 
-        # 10. 检查是否完成
+        # 9. 检查是否完成
         if session.is_finished():
             self._complete_session(session_id)
 
-        # 11. 返回结果
+        # 10. 返回结果
         return {
             "turn_id": turn_id,
             "score": score_result,
@@ -210,10 +396,10 @@ class PracticeService:
         if next_question is None:
             return None
 
-        # 4. 合成语音
-        question_audio_url = self.tts_service.synthesize(
-            text=next_question.content,
-            style=self._get_tts_style(session.pressure_level)
+        # 4. 获取题目语音（优先使用预渲染结果）
+        question_audio_url = self._get_question_audio_url(
+            next_question,
+            self._get_tts_style(session.pressure_level)
         )
 
         # 5. 创建新轮次
@@ -303,6 +489,22 @@ class PracticeService:
         report_service = ReportService(self.scoring_service)
         report_service.generate_report(session_id)
 
+    def _get_question_audio_url(self, question: QuestionResponse, style: str) -> str:
+        """
+        获取题目语音URL
+
+        题目内容与风格参数未变化、且预渲染的语音仍在缓存中时直接使用，
+        否则（未预渲染、内容变化或已被淘汰）现场合成。
+        """
+        key = self.tts_service.cache_key(question.content, style)
+        audio_url = question.get_audio_url(style, key)
+        if audio_url is not None:
+            audio_url = self.tts_service.available_url(key, audio_url)
+        if audio_url is not None:
+            return audio_url
+
+        return self.tts_service.synthesize_sync(text=question.content, style=style)
+
     def _get_tts_style(self, pressure_level: int) -> str:
         """
         获取TTS风格
@@ -320,21 +522,105 @@ class WebSocketPracticeHandler:
 
     def __init__(self, practice_service: PracticeService):
         self.practice_service = practice_service
+        # 进行中的流式识别（按 (会话ID, 轮次ID)；轮次ID由客户端提供，
+        # 不同会话可能重复）。answer_end 或 close_session 时移除
+        self.streams: Dict[Tuple[str, str], StreamingRecognizer] = {}
 
-    async def handle_message(self, session_id: str, message: Dict[str, Any]) -> Dict[str, Any]:
+    async def serve(self, session_id: str, websocket):
+        """
+        处理一个会话的WebSocket连接直到客户端断开
+
+        文本帧为JSON消息，交给 handle_message 并回复其结果；二进制帧为
+        答题过程中上传的PCM音频块，归属最近一次消息或回复中的 turn_id。
+        连接断开（正常或异常）时调用 close_session 释放该会话的流式识别。
+        """
+        turn_id = None
+        try:
+            while True:
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    break
+
+                if frame.get("bytes") is not None:
+                    if turn_id is None:
+                        raise ValueError("Audio chunk received before a turn started")
+                    await self.handle_audio_chunk(session_id, turn_id, frame["bytes"], websocket)
+                    continue
+
+                message = json.loads(frame["text"])
+                turn_id = message.get("turn_id", turn_id)
+                reply = await self.handle_message(session_id, message, websocket)
+                if reply:
+                    turn_id = reply.get("turn_id", turn_id)
+                    await websocket.send_json(reply)
+        finally:
+            self.close_session(session_id)
+
+    def close_session(self, session_id: str) -> int:
+        """
+        释放会话的全部流式识别（客户端断开或放弃本轮时调用）
+
+        未完成的语音段直接丢弃，不再解码。
+
+        Returns:
+            释放的识别器数量
+        """
+        keys = [key for key in self.streams if key[0] == session_id]
+        for key in keys:
+            self.streams.pop(key).discard()
+        return len(keys)
+
+    async def handle_message(
+        self,
+        session_id: str,
+        message: Dict[str, Any],
+        websocket=None
+    ) -> Dict[str, Any]:
         """
         处理WebSocket消息
+
+        传入 websocket 时，答案提交的各阶段结果会在完成时逐帧推送，
+        返回值仅为本轮结束帧。
         """
         message_type = message.get("type")
 
         if message_type == "answer":
             # 处理答案提交
-            return self.practice_service.submit_answer(
+            if websocket is not None:
+                return await self.stream_answer(session_id, message, websocket)
+
+            return await self.practice_service.submit_answer_async(
                 session_id=session_id,
                 turn_id=message["turn_id"],
                 audio_url=message["audio_url"],
                 duration=message["duration"]
             )
+        elif message_type == "answer_end":
+            # 流式上传结束：收尾识别后直接进入评分流水线
+            recognizer = self.streams.pop((session_id, message["turn_id"]), None)
+            if recognizer is None:
+                raise ValueError("No audio stream for turn")
+
+            for event in await recognizer.finish():
+                await self.send_transcript_event(message["turn_id"], event, websocket)
+
+            asr_result = {
+                "text": recognizer.transcript,
+                "language": recognizer.language,
+                "confidence": None
+            }
+            if websocket is not None:
+                return await self.stream_answer(
+                    session_id, message, websocket, asr_result=asr_result
+                )
+
+            return await self.practice_service.submit_answer_async(
+                session_id=session_id,
+                turn_id=message["turn_id"],
+                audio_url=message["audio_url"],
+                duration=message["duration"],
+                asr_result=asr_result
+            )
         elif message_type == "next_question":
             # 获取下一题
             return self.practice_service.get_next_question(session_id=session_id)
@@ -345,6 +631,113 @@ class WebSocketPracticeHandler:
         else:
             raise ValueError(f"Unknown message type: {message_type}")
 
+    async def handle_audio_chunk(
+        self,
+        session_id: str,
+        turn_id: str,
+        pcm: bytes,
+        websocket
+    ):
+        """
+        处理答题过程中上传的PCM音频块
+
+        边说边识别，识别事件以 transcript_partial / transcript_final 帧推送。
+        同一会话同时只有一轮在答题：开始新一轮时，未发送 answer_end 的
+        旧轮次视为已放弃并释放。
+        """
+        key = (session_id, turn_id)
+        recognizer = self.streams.get(key)
+        if recognizer is None:
+            self.close_session(session_id)
+            recognizer = self.practice_service.asr_service.create_stream()
+            self.streams[key] = recognizer
+
+        for event in await recognizer.accept_chunk(pcm):
+            await self.send_transcript_event(turn_id, event, websocket)
+
+    async def send_transcript_event(self, turn_id: str, event: Dict[str, Any], websocket):
+        """
+        发送流式识别事件
+        """
+        if websocket is None:
+            return
+
+        await websocket.send_json({
+            "type": f"transcript_{event['type']}",
+            "turn_id": turn_id,
+            "text": event["text"],
+            "segment": event["segment"]
+        })
+
+    async def stream_answer(
+        self,
+        session_id: str,
+        message: Dict[str, Any],
+        websocket,
+        asr_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        流式处理答案提交
+
+        按阶段完成顺序推送 transcript、score、feedback_text、
+        feedback_audio、follow_up 帧，全部完成后返回 turn_complete 帧。
+        消息中 stream_audio 为真时，反馈语音在合成过程中即以二进制帧转发。
+        """
+        turn_id = message["turn_id"]
+        send_lock = asyncio.Lock()
+
+        audio_sink = None
+        if message.get("stream_audio"):
+            audio_sink = WebSocketAudioSink(websocket, turn_id, send_lock=send_lock)
+
+        async def on_stage(stage: str, result: Any):
+            async with send_lock:
+                await self.send_stage(turn_id, stage, result, websocket)
+
+        result = await self.practice_service.submit_answer_async(
+            session_id=session_id,
+            turn_id=turn_id,
+            audio_url=message["audio_url"],
+            duration=message["duration"],
+            on_stage=on_stage,
+            feedback_audio_sink=audio_sink,
+            asr_result=asr_result
+        )
+
+        return {
+            "type": "turn_complete",
+            "turn_id": turn_id,
+            "is_finished": result["is_finished"]
+        }
+
+    async def send_stage(self, turn_id: str, stage: str, result: Any, websocket):
+        """
+        发送单个阶段的结果帧
+        """
+        if stage == "score":
+            await self.send_score({"turn_id": turn_id, **result}, websocket)
+            return
+
+        if stage == "transcript":
+            frame = {
+                "text": result["text"],
+                "confidence": result.get("confidence")
+            }
+        elif stage == "feedback_text":
+            frame = {"text": result}
+        elif stage == "feedback_audio":
+            frame = {"audio_url": result}
+        elif stage == "follow_up":
+            frame = {"questions": result}
+        else:
+            return
+
+        await websocket.send_json({
+            "type": stage,
+            "turn_id": turn_id,
+            **frame
+        })
+
     async def send_question(self, session_id: str, websocket):
         """
         发送题目
@@ -0,0 +1,179 @@
+# 题目语音预渲染服务实现代码
+# 文件路径: services/question_audio_service.py
+
+from typing import Optional, List, Dict, Any, Iterable, TYPE_CHECKING
+import argparse
+import asyncio
+import logging
+
+if TYPE_CHECKING:
+    from ai.tts_service import TTSService
+    from models.question import Question
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionAudioPrerenderer:
+    """
+    题目语音预渲染
+
+    遍历题库中的激活题目，按每个TTS风格预先合成语音，并把URL与缓存键
+    记录在题目上。题目内容与风格参数均未变化、且音频仍可用的条目在后续
+    运行中跳过，练习过程中获取题目语音无需等待TTS。
+    """
+
+    def __init__(
+        self,
+        tts_service: "TTSService",
+        styles: Optional[List[str]] = None,
+        concurrency: int = 8,
+        repository: Any = None
+    ):
+        """
+        初始化预渲染器
+
+        Args:
+            tts_service: TTS服务
+            styles: 需要预渲染的风格，默认为全部 style_presets
+            concurrency: 最大并发合成数
+            repository: 题目仓储（提供 iter_active_questions / update），
+                默认为 QuestionRepository
+        """
+        if repository is None:
+            from models.question import QuestionRepository
+            repository = QuestionRepository
+
+        self.tts_service = tts_service
+        self.styles = styles or list(tts_service.get_available_styles())
+        self.concurrency = concurrency
+        self.repository = repository
+
+    async def prerender(
+        self,
+        questions: Optional[Iterable["Question"]] = None
+    ) -> Dict[str, Any]:
+        """
+        预渲染题目语音
+
+        Args:
+            questions: 待处理题目，默认遍历全部激活题目
+
+        Returns:
+            统计信息（rendered/skipped/failed 及失败明细）
+        """
+        if questions is None:
+            questions = self.repository.iter_active_questions()
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        stats = {"questions": 0, "rendered": 0, "skipped": 0, "failed": 0, "errors": []}
+
+        def record_failure(question: "Question", style: Optional[str], error: Exception):
+            stats["failed"] += 1
+            stats["errors"].append({
+                "question_id": question.id,
+                "style": style,
+                "error": str(error)
+            })
+
+        async def render(question: "Question") -> None:
+            changed = False
+            for style in self.styles:
+                key = self.tts_service.cache_key(question.content, style)
+                audio_url = question.get_audio_url(style, key)
+                # 内容、风格未变化且音频未被缓存淘汰时跳过
+                if audio_url is not None and self.tts_service.available_url(key, audio_url):
+                    stats["skipped"] += 1
+                    continue
+
+                try:
+                    async with semaphore:
+                        url = await self.tts_service.synthesize(
+                            text=question.content,
+                            style=style
+                        )
+                except Exception as e:
+                    record_failure(question, style, e)
+                    continue
+
+                question.set_audio_url(style, key, url)
+                stats["rendered"] += 1
+                changed = True
+
+            if changed:
+                self.repository.update(question)
+
+        async def render_safely(question: "Question") -> None:
+            # 单个题目的失败（如保存失败）记入统计，不中断整个任务
+            try:
+                await render(question)
+            except Exception as e:
+                record_failure(question, None, e)
+
+        # 分批调度，避免一次性为整个题库创建任务
+        pending = set()
+        try:
+            for question in questions:
+                stats["questions"] += 1
+                pending.add(asyncio.ensure_future(render_safely(question)))
+                if len(pending) >= self.concurrency * 4:
+                    _, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            # 遍历题库出错或任务被取消时，不留下仍在运行的合成任务
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return stats
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    命令行入口：预渲染题库语音
+
+    用法: python -m services.question_audio_service --concurrency 8 --style academic
+    """
+    parser = argparse.ArgumentParser(description="Pre-render TTS audio for the question bank")
+    parser.add_argument("--concurrency", type=int, default=8, help="最大并发合成数")
+    parser.add_argument(
+        "--style",
+        action="append",
+        dest="styles",
+        help="只预渲染指定风格，可重复；默认全部风格"
+    )
+    args = parser.parse_args(argv)
+
+    from ai.tts_service import TTSService
+
+    prerenderer = QuestionAudioPrerenderer(
+        tts_service=TTSService(),
+        styles=args.styles,
+        concurrency=args.concurrency
+    )
+    stats = asyncio.run(prerenderer.prerender())
+
+    logger.info(
+        "Pre-rendered question audio: questions=%d rendered=%d skipped=%d failed=%d",
+        stats["questions"],
+        stats["rendered"],
+        stats["skipped"],
+        stats["failed"]
+    )
+    for error in stats["errors"]:
+        logger.warning(
+            "Failed to pre-render question %s (style=%s): %s",
+            error["question_id"],
+            error["style"],
+            error["error"]
+        )
+    return stats
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
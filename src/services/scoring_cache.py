@@ -0,0 +1,178 @@
+# 评分结果缓存实现代码
+# 文件路径: services/scoring_cache.py
+
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import threading
+
+
+def scoring_cache_key(
+    audio_digest: str,
+    answer: str,
+    university: Optional[str],
+    major: Optional[str],
+    scorer_version: str,
+) -> str:
+    """
+    计算评分结果缓存键
+
+    Args:
+        audio_digest: 音频内容摘要
+        answer: 回答文本
+        university: 目标院校
+        major: 目标专业
+        scorer_version: 评分器版本指纹（代码、权重或数据变化时改变）
+
+    Returns:
+        SHA-256 十六进制摘要
+    """
+    payload = "\x1f".join(
+        [audio_digest, answer, university or "", major or "", scorer_version]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ScoringResultCache:
+    """
+    评分结果两级缓存
+
+    一级：进程内LRU（缓存键 -> 评分结果）
+    二级：可选的Redis（多进程、多实例共享，按TTL过期）
+
+    Redis不可用或条目损坏时按未命中处理，不影响评分。
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        max_memory_items: int = 10000,
+        ttl: int = 7 * 24 * 3600,
+        key_prefix: str = "scoring:result:",
+    ):
+        """
+        初始化缓存
+
+        Args:
+            redis_client: Redis客户端（同步接口，需支持 get/set），None表示只使用进程内缓存
+            max_memory_items: 进程内缓存条目上限
+            ttl: Redis中结果的过期时间（秒）
+            key_prefix: Redis键前缀
+        """
+        self.redis_client = redis_client
+        self.max_memory_items = max_memory_items
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.redis_errors = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        查询缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            评分结果副本，未命中返回None
+        """
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return copy.deepcopy(result)
+
+        if self.redis_client is not None:
+            try:
+                payload = self.redis_client.get(self.key_prefix + key)
+            except Exception:
+                payload = None
+                with self._lock:
+                    self.redis_errors += 1
+
+            if payload is not None:
+                result = self._decode(payload)
+                if result is None:
+                    # 损坏或截断的条目按未命中处理，重新评分后覆盖
+                    with self._lock:
+                        self.redis_errors += 1
+
+            if result is not None:
+                with self._lock:
+                    self.redis_hits += 1
+                    self._remember_locked(key, result)
+                return copy.deepcopy(result)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            result: 评分结果（需可JSON序列化）
+        """
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._remember_locked(key, result)
+
+        if self.redis_client is not None:
+            try:
+                self.redis_client.set(
+                    self.key_prefix + key, json.dumps(result), ex=self.ttl
+                )
+            except Exception:
+                with self._lock:
+                    self.redis_errors += 1
+
+    @staticmethod
+    def _decode(payload: Any) -> Optional[Dict[str, Any]]:
+        """解析Redis中的评分结果，不是有效的JSON对象时返回None"""
+        try:
+            result = json.loads(payload)
+        except ValueError:
+            return None
+        return result if isinstance(result, dict) else None
+
+    def _remember_locked(self, key: str, result: Dict[str, Any]):
+        """写入进程内LRU（调用方持有锁）"""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """清空进程内缓存（Redis中的条目按TTL过期）"""
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        获取命中统计
+
+        Returns:
+            命中次数、未命中次数及命中率
+        """
+        with self._lock:
+            hits = self.memory_hits + self.redis_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "redis_hits": self.redis_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "memory_items": len(self._memory),
+                "redis_errors": self.redis_errors,
+            }
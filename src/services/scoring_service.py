@@ -1,7 +1,28 @@
 # 评分服务实现代码
 # 文件路径: services/scoring_service.py
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Tuple, Union, TYPE_CHECKING
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+import asyncio
+import glob
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+
+try:
+    from algorithms.text_analysis import AnalyzedText
+except ImportError:
+    from src.algorithms.text_analysis import AnalyzedText
+
+if TYPE_CHECKING:
+    from ai.audio_fetcher import AudioBuffer, AudioFetcher
+    from services.scoring_cache import ScoringResultCache
+
+logger = logging.getLogger(__name__)
 
 
 class ScoringService:
@@ -14,6 +35,9 @@ class ScoringService:
         vocabulary_scorer,
         grammar_scorer,
         university_match_scorer,
+        executor: Optional[Executor] = None,
+        result_cache: Optional["ScoringResultCache"] = None,
+        audio_fetcher: Optional["AudioFetcher"] = None,
     ):
         self.gop_scorer = gop_scorer
         self.fluency_scorer = fluency_scorer
@@ -21,6 +45,14 @@ class ScoringService:
         self.grammar_scorer = grammar_scorer
         self.university_match_scorer = university_match_scorer
 
+        # 并发评分使用的执行器（未传入时按需创建线程池）
+        self.executor = executor
+
+        # 评分结果缓存（None表示不缓存）；音频URL通过 audio_fetcher 按内容版本计算摘要
+        self.result_cache = result_cache
+        self.audio_fetcher = audio_fetcher
+        self._code_version: Optional[str] = None
+
         self.weights = {
             "pronunciation": 0.25,
             "fluency": 0.25,
@@ -33,84 +65,549 @@ class ScoringService:
         self,
         question: str,
         answer: str,
-        audio_url: str,
+        audio_url: Union[str, "AudioBuffer"],
         university: Optional[str] = None,
         major: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """综合评分"""
-        pronunciation_score = self.gop_scorer.calculate_gop_score(audio_url, answer)
-        fluency_score = self.fluency_scorer.calculate_fluency_score(audio_url, answer)
-        vocabulary_score = self.vocabulary_scorer.calculate_vocabulary_score(answer)
-        grammar_score = self.grammar_scorer.calculate_grammar_score(answer)
+        """综合评分（相同音频、文本、院校专业和评分器版本直接返回缓存结果）"""
+        cache_key, cached = self._lookup_cached(answer, audio_url, university, major)
+        if cached is not None:
+            return cached
+
+        jobs = self._build_dimension_jobs(answer, audio_url, university, major)
+        results = {name: job() for name, job in jobs.items()}
+        result = self._assemble_result(results)
+        self._store_cached(cache_key, result)
+        return result
+
+    async def evaluate_async(
+        self,
+        question: str,
+        answer: str,
+        audio_url: Union[str, "AudioBuffer"],
+        university: Optional[str] = None,
+        major: Optional[str] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        并发综合评分
+
+        各维度评分器相互独立，在执行器中并行运行后再合并结果。
+        单个维度超时或异常时记录日志（含维度名）并按降级结果处理，
+        不影响其他维度。超时只是不再等待该维度：执行器线程无法被中断，
+        超时的评分器仍会在后台运行到结束并占用执行器中的一个线程。
+
+        Args:
+            question: 题目
+            answer: 回答文本
+            audio_url: 音频URL，或已解码的 AudioBuffer（各声学评分器共享，不复制）
+            university: 目标院校
+            major: 目标专业
+            timeouts: 各维度超时时间（秒），覆盖默认配置
+
+        Returns:
+            评分结果，降级维度列在 degraded_dimensions 中
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        dimension_timeouts = {**ScoringConfig.DIMENSION_TIMEOUTS, **(timeouts or {})}
+
+        cache_key, cached = None, None
+        if self.result_cache is not None:
+            cache_key, cached = await loop.run_in_executor(
+                executor,
+                partial(self._lookup_cached, answer, audio_url, university, major),
+            )
+            if cached is not None:
+                return cached
+
+        jobs = self._build_dimension_jobs(answer, audio_url, university, major)
+        names = list(jobs)
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    loop.run_in_executor(executor, jobs[name]),
+                    timeout=dimension_timeouts.get(name),
+                )
+                for name in names
+            ),
+            return_exceptions=True,
+        )
+
+        results = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.warning(
+                    "Scoring dimension %s timed out after %ss; its executor "
+                    "thread keeps running",
+                    name,
+                    dimension_timeouts.get(name),
+                )
+                outcome = None
+            elif isinstance(outcome, BaseException):
+                logger.error(
+                    "Scoring dimension %s failed: %r",
+                    name,
+                    outcome,
+                    exc_info=(type(outcome), outcome, outcome.__traceback__),
+                )
+                outcome = None
+            results[name] = outcome
+
+        result = self._assemble_result(results)
+        if cache_key is not None:
+            await loop.run_in_executor(executor, self._store_cached, cache_key, result)
+        return result
+
+    def evaluate_batch(
+        self,
+        items: List[Dict[str, Any]],
+        executor: Optional[Executor] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        批量评分（夜间重评分、教师端批量批改）
+
+        文本维度（词汇、语法、院校匹配）按批调用评分器的向量化接口，
+        每条文本只分词一次；声学维度（发音、流利度）分发到执行器并行执行，
+        与文本维度的计算重叠。单条结果与 evaluate 一致；命中结果缓存的条目
+        不再重新评分。
+
+        Args:
+            items: 待评分回答，每项包含 answer、audio_url，可选 university、major
+            executor: 声学评分使用的执行器，默认使用服务的线程池
+                （传入 ProcessPoolExecutor 时评分器须可被pickle）
+            chunk_size: 每批处理条数，限制同时在途的任务和中间结果
+
+        Returns:
+            {"results": 与输入顺序一致的评分结果, "stats": 吞吐统计}
+        """
+        executor = executor or self._get_executor()
+        chunk_size = chunk_size or ScoringConfig.BATCH_CHUNK_SIZE
+
+        started = time.perf_counter()
+        text_seconds = 0.0
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        cache_keys: List[Optional[str]] = [None] * len(items)
+
+        if self.result_cache is not None:
+            for i, item in enumerate(items):
+                cache_keys[i], results[i] = self._lookup_cached(
+                    item["answer"],
+                    item["audio_url"],
+                    item.get("university"),
+                    item.get("major"),
+                )
+        pending = [i for i, result in enumerate(results) if result is None]
+        cache_hits = len(items) - len(pending)
+
+        for offset in range(0, len(pending), chunk_size):
+            indices = pending[offset : offset + chunk_size]
+            chunk = [items[i] for i in indices]
+            answers = [AnalyzedText(item["answer"]) for item in chunk]
+
+            # 先提交声学任务，文本维度在等待期间计算
+            acoustic = [
+                {
+                    "pronunciation": executor.submit(
+                        self.gop_scorer.calculate_gop_score,
+                        item["audio_url"],
+                        answer,
+                    ),
+                    "fluency": executor.submit(
+                        self.fluency_scorer.calculate_fluency_score,
+                        item["audio_url"],
+                        answer,
+                    ),
+                }
+                for item, answer in zip(chunk, answers)
+            ]
+
+            text_started = time.perf_counter()
+            vocabulary = self._score_text_batch(
+                "vocabulary",
+                self.vocabulary_scorer.calculate_vocabulary_score_batch, answers
+            )
+            grammar = self._score_text_batch(
+                "grammar",
+                self.grammar_scorer.calculate_grammar_score_batch, answers
+            )
+
+            match_indices = [
+                i
+                for i, item in enumerate(chunk)
+                if item.get("university") and item.get("major")
+            ]
+            matches = dict(
+                zip(
+                    match_indices,
+                    self._score_text_batch(
+                        "university_match",
+                        self.university_match_scorer.calculate_match_score_batch,
+                        [answers[i] for i in match_indices],
+                        [chunk[i]["university"] for i in match_indices],
+                        [chunk[i]["major"] for i in match_indices],
+                    ),
+                )
+            )
+            text_seconds += time.perf_counter() - text_started
+
+            for i in range(len(chunk)):
+                dimension_results = {
+                    name: self._future_result(name, future)
+                    for name, future in acoustic[i].items()
+                }
+                dimension_results["vocabulary"] = vocabulary[i]
+                dimension_results["grammar"] = grammar[i]
+                if i in matches:
+                    dimension_results["university_match"] = matches[i]
+                result = self._assemble_result(dimension_results)
+                results[indices[i]] = result
+                self._store_cached(cache_keys[indices[i]], result)
+
+        elapsed = time.perf_counter() - started
+        stats = {
+            "items": len(items),
+            "elapsed_seconds": round(elapsed, 4),
+            "items_per_second": round(len(items) / elapsed, 2) if elapsed > 0 else 0.0,
+            "text_seconds": round(text_seconds, 4),
+            "degraded": sum(1 for r in results if r.get("degraded_dimensions")),
+            "cache_hits": cache_hits,
+        }
+
+        return {"results": results, "stats": stats}
+
+    @staticmethod
+    def _score_text_batch(
+        name: str,
+        scorer: Callable[..., List[Dict[str, Any]]],
+        texts: List[str],
+        *args: Any,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """执行文本维度批量评分，失败时整批按降级处理"""
+        if not texts:
+            return []
+        try:
+            return scorer(texts, *args)
+        except Exception:
+            logger.exception(
+                "Scoring dimension %s failed for a batch of %d answers",
+                name,
+                len(texts),
+            )
+            return [None] * len(texts)
+
+    @staticmethod
+    def _future_result(name: str, future: Future) -> Optional[Dict[str, Any]]:
+        """获取声学评分结果，失败时返回None（按降级处理）"""
+        try:
+            return future.result()
+        except Exception:
+            logger.exception("Scoring dimension %s failed", name)
+            return None
+
+    def scorer_version(self) -> str:
+        """
+        评分器版本指纹
+
+        由评分器及本模块源码、当前权重和评分数据版本（语法规则、词表、
+        院校知识库）计算，任一变化都会使旧的缓存结果失效。
+
+        Returns:
+            十六进制摘要
+        """
+        if self._code_version is None:
+            self._code_version = self._code_fingerprint()
+
+        parts = [self._code_version, json.dumps(self.weights, sort_keys=True)]
+        for scorer in self._scorers():
+            parts.extend(self._data_versions(scorer))
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def _scorers(self) -> List[Any]:
+        return [
+            self.gop_scorer,
+            self.fluency_scorer,
+            self.vocabulary_scorer,
+            self.grammar_scorer,
+            self.university_match_scorer,
+        ]
+
+    def _code_fingerprint(self) -> str:
+        """评分代码摘要：本模块及各评分器所在包目录下的全部源码"""
+        paths = {os.path.abspath(__file__)}
+        for scorer in self._scorers():
+            try:
+                source = inspect.getsourcefile(type(scorer))
+            except TypeError:
+                source = None
+            if source:
+                paths.update(glob.glob(os.path.join(os.path.dirname(source), "*.py")))
+
+        digest = hashlib.sha256()
+        for path in sorted(paths):
+            with open(path, "rb") as f:
+                digest.update(path.encode("utf-8"))
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _data_versions(scorer: Any) -> List[str]:
+        """评分器使用的数据版本（运行时可能热更新，每次计算）"""
+        versions = []
+        rule_engine = getattr(scorer, "rule_engine", None)
+        if rule_engine is not None:
+            versions.append(f"rules:{rule_engine.version}:{rule_engine.fingerprint}")
+        lexicon = getattr(scorer, "lexicon", None)
+        if lexicon is not None:
+            versions.append(f"lexicon:{lexicon.fingerprint}")
+        knowledge_base = getattr(scorer, "knowledge_base", None)
+        if knowledge_base is not None:
+            snapshot = knowledge_base.current
+            versions.append(f"knowledge_base:{snapshot.version}:{snapshot.fingerprint}")
+        dictionary = getattr(scorer, "dictionary", None)
+        if dictionary is not None:
+            versions.append(f"dictionary:{dictionary.fingerprint}")
+        if hasattr(scorer, "acoustic_model"):
+            acoustic_model = scorer.acoustic_model
+            versions.append(
+                f"acoustic_model:{getattr(acoustic_model, 'path', None)}"
+                f":{type(acoustic_model).__name__}"
+            )
+        return versions
+
+    def _audio_digest(self, audio_url: Union[str, "AudioBuffer"]) -> str:
+        """
+        音频内容摘要
+
+        URL优先按 audio_fetcher 报告的内容版本（ETag/修改时间）计算，不下载音频；
+        无法获取版本时对内容取摘要（经spool下载，评分器随后直接复用）；
+        未配置 audio_fetcher 时以URL本身计算。
+        """
+        if isinstance(audio_url, str):
+            if self.audio_fetcher is not None:
+                version = self.audio_fetcher.content_version(audio_url)
+                if version is not None:
+                    payload = f"{audio_url}\x1f{version}".encode("utf-8")
+                    return "version:" + hashlib.sha256(payload).hexdigest()
+                data = self.audio_fetcher.fetch_bytes(audio_url)
+                return "bytes:" + hashlib.sha256(data).hexdigest()
+            return "url:" + hashlib.sha256(audio_url.encode("utf-8")).hexdigest()
+
+        digest = hashlib.sha256(audio_url.samples)
+        return f"pcm:{audio_url.sample_rate}:{digest.hexdigest()}"
+
+    def _lookup_cached(
+        self,
+        answer: str,
+        audio_url: Union[str, "AudioBuffer"],
+        university: Optional[str],
+        major: Optional[str],
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        查询评分结果缓存
+
+        Returns:
+            (缓存键, 缓存结果)；未配置缓存或无法计算缓存键时均为None
+        """
+        if self.result_cache is None:
+            return None, None
+
+        # 延迟导入：评分服务在未启用缓存时不依赖缓存模块
+        try:
+            from services.scoring_cache import scoring_cache_key
+        except ImportError:
+            from src.services.scoring_cache import scoring_cache_key
+
+        try:
+            cache_key = scoring_cache_key(
+                self._audio_digest(audio_url),
+                answer,
+                university if university and major else None,
+                major if university and major else None,
+                self.scorer_version(),
+            )
+        except Exception:
+            # 音频无法读取等情况下不使用缓存，由评分流程自行降级
+            return None, None
+
+        return cache_key, self.result_cache.get(cache_key)
+
+    def _store_cached(self, cache_key: Optional[str], result: Dict[str, Any]):
+        """写入评分结果缓存（降级结果不缓存，下次重新评分）"""
+        if cache_key is None or result.get("degraded_dimensions"):
+            return
+        self.result_cache.put(cache_key, result)
+
+    def _get_executor(self) -> Executor:
+        """获取并发评分执行器"""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=ScoringConfig.MAX_SCORING_WORKERS,
+                thread_name_prefix="scoring",
+            )
+        return self.executor
+
+    def _build_dimension_jobs(
+        self,
+        answer: str,
+        audio_url: Union[str, "AudioBuffer"],
+        university: Optional[str] = None,
+        major: Optional[str] = None,
+    ) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        """构建各维度评分任务（回答文本只分析一次，各评分器共享）"""
+        analysis = AnalyzedText(answer)
+        jobs = {
+            "pronunciation": partial(
+                self.gop_scorer.calculate_gop_score, audio_url, analysis
+            ),
+            "fluency": partial(
+                self.fluency_scorer.calculate_fluency_score, audio_url, analysis
+            ),
+            "vocabulary": partial(
+                self.vocabulary_scorer.calculate_vocabulary_score, analysis
+            ),
+            "grammar": partial(self.grammar_scorer.calculate_grammar_score, analysis),
+        }
 
-        university_match_score = None
         if university and major:
-            university_match_score = self.university_match_scorer.calculate_match_score(
-                answer=answer, university=university, major=major
+            jobs["university_match"] = partial(
+                self.university_match_scorer.calculate_match_score,
+                answer=analysis,
+                university=university,
+                major=major,
             )
-            self.weights["university_match"] = 0.2
-            self.weights["pronunciation"] = 0.2
-            self.weights["fluency"] = 0.2
-            self.weights["vocabulary"] = 0.2
-            self.weights["grammar"] = 0.2
+
+        return jobs
+
+    def _assemble_result(
+        self, results: Dict[str, Optional[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        合并各维度评分结果
+
+        Args:
+            results: 维度名到评分结果的映射，None 表示该维度失败
+
+        Returns:
+            综合评分结果
+        """
+        degraded = [name for name, result in results.items() if result is None]
+        dimensions = {
+            name: result if result is not None else self._degraded_dimension(name)
+            for name, result in results.items()
+        }
+
+        university_match_score = dimensions.get("university_match")
+        weights = self._get_weights(university_match_score is not None)
 
         overall_score = self._calculate_overall_score(
-            pronunciation_score["overall_score"],
-            fluency_score["overall_score"],
-            vocabulary_score["overall_score"],
-            grammar_score["overall_score"],
+            dimensions["pronunciation"]["overall_score"],
+            dimensions["fluency"]["overall_score"],
+            dimensions["vocabulary"]["overall_score"],
+            dimensions["grammar"]["overall_score"],
             university_match_score["score"] if university_match_score else None,
+            weights=weights,
+            exclude=degraded,
         )
 
         suggestions = self._generate_suggestions(
-            pronunciation_score,
-            fluency_score,
-            vocabulary_score,
-            grammar_score,
+            dimensions["pronunciation"],
+            dimensions["fluency"],
+            dimensions["vocabulary"],
+            dimensions["grammar"],
             university_match_score,
         )
 
-        dimensions = {
-            "pronunciation": pronunciation_score,
-            "fluency": fluency_score,
-            "vocabulary": vocabulary_score,
-            "grammar": grammar_score,
-        }
-
-        if university_match_score:
-            dimensions["university_match"] = university_match_score
-
         feedback = self._generate_feedback(dimensions, overall_score)
 
-        return {
+        result = {
             "overall_score": overall_score,
             "dimensions": dimensions,
             "feedback": feedback,
             "suggestions": suggestions,
         }
 
-    def evaluate_pronunciation(self, audio_url: str, text: str) -> Dict[str, Any]:
+        if degraded:
+            result["degraded_dimensions"] = degraded
+
+        return result
+
+    def _get_weights(self, with_university_match: bool) -> Dict[str, float]:
+        """获取本次评分的维度权重（不修改共享的默认权重）"""
+        if not with_university_match:
+            return dict(self.weights)
+
+        return {
+            "pronunciation": 0.2,
+            "fluency": 0.2,
+            "vocabulary": 0.2,
+            "grammar": 0.2,
+            "university_match": 0.2,
+        }
+
+    def _degraded_dimension(self, name: str) -> Dict[str, Any]:
+        """生成降级维度结果（评分器超时或失败时使用）"""
+        if name == "university_match":
+            return {
+                "score": 0,
+                "relevance": "none",
+                "matched_keywords": [],
+                "domain_match_score": 0,
+                "major_match_score": 0,
+                "suggestions": [],
+                "degraded": True,
+            }
+
+        defaults = {
+            "pronunciation": {"phoneme_scores": []},
+            "fluency": {
+                "speech_rate": 0,
+                "avg_speech_length": 0,
+                "pause_frequency": 0,
+                "pauses": [],
+            },
+            "vocabulary": {"diversity": 0, "advanced_words": [], "word_count": 0},
+            "grammar": {"errors": [], "sentence_variety": 0},
+        }
+        return {"overall_score": 0, **defaults.get(name, {}), "degraded": True}
+
+    def evaluate_pronunciation(
+        self, audio_url: Union[str, "AudioBuffer"], text: str
+    ) -> Dict[str, Any]:
         """发音评分"""
         result = self.gop_scorer.calculate_gop_score(audio_url, text)
 
         phoneme_errors = []
-        for word_score in result["phoneme_scores"]:
-            if word_score["score"] < 70:
+        for item in result["phoneme_scores"]:
+            if item["score"] < 70:
+                # 基于音频的GOP结果按音素给出，文本估计结果按单词给出
+                if "word" in item:
+                    word = item["word"]
+                    suggestion = (
+                        f"Work on the '{item['phoneme']}' sound in '{word}'"
+                    )
+                else:
+                    word = item["phoneme"]
+                    suggestion = f"Work on pronouncing '{word}' more clearly"
                 phoneme_errors.append(
                     {
-                        "word": word_score["phoneme"],
-                        "score": word_score["score"],
-                        "suggestion": f"Work on pronouncing '{word_score['phoneme']}' more clearly",
+                        "word": word,
+                        "score": item["score"],
+                        "suggestion": suggestion,
                     }
                 )
 
         return {
             "score": result["overall_score"],
-            "word_scores": result["phoneme_scores"],
+            "word_scores": result.get("word_scores", result["phoneme_scores"]),
             "common_errors": phoneme_errors,
+            "method": result.get("method", "heuristic"),
         }
 
-    def evaluate_fluency(self, audio_url: str, text: str) -> Dict[str, Any]:
+    def evaluate_fluency(
+        self, audio_url: Union[str, "AudioBuffer"], text: str
+    ) -> Dict[str, Any]:
         """流利度评分"""
         result = self.fluency_scorer.calculate_fluency_score(audio_url, text)
 
@@ -150,8 +647,11 @@ class ScoringService:
         vocabulary: float,
         grammar: float,
         university_match: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
+        exclude: Optional[List[str]] = None,
     ) -> float:
-        """计算综合得分"""
+        """计算综合得分（排除的维度不参与计算，其余维度权重重新归一化）"""
+        weights = weights or self.weights
         scores = {
             "pronunciation": pronunciation,
             "fluency": fluency,
@@ -162,7 +662,14 @@ class ScoringService:
         if university_match is not None:
             scores["university_match"] = university_match
 
-        overall = sum(scores[dim] * self.weights[dim] for dim in scores)
+        for dim in exclude or []:
+            scores.pop(dim, None)
+
+        total_weight = sum(weights[dim] for dim in scores)
+        if total_weight <= 0:
+            return 0
+
+        overall = sum(scores[dim] * weights[dim] for dim in scores) / total_weight
         return round(overall, 2)
 
     def _generate_suggestions(
@@ -176,18 +683,18 @@ class ScoringService:
         """生成建议"""
         suggestions = []
 
-        if pronunciation["overall_score"] < 80:
+        if self._is_scored(pronunciation) and pronunciation["overall_score"] < 80:
             suggestions.append(
                 "Practice your pronunciation, especially on difficult sounds"
             )
 
-        if fluency["overall_score"] < 80:
+        if self._is_scored(fluency) and fluency["overall_score"] < 80:
             if fluency["pause_frequency"] > 2:
                 suggestions.append("Try to reduce pause frequency by practicing more")
             if fluency["speech_rate"] < 120:
                 suggestions.append("Work on increasing your speaking rate slightly")
 
-        if vocabulary["overall_score"] < 80:
+        if self._is_scored(vocabulary) and vocabulary["overall_score"] < 80:
             if vocabulary["diversity"] < 50:
                 suggestions.append(
                     "Use more varied vocabulary to improve your expression"
@@ -195,7 +702,7 @@ class ScoringService:
             if len(vocabulary["advanced_words"]) < 2:
                 suggestions.append("Try to incorporate more advanced vocabulary")
 
-        if grammar["overall_score"] < 80:
+        if self._is_scored(grammar) and grammar["overall_score"] < 80:
             suggestions.append("Review grammar rules to improve accuracy")
 
         if university_match and university_match["score"] < 80:
@@ -206,6 +713,10 @@ class ScoringService:
 
         return suggestions
 
+    def _is_scored(self, dimension: Dict[str, Any]) -> bool:
+        """维度是否为有效评分（非降级结果）"""
+        return not dimension.get("degraded", False)
+
     def _generate_feedback(
         self, dimensions: Dict[str, Any], overall_score: float
     ) -> str:
@@ -264,6 +775,19 @@ class ScoringConfig:
 
     GRAMMAR_STANDARDS = {"excellent": 90, "good": 80, "fair": 70, "poor": 60}
 
+    # 并发评分：各维度超时时间（秒）
+    DIMENSION_TIMEOUTS = {
+        "pronunciation": 3.0,
+        "fluency": 3.0,
+        "vocabulary": 1.0,
+        "grammar": 1.0,
+        "university_match": 1.0,
+    }
+    MAX_SCORING_WORKERS = 8
+
+    # 批量评分：每批处理条数
+    BATCH_CHUNK_SIZE = 1000
+
     SPEECH_RATE_IDEAL = (120, 150)
     PAUSE_FREQUENCY_IDEAL = 2
     AVG_SPEECH_LENGTH_IDEAL = 3
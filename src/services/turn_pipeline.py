@@ -0,0 +1,109 @@
+# 答题流水线实现代码
+# 文件路径: services/turn_pipeline.py
+
+from typing import Dict, Any, Optional, Callable, Awaitable
+import asyncio
+
+
+StageCallback = Callable[[str, Any], Awaitable[None]]
+
+
+class TurnPipeline:
+    """
+    答题流水线
+
+    按依赖关系调度各阶段：阶段在其依赖全部完成后立即启动，
+    互不依赖的阶段并发执行。每个阶段完成时触发 on_stage 回调，
+    便于在整轮结束前将中间结果推送给客户端。
+    """
+
+    def __init__(self, on_stage: Optional[StageCallback] = None):
+        """
+        初始化流水线
+
+        Args:
+            on_stage: 阶段完成回调，参数为 (阶段名, 阶段结果)
+        """
+        self.on_stage = on_stage
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def add_stage(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        *depends_on: str
+    ) -> "TurnPipeline":
+        """
+        添加阶段并立即调度
+
+        Args:
+            name: 阶段名
+            func: 异步函数，按 depends_on 的顺序接收各依赖阶段的结果
+            depends_on: 依赖的阶段名（必须已添加）
+
+        Returns:
+            流水线本身，便于链式调用
+        """
+        if name in self._tasks:
+            raise ValueError(f"Duplicate stage: {name}")
+
+        missing = [dep for dep in depends_on if dep not in self._tasks]
+        if missing:
+            raise ValueError(f"Unknown dependencies for {name}: {missing}")
+
+        dependencies = [self._tasks[dep] for dep in depends_on]
+        self._tasks[name] = asyncio.ensure_future(
+            self._run_stage(name, func, dependencies)
+        )
+        return self
+
+    async def _run_stage(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        dependencies: list
+    ) -> Any:
+        """等待依赖完成后执行阶段"""
+        inputs = [await dependency for dependency in dependencies]
+        result = await func(*inputs)
+
+        if self.on_stage is not None:
+            await self.on_stage(name, result)
+
+        return result
+
+    async def result(self, name: str) -> Any:
+        """
+        等待单个阶段的结果
+
+        Args:
+            name: 阶段名
+
+        Returns:
+            阶段结果
+        """
+        return await self._tasks[name]
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        等待所有阶段完成
+
+        任一阶段失败时取消其余未完成阶段并抛出该异常。
+
+        Returns:
+            阶段名到结果的映射
+        """
+        names = list(self._tasks)
+        try:
+            results = await asyncio.gather(*(self._tasks[name] for name in names))
+        except BaseException:
+            self.cancel()
+            raise
+
+        return dict(zip(names, results))
+
+    def cancel(self):
+        """取消所有未完成的阶段"""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
@@ -59,6 +59,16 @@ class Settings(BaseSettings):
     MINIO_SECRET_KEY: str = os.getenv("MINIO_SECRET_KEY", "minioadmin")
     MINIO_BUCKET: str = os.getenv("MINIO_BUCKET", "empenglish-audio")
 
+    # Answer audio is only fetched from MINIO_ENDPOINT and these http(s) URL
+    # prefixes (e.g. a CDN in front of the bucket); anything else is rejected
+    AUDIO_ALLOWED_URL_PREFIXES: list = []
+
+    # University/major knowledge base reload interval (0 disables watching);
+    # the file itself is chosen by KNOWLEDGE_BASE_PATH in algorithms/knowledge_base.py
+    KNOWLEDGE_BASE_RELOAD_SECONDS: int = int(
+        os.getenv("KNOWLEDGE_BASE_RELOAD_SECONDS", "60")
+    )
+
     # CORS
     CORS_ORIGINS: list = ["http://localhost:3000", "http://localhost:5173"]
 
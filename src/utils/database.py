@@ -2,7 +2,7 @@
 
 import os
 from typing import Generator
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, inspect, text, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
@@ -36,9 +36,38 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# Nullable columns added to existing tables after their first release.
+# create_all only creates missing tables, so existing databases get these
+# columns from upgrade_db: (table, column, SQL type)
+ADDED_COLUMNS = [
+    ("questions", "audio_urls", "JSON"),
+]
+
+
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
+    upgrade_db()
+
+
+def upgrade_db(bind=None):
+    """Add columns from ADDED_COLUMNS that existing tables are missing.
+
+    Args:
+        bind: Engine to upgrade, defaults to the application engine
+    """
+    bind = bind if bind is not None else engine
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+    with bind.begin() as connection:
+        for table, column, sql_type in ADDED_COLUMNS:
+            if table not in tables:
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table)}
+            if column not in existing:
+                connection.execute(
+                    text(f"ALTER TABLE {table} ADD COLUMN {column} {sql_type} NULL")
+                )
 
 
 def drop_db():
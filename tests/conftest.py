@@ -76,3 +76,44 @@ def auth_token(mock_jwt_manager):
         user_id="test_user_id", payload={"nickname": "Test User"}
     )
     return token
+
+
+@pytest.fixture(scope="function")
+def scorers():
+    """All scorer instances used by ScoringService."""
+    from src.algorithms.fluency_scorer import FluencyScorer
+    from src.algorithms.gop_scorer import GOPScorer
+    from src.algorithms.grammar_scorer import GrammarScorer
+    from src.algorithms.university_match_scorer import UniversityMatchScorer
+    from src.algorithms.vocabulary_scorer import VocabularyScorer
+
+    return {
+        "gop_scorer": GOPScorer(),
+        "fluency_scorer": FluencyScorer(),
+        "vocabulary_scorer": VocabularyScorer(),
+        "grammar_scorer": GrammarScorer(),
+        "university_match_scorer": UniversityMatchScorer(),
+    }
+
+
+@pytest.fixture(scope="function")
+def scoring_service(scorers):
+    """Scoring service built from the scorers fixture."""
+    from src.services.scoring_service import ScoringService
+
+    return ScoringService(**scorers)
+
+
+@pytest.fixture(scope="function")
+def failing_grammar_scorer():
+    """Grammar scorer whose single and batch calls always raise."""
+    from src.algorithms.grammar_scorer import GrammarScorer
+
+    class FailingGrammarScorer(GrammarScorer):
+        def calculate_grammar_score(self, text):
+            raise RuntimeError("grammar backend unavailable")
+
+        def calculate_grammar_score_batch(self, texts):
+            raise RuntimeError("grammar backend unavailable")
+
+    return FailingGrammarScorer()
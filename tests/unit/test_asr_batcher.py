@@ -0,0 +1,73 @@
+"""
+Tests for ASR dynamic micro-batching.
+"""
+
+import asyncio
+
+import pytest
+from src.ai.asr_batcher import ASRMicroBatcher
+
+
+class RecordingRunner:
+    """Batch runner that records the batches it receives."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, paths, language, beam_size, vad_filter):
+        self.batches.append((list(paths), language))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return [{"text": path, "language": language} for path in paths]
+
+
+class TestASRMicroBatcher:
+    """Test cases for ASRMicroBatcher."""
+
+    def test_concurrent_requests_share_a_batch(self):
+        """Test that requests in the same window are batched and fanned out."""
+        runner = RecordingRunner()
+        batcher = ASRMicroBatcher(runner, max_batch_size=4, max_wait_ms=20)
+
+        async def scenario():
+            return await asyncio.gather(*(batcher.submit(f"{i}.wav") for i in range(6)))
+
+        results = asyncio.run(scenario())
+
+        assert [r["text"] for r in results] == [f"{i}.wav" for i in range(6)]
+        assert [len(paths) for paths, _ in runner.batches] == [4, 2]
+        assert batcher.metrics()["avg_batch_size"] == 3.0
+
+    def test_different_options_not_mixed(self):
+        """Test that requests with different decode options are kept apart."""
+        runner = RecordingRunner()
+        batcher = ASRMicroBatcher(runner, max_batch_size=8, max_wait_ms=5)
+
+        async def scenario():
+            await asyncio.gather(
+                batcher.submit("a.wav", language="en"),
+                batcher.submit("b.wav", language="zh"),
+                batcher.submit("c.wav", language="en"),
+            )
+
+        asyncio.run(scenario())
+
+        assert sorted(runner.batches) == [
+            (["a.wav", "c.wav"], "en"),
+            (["b.wav"], "zh"),
+        ]
+
+    def test_batch_failure_propagates_to_all_callers(self):
+        """Test that a failed batch fails every request in it."""
+        batcher = ASRMicroBatcher(RecordingRunner(fail=True), max_wait_ms=1)
+
+        async def scenario():
+            return await asyncio.gather(
+                batcher.submit("a.wav"), batcher.submit("b.wav"), return_exceptions=True
+            )
+
+        results = asyncio.run(scenario())
+
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,129 @@
+"""
+Tests for the ASR worker process pool.
+"""
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+from src.ai.asr_worker_pool import ASRWorkerPool, ASRPoolBusyError
+
+
+class EchoModel:
+    """Stand-in model that 'transcribes' the file name."""
+
+    def __init__(self, model_size, device):
+        self.pid = os.getpid()
+
+    def transcribe(self, audio_path, language, beam_size, vad_filter):
+        segments = [
+            SimpleNamespace(text=f" {os.path.basename(audio_path)} ", avg_logprob=0.0),
+            SimpleNamespace(text=f"pid{self.pid}", avg_logprob=0.0),
+        ]
+        return iter(segments), SimpleNamespace(language=language, duration=1.5)
+
+
+def load_echo_model(model_size, device):
+    return EchoModel(model_size, device)
+
+
+@pytest.fixture
+def pool():
+    pool = ASRWorkerPool(num_workers=2, model_factory=load_echo_model)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+class TestASRWorkerPool:
+    """Test cases for ASRWorkerPool."""
+
+    def test_transcribe_in_worker(self, pool):
+        """Test that jobs run in a preloaded worker process."""
+        result = asyncio.run(pool.transcribe("/tmp/answer.wav", language="en"))
+
+        text, worker = result["text"].split(" ")
+        assert text == "answer.wav"
+        assert worker != f"pid{os.getpid()}"
+        assert result["language"] == "en"
+        assert result["confidence"] == 1.0
+        assert result["duration"] == 1.5
+
+    def test_concurrent_jobs_and_metrics(self, pool):
+        """Test concurrent submissions and the metrics snapshot."""
+
+        async def submit_all():
+            return await asyncio.gather(
+                *(pool.transcribe(f"/tmp/{i}.wav") for i in range(6))
+            )
+
+        results = asyncio.run(submit_all())
+
+        assert [r["text"].split(" ")[0] for r in results] == [
+            f"{i}.wav" for i in range(6)
+        ]
+        metrics = pool.metrics()
+        assert metrics["healthy"] is True
+        assert metrics["completed"] == 6
+        assert metrics["in_flight"] == 0
+        assert metrics["queue_depth"] == 0
+
+    def test_queue_full_rejects(self):
+        """Test that a saturated queue rejects after the timeout."""
+        pool = ASRWorkerPool(
+            num_workers=1,
+            max_queue_size=1,
+            queue_timeout=0.01,
+            model_factory=load_echo_model,
+        )
+
+        async def saturate():
+            pool._executor = object()
+            await pool.transcribe("/tmp/a.wav")
+
+        assert pool._slots.acquire(timeout=0)
+        with pytest.raises(ASRPoolBusyError):
+            asyncio.run(saturate())
+        assert pool.metrics()["rejected"] == 1
+
+    def test_sync_batch_shares_queue_limit_and_metrics(self, pool):
+        """Test that the sync batch API is admitted and counted like async jobs."""
+        pool.queue_timeout = 0.01
+        for _ in range(pool.max_queue_size):
+            assert pool._slots.acquire(timeout=0)
+
+        with pytest.raises(ASRPoolBusyError):
+            pool.transcribe_batch_sync(["/tmp/a.wav"])
+        assert pool.metrics()["rejected"] == 1
+
+        pool._slots.release()
+        assert pool.transcribe_batch_sync(["/tmp/a.wav"])[0]["text"].startswith("a.wav")
+        metrics = pool.metrics()
+        assert metrics["completed"] == 1
+        assert metrics["in_flight"] == 0
+        assert metrics["queue_depth"] == 0
+
+    def test_released_slot_wakes_waiting_coroutine(self, pool):
+        """Test that a slot freed by a sync caller admits a waiting coroutine."""
+        pool.max_queue_size = 1
+        pool._slots = type(pool._slots)(1)
+        assert pool._slots.acquire(timeout=0)
+
+        async def wait_then_release():
+            job = asyncio.ensure_future(pool.transcribe("/tmp/b.wav"))
+            await asyncio.sleep(0.05)
+            assert pool.metrics()["queue_depth"] == 1
+            await asyncio.to_thread(pool._slots.release)
+            return await job
+
+        assert asyncio.run(wait_then_release())["text"].startswith("b.wav")
+
+    def test_transcribe_batch_preserves_order(self, pool):
+        """Test that a batch job returns results in input order."""
+        paths = [f"/tmp/{i}.wav" for i in range(3)]
+
+        results = asyncio.run(pool.transcribe_batch(paths))
+
+        assert [r["text"].split(" ")[0] for r in results] == ["0.wav", "1.wav", "2.wav"]
+        assert pool.transcribe_batch_sync(paths[:1])[0]["text"].startswith("0.wav")
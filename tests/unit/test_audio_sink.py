@@ -0,0 +1,93 @@
+"""
+Tests for TTS audio sinks.
+"""
+
+import asyncio
+
+from src.ai.audio_sink import BufferSink, SegmentSink, TeeSink, WebSocketAudioSink
+
+
+class FakeWebSocket:
+    """Records frames sent to the client."""
+
+    def __init__(self):
+        self.frames = []
+
+    async def send_json(self, data):
+        self.frames.append(("json", data))
+
+    async def send_bytes(self, data):
+        self.frames.append(("bytes", data))
+
+
+class TestBufferSink:
+    """Test cases for BufferSink."""
+
+    def test_accumulates_chunks(self):
+        """Test that chunks are joined in order."""
+        sink = BufferSink()
+
+        async def write():
+            for chunk in (b"ab", b"cd", b"e"):
+                await sink.write(chunk)
+
+        asyncio.run(write())
+
+        view = sink.getvalue()
+        assert bytes(view) == b"abcde"
+        assert view.readonly
+        assert len(sink) == 5
+
+
+class TestWebSocketAudioSink:
+    """Test cases for WebSocketAudioSink."""
+
+    def test_forwards_chunks_with_control_frames(self):
+        """Test start/binary/end framing."""
+        websocket = FakeWebSocket()
+        buffer = BufferSink()
+        sink = TeeSink(buffer, WebSocketAudioSink(websocket, "turn-1"))
+
+        async def stream():
+            await sink.write(b"abc")
+            await sink.write(b"de")
+            await sink.close()
+
+        asyncio.run(stream())
+
+        assert websocket.frames == [
+            ("json", {"type": "feedback_audio_start", "turn_id": "turn-1"}),
+            ("bytes", b"abc"),
+            ("bytes", b"de"),
+            ("json", {"type": "feedback_audio_end", "turn_id": "turn-1", "bytes": 5}),
+        ]
+        assert bytes(buffer.getvalue()) == b"abcde"
+
+    def test_no_frames_without_audio(self):
+        """Test that an empty stream sends nothing."""
+        websocket = FakeWebSocket()
+
+        asyncio.run(WebSocketAudioSink(websocket, "turn-1").close())
+
+        assert websocket.frames == []
+
+
+class TestSegmentSink:
+    """Test cases for SegmentSink."""
+
+    def test_segments_share_one_stream(self):
+        """Test that per-segment closes do not end the underlying stream."""
+        ws = FakeWebSocket()
+        sink = WebSocketAudioSink(ws, "t1")
+
+        async def write():
+            for chunk in (b"one", b"two"):
+                segment = SegmentSink(sink)
+                await segment.write(chunk)
+                await segment.close()
+            await sink.close()
+
+        asyncio.run(write())
+
+        assert [kind for kind, _ in ws.frames] == ["json", "bytes", "bytes", "json"]
+        assert ws.frames[-1][1]["bytes"] == 6
@@ -0,0 +1,111 @@
+# 批量评分测试
+# 文件路径: tests/unit/test_batch_scoring.py
+
+import logging
+
+from src.algorithms.grammar_scorer import GrammarScorer
+from src.algorithms.university_match_scorer import UniversityMatchScorer
+from src.algorithms.vocabulary_scorer import VocabularyScorer
+from src.services.scoring_service import ScoringService
+
+
+ANSWERS = [
+    "",
+    "Hello.",
+    "He is a student. She are happy. It was fine. The cats run.",
+    "I want to study computer science and algorithms. My research is on machine learning and data. "
+    "Furthermore I analyze software networks. Consequently I implement a comprehensive methodology.",
+    "We designed robotics and aerospace simulation. He was late. I am not sure. "
+    "The dogs barked loudly at the mechanical design lab today. Energy matters.",
+    "Signal processing and semiconductor design in electronics communication technology. "
+    "Information is key. Short one. Another much longer sentence about integrated circuits here.",
+]
+
+TARGETS = [
+    (None, None),
+    ("西安交通大学", "计算机科学与技术"),
+    ("西北工业大学", "机械工程"),
+    ("西安交通大学", "计算机科学与技术"),
+    ("西安电子科技大学", "电子工程"),
+    ("未知大学", "未知专业"),
+]
+
+
+def make_items(repeat=1):
+    return [
+        {
+            "answer": answer,
+            "audio_url": f"http://example.com/{i}.wav",
+            "university": university,
+            "major": major,
+        }
+        for _ in range(repeat)
+        for i, (answer, (university, major)) in enumerate(zip(ANSWERS, TARGETS))
+    ]
+
+
+class TestVectorizedScorers:
+    def test_vocabulary_batch_matches_single(self):
+        scorer = VocabularyScorer()
+        batch = scorer.calculate_vocabulary_score_batch(ANSWERS)
+        assert batch == [scorer.calculate_vocabulary_score(t) for t in ANSWERS]
+
+    def test_grammar_batch_matches_single(self):
+        scorer = GrammarScorer()
+        batch = scorer.calculate_grammar_score_batch(ANSWERS)
+        assert batch == [scorer.calculate_grammar_score(t) for t in ANSWERS]
+
+    def test_university_batch_matches_single(self):
+        scorer = UniversityMatchScorer()
+        universities, majors = zip(*TARGETS[1:])
+        batch = scorer.calculate_match_score_batch(ANSWERS[1:], universities, majors)
+        assert batch == [
+            scorer.calculate_match_score(a, u, m)
+            for a, u, m in zip(ANSWERS[1:], universities, majors)
+        ]
+
+
+class TestEvaluateBatch:
+    def test_results_match_evaluate_in_order(self, scoring_service):
+        service = scoring_service
+        items = make_items()
+
+        report = service.evaluate_batch(items, chunk_size=4)
+
+        expected = [
+            service.evaluate(
+                question="",
+                answer=item["answer"],
+                audio_url=item["audio_url"],
+                university=item["university"],
+                major=item["major"],
+            )
+            for item in items
+        ]
+        assert report["results"] == expected
+
+    def test_reports_throughput(self, scoring_service):
+        report = scoring_service.evaluate_batch(make_items(repeat=20))
+
+        stats = report["stats"]
+        assert stats["items"] == 120
+        assert len(report["results"]) == 120
+        assert stats["items_per_second"] > 0
+        assert stats["degraded"] == 0
+
+    def test_failing_scorer_degrades_only_its_dimension(
+        self, scorers, failing_grammar_scorer, caplog
+    ):
+        scorers["grammar_scorer"] = failing_grammar_scorer
+        with caplog.at_level(logging.ERROR, logger="src.services.scoring_service"):
+            report = ScoringService(**scorers).evaluate_batch(make_items())
+
+        assert all(r["degraded_dimensions"] == ["grammar"] for r in report["results"])
+        assert report["stats"]["degraded"] == len(ANSWERS)
+        failures = [r for r in caplog.records if "grammar" in r.getMessage()]
+        assert failures and all(r.exc_info for r in failures)
+
+    def test_empty_batch(self, scoring_service):
+        report = scoring_service.evaluate_batch([])
+        assert report["results"] == []
+        assert report["stats"]["items"] == 0
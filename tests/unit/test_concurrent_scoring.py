@@ -0,0 +1,112 @@
+# 并发评分测试
+# 文件路径: tests/unit/test_concurrent_scoring.py
+
+import asyncio
+import time
+
+import pytest
+from src.services.scoring_service import ScoringService
+from src.algorithms.gop_scorer import GOPScorer
+from src.algorithms.fluency_scorer import FluencyScorer
+from src.algorithms.vocabulary_scorer import VocabularyScorer
+from src.algorithms.grammar_scorer import GrammarScorer
+from src.algorithms.university_match_scorer import UniversityMatchScorer
+
+
+class SlowGOPScorer(GOPScorer):
+    """GOP scorer that takes a fixed amount of time"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def calculate_gop_score(self, audio_url, text):
+        time.sleep(self.delay)
+        return super().calculate_gop_score(audio_url, text)
+
+
+class FailingGrammarScorer(GrammarScorer):
+    """Grammar scorer that always raises"""
+
+    def calculate_grammar_score(self, text):
+        raise RuntimeError("grammar backend unavailable")
+
+
+def make_service(**overrides):
+    scorers = {
+        "gop_scorer": GOPScorer(),
+        "fluency_scorer": FluencyScorer(),
+        "vocabulary_scorer": VocabularyScorer(),
+        "grammar_scorer": GrammarScorer(),
+        "university_match_scorer": UniversityMatchScorer(),
+    }
+    scorers.update(overrides)
+    return ScoringService(**scorers)
+
+
+class TestEvaluateAsync:
+    """Test concurrent evaluation"""
+
+    def test_matches_sequential_evaluate(self):
+        """Test that concurrent and sequential evaluation agree"""
+        service = make_service()
+        kwargs = dict(
+            question="Why do you want to study here?",
+            answer="I want to study computer science and algorithms",
+            audio_url="http://example.com/audio.wav",
+            university="西安交通大学",
+            major="计算机科学与技术",
+        )
+
+        sequential = service.evaluate(**kwargs)
+        concurrent = asyncio.run(service.evaluate_async(**kwargs))
+
+        assert concurrent == sequential
+        assert "degraded_dimensions" not in concurrent
+
+    def test_timeout_degrades_dimension(self, caplog):
+        """Test that a slow dimension is dropped instead of blocking"""
+        service = make_service(gop_scorer=SlowGOPScorer(delay=0.5))
+
+        result = asyncio.run(
+            service.evaluate_async(
+                question="Test question",
+                answer="This is a test answer",
+                audio_url="http://example.com/audio.wav",
+                timeouts={"pronunciation": 0.05},
+            )
+        )
+
+        assert result["degraded_dimensions"] == ["pronunciation"]
+        assert result["dimensions"]["pronunciation"]["degraded"] is True
+        assert 0 <= result["overall_score"] <= 100
+        assert "pronunciation timed out" in caplog.text
+
+    def test_failure_degrades_dimension(self, caplog):
+        """Test that a failing scorer does not fail the evaluation"""
+        service = make_service(grammar_scorer=FailingGrammarScorer())
+
+        result = asyncio.run(
+            service.evaluate_async(
+                question="Test question",
+                answer="This is a test answer",
+                audio_url="http://example.com/audio.wav",
+            )
+        )
+
+        assert result["degraded_dimensions"] == ["grammar"]
+        assert "Review grammar rules to improve accuracy" not in result["suggestions"]
+        assert "grammar failed" in caplog.text
+
+    def test_university_mode_does_not_leak_weights(self):
+        """Test that university mode leaves the default weights untouched"""
+        service = make_service()
+        service.evaluate(
+            question="Q",
+            answer="I like computer science",
+            audio_url="http://example.com/audio.wav",
+            university="西安交通大学",
+            major="计算机科学与技术",
+        )
+
+        assert service.weights["university_match"] == 0.0
+        assert service.weights["pronunciation"] == pytest.approx(0.25)
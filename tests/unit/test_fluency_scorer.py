@@ -0,0 +1,82 @@
+"""
+Tests for signal-based pause detection in FluencyScorer.
+"""
+
+import time
+
+import numpy as np
+import pytest
+from src.ai.audio_fetcher import AudioBuffer
+from src.algorithms.fluency_scorer import FluencyScorer
+
+
+SAMPLE_RATE = 16000
+
+
+def speech(seconds, amplitude=0.3):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 180 * t)).astype(np.float32)
+
+
+def silence(seconds, noise=0.002):
+    rng = np.random.default_rng(0)
+    return (noise * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+
+
+def buffer(*parts):
+    return AudioBuffer(np.concatenate(parts), SAMPLE_RATE)
+
+
+class TestPauseDetection:
+    def test_detects_pauses_between_speech(self):
+        audio = buffer(
+            silence(1.0), speech(2.0), silence(0.5), speech(1.0), silence(4.0), speech(1.0),
+            silence(1.0)
+        )
+
+        pauses = FluencyScorer()._detect_pauses(audio.samples, SAMPLE_RATE)
+
+        assert [p["type"] for p in pauses] == ["pause", "long_pause"]
+        assert pauses[0]["start"] == pytest.approx(3.0, abs=0.04)
+        assert pauses[0]["duration"] == pytest.approx(0.5, abs=0.04)
+        assert pauses[1]["duration"] == pytest.approx(4.0, abs=0.04)
+
+    def test_ignores_gaps_shorter_than_min_pause(self):
+        audio = buffer(speech(1.0), silence(0.1), speech(1.0))
+
+        assert FluencyScorer()._detect_pauses(audio.samples, SAMPLE_RATE) == []
+
+    def test_silent_audio_has_no_pauses(self):
+        audio = buffer(silence(2.0))
+
+        assert FluencyScorer()._detect_pauses(audio.samples, SAMPLE_RATE) == []
+
+    def test_score_uses_signal_pauses_and_duration(self):
+        audio = buffer(speech(2.0), silence(1.0), speech(3.0))
+        text = " ".join(["word"] * 12)
+
+        result = FluencyScorer().calculate_fluency_score(audio, text)
+
+        assert result["speech_rate"] == 120.0
+        assert len(result["pauses"]) == 1
+        assert result["pause_frequency"] == 10.0
+
+    def test_falls_back_to_transcript_without_audio(self):
+        result = FluencyScorer().calculate_fluency_score(
+            "http://example.com/a.wav", "First sentence. Second sentence."
+        )
+
+        assert result["pauses"][0]["type"] == "sentence_boundary"
+
+    def test_minute_of_audio_is_cheap(self):
+        audio = buffer(*([speech(0.8), silence(0.4)] * 50))
+        scorer = FluencyScorer()
+        scorer._detect_pauses(audio.samples, SAMPLE_RATE)
+
+        started = time.perf_counter()
+        for _ in range(10):
+            pauses = scorer._detect_pauses(audio.samples, SAMPLE_RATE)
+        elapsed = (time.perf_counter() - started) / 10
+
+        assert len(pauses) == 49
+        assert elapsed < 0.05
@@ -0,0 +1,140 @@
+# GOP发音评分器测试
+# 文件路径: tests/unit/test_gop_scorer.py
+
+import time
+
+import numpy as np
+import pytest
+from src.ai.audio_fetcher import AudioBuffer
+from src.algorithms.acoustic_model import SAMPLE_RATE, GaussianPhoneModel
+from src.algorithms.acoustic_model import log_mel_features
+from src.algorithms.gop_scorer import GOPScorer
+from src.algorithms.pronunciation import PronunciationDictionary
+
+
+PHONES = ("SIL", "AA", "IY", "S")
+DICTIONARY = PronunciationDictionary.build(
+    [("saw", ["S", "AA"]), ("see", ["S", "IY"]), ("ah", ["AA"]), ("ee", ["IY"])]
+)
+
+
+def sound(phone, seconds, rng):
+    """Synthetic waveform standing in for a phone"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    if phone == "SIL":
+        return 0.001 * rng.standard_normal(len(t))
+    if phone == "AA":
+        return 0.3 * np.sin(2 * np.pi * 300 * t) + 0.2 * np.sin(2 * np.pi * 900 * t)
+    if phone == "IY":
+        return 0.3 * np.sin(2 * np.pi * 2500 * t) + 0.1 * np.sin(2 * np.pi * 250 * t)
+    noise = rng.standard_normal(len(t))
+    return 0.2 * np.diff(noise, prepend=0.0)
+
+
+def utterance(phones, rng, seconds=0.15):
+    """Waveform of a phone sequence with leading and trailing silence"""
+    parts = [sound(p, seconds, rng) for p in ("SIL", *phones, "SIL")]
+    return AudioBuffer(np.concatenate(parts).astype(np.float32))
+
+
+@pytest.fixture(scope="module")
+def model():
+    rng = np.random.default_rng(0)
+    features, labels = [], []
+    for index, phone in enumerate(PHONES):
+        for _ in range(5):
+            x = log_mel_features(sound(phone, 0.5, rng).astype(np.float32))
+            features.append(x)
+            labels.append(np.full(len(x), index))
+    return GaussianPhoneModel.fit(features, labels, PHONES)
+
+
+@pytest.fixture
+def scorer(model):
+    return GOPScorer(acoustic_model=model, dictionary=DICTIONARY)
+
+
+class TestGOPScorer:
+    """Test forced alignment and log posterior ratio scoring"""
+
+    def test_correct_pronunciation_scores_high(self, scorer):
+        rng = np.random.default_rng(1)
+        audio = utterance(["S", "IY", "SIL", "S", "AA"], rng)
+
+        result = scorer.calculate_gop_score(audio, "See, saw.")
+
+        assert result["method"] == "gop"
+        assert [p["phoneme"] for p in result["phoneme_scores"]] == [
+            "S",
+            "IY",
+            "S",
+            "AA",
+        ]
+        assert [w["word"] for w in result["word_scores"]] == ["see", "saw"]
+        assert all(p["score"] > 80 for p in result["phoneme_scores"])
+        assert result["overall_score"] > 80
+
+    def test_substituted_phone_scores_low(self, scorer):
+        rng = np.random.default_rng(2)
+        # The speaker says "see" where the transcript expects "saw"
+        audio = utterance(["S", "IY", "SIL", "S", "IY"], rng)
+
+        result = scorer.calculate_gop_score(audio, "see saw")
+        scores = {
+            (p["word"], p["phoneme"]): p["score"] for p in result["phoneme_scores"]
+        }
+
+        assert scores[("saw", "AA")] < 30
+        assert scores[("see", "IY")] > 80
+        assert result["word_scores"][1]["score"] < result["word_scores"][0]["score"]
+
+    def test_segments_follow_the_audio(self, scorer):
+        rng = np.random.default_rng(3)
+        audio = utterance(["AA", "IY"], rng, seconds=0.3)
+
+        result = scorer.calculate_gop_score(audio, "ah ee")
+        ah, ee = result["phoneme_scores"]
+
+        assert ah["start"] == pytest.approx(0.3, abs=0.05)
+        assert ah["end"] <= ee["start"]
+        assert ee["start"] == pytest.approx(0.6, abs=0.05)
+        assert ee["end"] == pytest.approx(0.9, abs=0.05)
+
+    def test_falls_back_to_text_estimate(self, model):
+        audio = utterance(["S", "AA"], np.random.default_rng(4))
+
+        no_model = GOPScorer(dictionary=DICTIONARY)
+        no_model.acoustic_model = None
+        too_short = GOPScorer(acoustic_model=model, dictionary=DICTIONARY)
+
+        assert no_model.calculate_gop_score(audio, "saw")["method"] == "heuristic"
+        short_audio = AudioBuffer(audio.samples[:800])
+        result = too_short.calculate_gop_score(short_audio, "saw see saw see")
+        assert result["phoneme_scores"][0]["phoneme"] == "saw"
+        assert result["method"] == "heuristic"
+
+    def test_missing_model_is_logged_once(self, monkeypatch, caplog):
+        monkeypatch.setattr(GOPScorer, "_missing_model_logged", False)
+        monkeypatch.setattr(GOPScorer, "acoustic_model", None)
+
+        GOPScorer(dictionary=DICTIONARY).calculate_gop_score(None, "saw")
+        GOPScorer(dictionary=DICTIONARY).calculate_gop_score(None, "see")
+
+        warnings = [r for r in caplog.records if "acoustic model" in r.getMessage()]
+        assert len(warnings) == 1
+
+    def test_thirty_second_answer_is_fast(self, scorer):
+        rng = np.random.default_rng(5)
+        words = ["see", "saw"] * 75
+        phones = [p for w in words for p in DICTIONARY.phonemes(w)]
+        audio = utterance(phones, rng, seconds=30 / len(phones))
+        text = " ".join(words)
+        scorer.calculate_gop_score(audio, text)
+
+        start = time.perf_counter()
+        result = scorer.calculate_gop_score(audio, text)
+        elapsed = time.perf_counter() - start
+
+        assert len(result["phoneme_scores"]) == 300
+        assert elapsed < 0.2
+
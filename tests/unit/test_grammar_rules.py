@@ -0,0 +1,159 @@
+"""
+Tests for the precompiled grammar rule engine.
+"""
+
+import json
+import re
+import time
+
+import pytest
+from src.algorithms.grammar_rules import DEFAULT_ENGINE, GrammarRuleEngine
+from src.algorithms.grammar_scorer import GrammarScorer
+from src.algorithms.text_analysis import AnalyzedText
+
+
+def synthetic_rules(count):
+    """Rules keyed on distinct made-up trigger words."""
+    return {
+        "version": "test",
+        "rules": [
+            {
+                "id": f"rule_{i}",
+                "error_type": f"type_{i}",
+                "pattern": rf"\bzq{i}x\s+\w+",
+                "triggers": [f"zq{i}x"],
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def scan_time(engine, text, repeats=200):
+    analysis = AnalyzedText(text)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        engine.scan(analysis)
+    return time.perf_counter() - start
+
+
+class TestGrammarRuleEngine:
+    def test_loads_bundled_rule_set(self, tmp_path):
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps(synthetic_rules(3)))
+
+        engine = GrammarRuleEngine.from_file(str(path))
+
+        assert len(engine) == 3
+        assert engine.version == "test"
+        assert len(DEFAULT_ENGINE) > 0
+
+    def test_invalid_rule_is_rejected(self):
+        with pytest.raises(ValueError):
+            GrammarRuleEngine.from_data({"rules": [{"id": "x", "pattern": "("}]})
+
+    def test_matches_map_back_to_rules_in_sentence_order(self):
+        text = "She is not here. The cats sleep. It was he is"
+
+        matches = DEFAULT_ENGINE.scan(AnalyzedText(text))
+
+        assert [(m.rule.error_type, m.sentence, m.text) for m in matches] == [
+            ("subject_verb_agreement", 0, "She is"),
+            ("negation_error", 0, "is not"),
+            ("noun_verb_agreement", 1, "The cats"),
+            ("subject_verb_agreement", 2, "It was"),
+            ("subject_verb_agreement", 2, "he is"),
+        ]
+        assert text[matches[2].start:matches[2].end] == "The cats"
+
+    def test_untriggered_rules_scan_each_sentence(self):
+        engine = GrammarRuleEngine.from_data(
+            {
+                "rules": [
+                    {"id": "comma", "error_type": "punctuation", "pattern": ",,"},
+                    {"id": "space", "error_type": "punctuation", "pattern": r"\s,"},
+                    {
+                        "id": "be",
+                        "error_type": "be",
+                        "pattern": r"\bis\b",
+                        "triggers": ["is"],
+                    },
+                ]
+            }
+        )
+
+        matches = engine.scan(AnalyzedText("It is ,, fine. Is it , ok"))
+
+        assert [(m.rule.id, m.sentence) for m in matches] == [
+            ("comma", 0),
+            ("space", 0),
+            ("be", 0),
+            ("space", 1),
+            ("be", 1),
+        ]
+
+    def test_each_rule_keeps_its_own_finditer_matches(self):
+        rules = [r"\b(he|she|it)\s+\b(is|are|was)", r"\b(am|is|are)\s+not\b"]
+        triggers = [["he", "she", "it"], ["am", "is", "are"]]
+        engine = GrammarRuleEngine.from_data(
+            {
+                "rules": [
+                    {"id": str(i), "error_type": str(i), "pattern": p, "triggers": t}
+                    for i, (p, t) in enumerate(zip(rules, triggers))
+                ]
+            }
+        )
+        sentence = "he is not, she are not and it was"
+
+        matches = engine.scan(AnalyzedText(sentence))
+        found = sorted((m.rule.index, m.start) for m in matches)
+        expected = sorted(
+            (i, m.start())
+            for i, pattern in enumerate(rules)
+            for m in re.finditer(pattern, sentence, re.IGNORECASE)
+        )
+
+        assert found == expected
+
+    def test_overlapping_untriggered_rules_keep_their_matches(self):
+        rules = [r"\bis\s+not\b", r"\bis\b", r"not\s+\w+"]
+        engine = GrammarRuleEngine.from_data(
+            {
+                "rules": [
+                    {"id": str(i), "error_type": str(i), "pattern": p}
+                    for i, p in enumerate(rules)
+                ]
+            }
+        )
+        sentence = "it is not here and he is not there"
+
+        matches = engine.scan(AnalyzedText(sentence))
+        found = sorted((m.rule.index, m.start, m.text) for m in matches)
+        expected = sorted(
+            (i, m.start(), m.group())
+            for i, pattern in enumerate(rules)
+            for m in re.finditer(pattern, sentence, re.IGNORECASE)
+        )
+
+        assert found == expected
+        assert len(found) == 6
+
+    def test_cost_does_not_grow_with_rule_count(self):
+        text = " ".join(["zq1x word and some other ordinary words here."] * 20)
+        small = GrammarRuleEngine.from_data(synthetic_rules(5))
+        large = GrammarRuleEngine.from_data(synthetic_rules(500))
+
+        assert len(large.scan(AnalyzedText(text))) == 20
+        assert scan_time(large, text) < scan_time(small, text) * 3
+
+
+class TestGrammarScorerRules:
+    def test_scorer_uses_injected_engine(self):
+        engine = GrammarRuleEngine.from_data(synthetic_rules(2))
+        scorer = GrammarScorer(rule_engine=engine)
+
+        result = scorer.calculate_grammar_score("zq0x foo. fine text. zq1x bar")
+        batch = scorer.calculate_grammar_score_batch(["zq0x foo. fine text. zq1x bar"])
+
+        assert [e["error_type"] for e in result["errors"]] == ["type_0", "type_1"]
+        assert batch[0] == result
+        assert GrammarScorer().rule_engine is DEFAULT_ENGINE
@@ -0,0 +1,80 @@
+"""
+Tests for the keyword automaton used by university matching.
+"""
+
+import random
+import time
+
+from src.algorithms.keyword_automaton import KeywordAutomaton
+from src.algorithms.university_match_scorer import UniversityMatchScorer
+
+
+class TestKeywordAutomaton:
+    def test_finds_overlapping_keywords(self):
+        automaton = KeywordAutomaton(
+            [(kw, "k") for kw in ["he", "she", "his", "hers"]]
+        )
+
+        found = {
+            (s, e, automaton.keywords[k]) for s, e, k in automaton.find("ushers")
+        }
+
+        assert found == {(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")}
+
+    def test_maps_multi_word_keywords_to_tokens(self):
+        automaton = KeywordAutomaton(
+            [("Signal  Processing", "keyword"), ("data", "major")]
+        )
+
+        tokens = "we study signal processing on databases".split()
+
+        matches = automaton.scan_tokens(tokens)
+
+        assert matches.keywords("keyword") == [(2, "signal processing")]
+        assert matches.covered_tokens("keyword", whole_tokens=True) == 2
+        assert matches.covered_tokens("major", whole_tokens=True) == 0
+        assert matches.covered_tokens("major", whole_tokens=False) == 1
+
+    def test_scan_cost_does_not_grow_with_keyword_count(self):
+        random.seed(0)
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        many = ["".join(random.choices(letters, k=8)) for _ in range(5000)]
+        text = "the applicant studies circuits and signal processing " * 50
+
+        def scan_time(automaton):
+            start = time.perf_counter()
+            for _ in range(20):
+                list(automaton.find(text))
+            return time.perf_counter() - start
+
+        small = KeywordAutomaton([(kw, "k") for kw in many[:5]])
+        large = KeywordAutomaton([(kw, "k") for kw in many])
+
+        assert scan_time(large) < scan_time(small) * 3
+
+
+class TestUniversityKeywordMatching:
+    def test_multi_word_keywords_are_matched(self):
+        result = UniversityMatchScorer().calculate_match_score(
+            "I built an integrated circuit for signal processing and AI",
+            "西安电子科技大学",
+            "电子工程",
+        )
+
+        assert result["matched_keywords"] == [
+            "integrated circuit",
+            "circuit",
+            "signal processing",
+        ]
+
+    def test_major_keywords_match_inside_tokens(self):
+        scorer = UniversityMatchScorer()
+
+        result = scorer.calculate_match_score(
+            "databases and computers", "西安交通大学", "计算机科学与技术"
+        )
+
+        # "data" in "databases" and "computer" in "computers"
+        assert result["major_match_score"] == 2 / 3 * 100
+        # Domain keywords must match whole tokens
+        assert result["domain_match_score"] == 0
@@ -0,0 +1,135 @@
+"""
+Tests for the reloadable university/major knowledge base.
+"""
+
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+from src.algorithms.knowledge_base import (
+    DEFAULT_KNOWLEDGE_BASE,
+    KnowledgeBase,
+    KnowledgeBaseStore,
+)
+from src.algorithms.university_match_scorer import UniversityMatchScorer
+
+
+def write_kb(path, version, domain):
+    data = {
+        "version": version,
+        "universities": {
+            "测试大学": {"domain": domain, "keywords": ["Deep Learning"]}
+        },
+        "majors": {"测试专业": ["Data"]},
+    }
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    # Make sure the change is visible even on coarse mtime filesystems
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+
+@pytest.fixture
+def kb_path(tmp_path):
+    path = tmp_path / "kb.json"
+    write_kb(path, "1", ["robotics"])
+    return path
+
+
+class TestKnowledgeBase:
+    def test_bundled_knowledge_base_loads(self):
+        kb = DEFAULT_KNOWLEDGE_BASE.current
+
+        assert kb.version
+        assert "西安交通大学" in kb.universities
+        keywords = kb.universities["西安电子科技大学"]["keywords"]
+        assert "integrated circuit" in keywords
+
+    def test_snapshot_is_normalized_and_immutable(self, kb_path):
+        kb = KnowledgeBase.from_file(str(kb_path))
+
+        assert kb.universities["测试大学"]["keywords"] == ("deep learning",)
+        assert kb.majors["测试专业"] == ("data",)
+        with pytest.raises(TypeError):
+            kb.majors["新专业"] = ("x",)
+
+    def test_unknown_targets_use_empty_automaton(self, kb_path):
+        kb = KnowledgeBase.from_file(str(kb_path))
+
+        assert len(kb.university_automaton("未知大学")) == 0
+        assert len(kb.major_automaton(None)) == 0
+
+    def test_invalid_file_is_rejected(self):
+        with pytest.raises(ValueError):
+            KnowledgeBase.from_data({"version": 1, "universities": {}})
+
+
+class TestKnowledgeBaseStore:
+    def test_reload_swaps_snapshot_for_scorer(self, kb_path):
+        store = KnowledgeBaseStore(str(kb_path))
+        scorer = UniversityMatchScorer(knowledge_base=store)
+        answer = "robotics and aerospace"
+
+        before = scorer.calculate_match_score(answer, "测试大学", "测试专业")
+        assert store.reload_if_changed() is False
+
+        write_kb(kb_path, "2", ["aerospace", "robotics"])
+        assert store.reload_if_changed() is True
+        after = scorer.calculate_match_score(answer, "测试大学", "测试专业")
+
+        assert store.current.version == "2"
+        assert before["domain_match_score"] == pytest.approx(100 / 3)
+        assert after["domain_match_score"] == pytest.approx(200 / 3)
+
+    def test_failed_reload_keeps_previous_snapshot(self, kb_path):
+        store = KnowledgeBaseStore(str(kb_path))
+        previous = store.current
+
+        kb_path.write_text("{not json", encoding="utf-8")
+        with pytest.raises(ValueError):
+            store.reload()
+
+        assert store.current is previous
+
+    def test_readers_see_complete_snapshots_during_reloads(self, kb_path):
+        store = KnowledgeBaseStore(str(kb_path))
+        scorer = UniversityMatchScorer(knowledge_base=store)
+        errors = []
+        stop = threading.Event()
+
+        def read():
+            while not stop.is_set():
+                result = scorer.calculate_match_score(
+                    "robotics", "测试大学", "测试专业"
+                )
+                if result["domain_match_score"] != 100:
+                    errors.append(result)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for version in range(20):
+            write_kb(kb_path, str(version), ["robotics", f"topic{version}"])
+            store.reload()
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+        assert errors == []
+
+    def test_watch_reloads_changed_file(self, kb_path):
+        store = KnowledgeBaseStore(str(kb_path))
+
+        async def run():
+            watcher = asyncio.create_task(store.watch(0.01))
+            write_kb(kb_path, "2", ["robotics"])
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if store.current.version == "2":
+                    break
+            watcher.cancel()
+
+        asyncio.run(run())
+
+        assert store.current.version == "2"
@@ -0,0 +1,88 @@
+"""
+Tests for the memory-mapped CEFR lexicon.
+"""
+
+import numpy as np
+import pytest
+from src.algorithms.lexicon import (
+    DEFAULT_LEXICON,
+    DEFAULT_LEXICON_PATH,
+    DEFAULT_LEXICON_SOURCE,
+    Lexicon,
+)
+from src.algorithms.vocabulary_scorer import VocabularyScorer
+
+
+ENTRIES = [
+    ("run", "A1", False),
+    ("study", "A1", False),
+    ("analyze", "C1", True),
+    ("data", "B2", True),
+    ("area", "A2", True),
+    ("ubiquitous", "C2", False),
+]
+
+
+@pytest.fixture
+def lexicon(tmp_path):
+    path = str(tmp_path / "lexicon.npy")
+    Lexicon.build(ENTRIES).save(path)
+    return Lexicon.open(path)
+
+
+class TestLexicon:
+    def test_opens_as_read_only_memory_map(self, lexicon):
+        assert isinstance(lexicon._entries, np.memmap)
+        assert not lexicon._entries.flags.writeable
+        assert len(lexicon) == len(ENTRIES)
+
+    def test_lookup_returns_band_per_token(self, lexicon):
+        bands, academic = lexicon.lookup(["data", "ubiquitous", "zzz", "data"])
+
+        assert bands.tolist() == [4, 6, 0, 4]
+        assert academic.tolist() == [True, False, False, True]
+
+    def test_inflected_forms_resolve_to_lemmas(self, lexicon):
+        assert lexicon.band("Analyzed") == "C1"
+        assert lexicon.band("studies") == "A1"
+        assert lexicon.band("running") == "A1"
+        assert lexicon.band("x" * 40) is None
+
+    def test_non_ascii_words_are_unknown(self, lexicon):
+        bands, academic = lexicon.lookup(["café", "data", "naïve", "dåta"])
+
+        assert bands.tolist() == [0, 4, 0, 0]
+        assert academic.tolist() == [False, True, False, False]
+        assert DEFAULT_LEXICON.band("café") is None
+
+    def test_rejects_unknown_band(self):
+        with pytest.raises(ValueError):
+            Lexicon.build([("word", "D1", False)])
+
+    def test_bundled_lexicon_matches_source(self):
+        source = Lexicon.from_tsv(DEFAULT_LEXICON_SOURCE)
+
+        assert DEFAULT_LEXICON.path == DEFAULT_LEXICON_PATH
+        assert np.array_equal(np.asarray(DEFAULT_LEXICON._entries), source._entries)
+
+
+class TestVocabularyScorerLexicon:
+    def test_advanced_words_come_from_bands(self, lexicon):
+        scorer = VocabularyScorer(lexicon=lexicon)
+
+        result = scorer.calculate_vocabulary_score(
+            "We analyzed data in the area and it was ubiquitous"
+        )
+
+        # C1+ words and B2+ academic words; "area" is academic but A2
+        assert result["advanced_words"] == ["analyzed", "data", "ubiquitous"]
+        assert result["cefr_profile"]["C2"] == 1
+        assert result["cefr_profile"]["unknown"] == 6
+
+    def test_batch_matches_single(self, lexicon):
+        scorer = VocabularyScorer(lexicon=lexicon)
+        texts = ["", "data data", "We analyzed the ubiquitous area", "run"]
+
+        assert scorer.calculate_vocabulary_score_batch(texts) == [
+            scorer.calculate_vocabulary_score(t) for t in texts
+        ]
@@ -0,0 +1,214 @@
+# LLM异步接口测试
+# 文件路径: tests/unit/test_llm_async.py
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from src.ai.llm_service import LLMService, LLMTimeoutError
+
+
+class FakeCompletions:
+    """OpenAI-style completions endpoint with a fixed latency"""
+
+    def __init__(self, reply="Fine.", delay=0.0):
+        self.reply = reply
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.requests = []
+
+    async def create(self, **request):
+        self.requests.append(request)
+        if request.get("stream"):
+            return self._stream()
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        message = SimpleNamespace(content=self.reply)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+    async def _stream(self):
+        self.active += 1
+        try:
+            for token in self.reply.split(" "):
+                await asyncio.sleep(self.delay)
+                delta = SimpleNamespace(content=token + " ")
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+        finally:
+            self.active -= 1
+
+
+def make_service(completions, **kwargs):
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return LLMService(api_key="test", async_client=client, **kwargs)
+
+
+class TestLLMServiceAsync:
+    """Test pooled, bounded async LLM calls"""
+
+    def test_async_variants_share_prompts(self):
+        completions = FakeCompletions(reply="Why?\nHow?")
+        service = make_service(completions)
+
+        follow_up = asyncio.run(
+            service.generate_follow_up_async("Q", "A", pressure_level=3)
+        )
+
+        assert follow_up == ["Why?", "How?"]
+        request = completions.requests[0]
+        assert request["model"] == service.model_name
+        assert [m["role"] for m in request["messages"]] == ["system", "user"]
+        assert "challenging and probing" in request["messages"][1]["content"]
+
+    def test_semaphore_bounds_in_flight_calls(self):
+        completions = FakeCompletions(delay=0.02)
+        service = make_service(completions, max_concurrency=4)
+
+        async def scenario():
+            messages = [{"role": "user", "content": "hi"}]
+            return await asyncio.gather(
+                *(service.chat_async(messages) for _ in range(40))
+            )
+
+        replies = asyncio.run(scenario())
+
+        assert replies == ["Fine."] * 40
+        assert completions.peak == 4
+        assert service.get_stats()["completed"] == 40
+
+    def test_timeout_releases_slot(self):
+        completions = FakeCompletions(delay=1.0)
+        service = make_service(completions, max_concurrency=1)
+
+        async def scenario():
+            messages = [{"role": "user", "content": "hi"}]
+            with pytest.raises(LLMTimeoutError):
+                await service.chat_async(messages, timeout=0.05)
+            completions.delay = 0.0
+            return await service.chat_async(messages)
+
+        assert asyncio.run(scenario()) == "Fine."
+        assert service.get_stats()["timeouts"] == 1
+        assert service.get_stats()["in_flight"] == 0
+
+    def test_cancellation_releases_slot(self):
+        completions = FakeCompletions(delay=1.0)
+        service = make_service(completions, max_concurrency=1)
+
+        async def scenario():
+            task = asyncio.ensure_future(
+                service.generate_feedback_async("Q", "A", {"overall_score": 80})
+            )
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            completions.delay = 0.0
+            return await service.generate_question_async({"university": "XJTU"})
+
+        assert asyncio.run(scenario()) == "Fine."
+        assert service.get_stats()["cancelled"] == 1
+        assert completions.active == 0
+
+    def test_feedback_streams_tokens(self):
+        completions = FakeCompletions(reply="Nice work. Slow down.", delay=0.01)
+        service = make_service(completions, max_concurrency=1)
+
+        async def scenario():
+            tokens = []
+            stream = service.stream_feedback_async("Q", "A", {"overall_score": 80})
+            async for token in stream:
+                tokens.append(token)
+                assert service.get_stats()["in_flight"] == 1
+            return tokens
+
+        tokens = asyncio.run(scenario())
+
+        assert "".join(tokens) == "Nice work. Slow down. "
+        assert completions.requests[0]["stream"] is True
+        assert service.get_stats()["in_flight"] == 0
+        assert service.get_stats()["completed"] == 1
+
+    def test_feedback_stream_timeout(self):
+        completions = FakeCompletions(reply="one two three", delay=0.05)
+        service = make_service(completions)
+
+        async def scenario():
+            async for _ in service.stream_feedback_async("Q", "A", {}, timeout=0.08):
+                pass
+
+        with pytest.raises(LLMTimeoutError):
+            asyncio.run(scenario())
+        assert service.get_stats()["in_flight"] == 0
+        assert completions.active == 0
+
+
+    def test_new_event_loop_closes_previous_pool(self):
+        clients = []
+
+        class PooledService(LLMService):
+            def _create_async_client(self):
+                client = SimpleNamespace(
+                    chat=SimpleNamespace(completions=FakeCompletions()),
+                    closed=False
+                )
+
+                async def close():
+                    client.closed = True
+
+                client.close = close
+                clients.append(client)
+                return client
+
+        service = PooledService(api_key="test")
+        messages = [{"role": "user", "content": "hi"}]
+
+        asyncio.run(service.chat_async(messages))
+
+        async def second_loop():
+            await service.chat_async(messages)
+            await service.aclose()
+
+        asyncio.run(second_loop())
+
+        assert len(clients) == 2
+        assert all(client.closed for client in clients)
+
+
+class TestFeedbackAndFollowUp:
+    """Test combined feedback + follow-up generation"""
+
+    def test_combined_single_call(self):
+        completions = FakeCompletions(
+            reply='```json\n{"feedback": " Clear answer. ", '
+                  '"follow_up_questions": ["Why XJTU?", " "]}\n```'
+        )
+        service = make_service(completions)
+
+        result = asyncio.run(service.generate_feedback_and_follow_up_async(
+            "Q", "A", {"overall_score": 80}, pressure_level=3
+        ))
+
+        assert result == {
+            "feedback": "Clear answer.",
+            "follow_up_questions": ["Why XJTU?"]
+        }
+        assert len(completions.requests) == 1
+        assert service.get_stats()["combined_fallbacks"] == 0
+
+    def test_invalid_json_falls_back_to_two_calls(self):
+        completions = FakeCompletions(reply='{"feedback": "Good.", "follow_up_questions": []}')
+        service = make_service(completions)
+
+        result = asyncio.run(service.generate_feedback_and_follow_up_async(
+            "Q", "A", {"overall_score": 80}
+        ))
+
+        assert len(completions.requests) == 3
+        assert result["feedback"] == completions.reply
+        assert service.get_stats()["combined_fallbacks"] == 1
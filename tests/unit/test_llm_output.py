@@ -0,0 +1,76 @@
+# LLM输出解析测试
+# 文件路径: tests/unit/test_llm_output.py
+
+import pytest
+from src.ai.llm_output import (
+    FeedbackWithFollowUp,
+    extract_json,
+    parse_feedback_and_follow_up,
+    parse_follow_up
+)
+
+
+class TestExtractJson:
+    """Test JSON extraction from model output"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ('{"a": 1}', {"a": 1}),
+        ('```json\n{"a": 1}\n```', {"a": 1}),
+        ('Here you go: {"a": [1, 2]} Hope it helps.', {"a": [1, 2]}),
+        ("no json here", None),
+        ('{"a": 1', None),
+    ])
+    def test_extract_json(self, text, expected):
+        assert extract_json(text) == expected
+
+
+class TestParseFollowUp:
+    """Test the follow-up question parser"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ('["Why?", "How?"]', ["Why?", "How?"]),
+        ('Sure:\n{"questions": ["Why?"]}', ["Why?"]),
+        (
+            "Here are two follow-up questions:\n\n"
+            "1. **Why did you choose this major?**\n"
+            "2) What would you research?",
+            ["Why did you choose this major?", "What would you research?"]
+        ),
+        ("- Why? How?\n- Why?", ["Why?", "How?"]),
+        ('Q1: "Why XJTU?"', ["Why XJTU?"]),
+        ("Follow-up question 1: Tell me more.", ["Tell me more."]),
+    ])
+    def test_parse_follow_up(self, text, expected):
+        assert parse_follow_up(text) == expected
+
+
+class TestFeedbackWithFollowUp:
+    """Test validation of combined feedback + follow-up output"""
+
+    def test_valid_output_is_normalized(self):
+        text = (
+            '```json\n{"feedback": " Clear answer. ", '
+            '"follow_up_questions": ["Why XJTU?", " "], "extra": 1}\n```'
+        )
+
+        assert parse_feedback_and_follow_up(text) == {
+            "feedback": "Clear answer.",
+            "follow_up_questions": ["Why XJTU?"]
+        }
+
+    @pytest.mark.parametrize("data", [
+        ["Why?"],
+        {"follow_up_questions": ["Why?"]},
+        {"feedback": "  ", "follow_up_questions": ["Why?"]},
+        {"feedback": 3, "follow_up_questions": ["Why?"]},
+        {"feedback": "Good.", "follow_up_questions": []},
+        {"feedback": "Good.", "follow_up_questions": ["  "]},
+        {"feedback": "Good.", "follow_up_questions": "Why?"},
+        {"feedback": "Good.", "follow_up_questions": ["Why?", 2]},
+    ])
+    def test_invalid_output_is_rejected(self, data):
+        with pytest.raises(ValueError):
+            FeedbackWithFollowUp.validate(data)
+
+    def test_unparseable_output_returns_none(self):
+        assert parse_feedback_and_follow_up("Great job! Why XJTU?") is None
@@ -0,0 +1,106 @@
+"""
+Tests for the memory-mapped pronunciation dictionary.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+from src.algorithms.pronunciation import (
+    DEFAULT_DICTIONARY,
+    DEFAULT_DICTIONARY_PATH,
+    DEFAULT_DICTIONARY_SOURCE,
+    PronunciationDictionary,
+    letter_to_sound,
+)
+
+
+ENTRIES = [
+    ("hello", ["HH", "AH", "L", "OW"]),
+    ("world", ["W", "ER", "L", "D"]),
+    ("study", ["S", "T", "AH", "D", "IY"]),
+    ("hello", ["HH", "EH", "L", "OW"]),
+]
+
+
+class CountingG2P:
+    """G2P model that counts predictions"""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, word):
+        self.calls.append(word)
+        return letter_to_sound(word)
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    path = str(tmp_path / "pronunciations.npy")
+    PronunciationDictionary.build(ENTRIES).save(path)
+    return PronunciationDictionary.open(path, g2p=CountingG2P(), cache_size=2)
+
+
+class TestPronunciationDictionary:
+    def test_opens_as_read_only_memory_map(self, dictionary):
+        assert isinstance(dictionary._entries, np.memmap)
+        assert not dictionary._entries.flags.writeable
+        assert len(dictionary) == 3
+
+    def test_lookup_returns_first_pronunciation(self, dictionary):
+        assert dictionary.lookup_many(["Hello", "zzz", "study", ""]) == [
+            ("HH", "AH", "L", "OW"),
+            None,
+            ("S", "T", "AH", "D", "IY"),
+            None,
+        ]
+        assert "world" in dictionary
+        assert "x" * 40 not in dictionary
+
+    def test_oov_words_are_predicted_once(self, dictionary):
+        words = ["ship", "world", "ship", "Ship"]
+
+        phones = dictionary.phonemes_many(words)
+
+        assert phones[0] == phones[2] == phones[3] == ("SH", "IH", "P")
+        assert dictionary.g2p.calls == ["ship"]
+        assert dictionary.cache_hits == 2
+
+    def test_prediction_cache_is_bounded(self, dictionary):
+        for word in ["aaa", "bbb", "ccc", "aaa"]:
+            dictionary.phonemes(word)
+
+        assert dictionary.g2p.calls == ["aaa", "bbb", "ccc", "aaa"]
+        assert list(dictionary._predicted) == ["ccc", "aaa"]
+
+    def test_concurrent_lookups(self, dictionary):
+        results = []
+
+        def worker():
+            results.append(dictionary.phonemes_many(["hello", "ship"] * 50))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(r == results[0] for r in results)
+        assert dictionary.predictions + dictionary.cache_hits == 200
+
+    def test_rejects_unknown_phones(self):
+        with pytest.raises(ValueError):
+            PronunciationDictionary.build([("word", ["W", "XX"])])
+
+    def test_bundled_dictionary_matches_source(self):
+        source = PronunciationDictionary.from_file(DEFAULT_DICTIONARY_SOURCE)
+
+        assert DEFAULT_DICTIONARY.path == DEFAULT_DICTIONARY_PATH
+        assert np.array_equal(
+            np.asarray(DEFAULT_DICTIONARY._entries), source._entries
+        )
+        assert DEFAULT_DICTIONARY.lookup("Hello") == ("HH", "AH", "L", "OW")
+
+    def test_letter_to_sound(self):
+        assert letter_to_sound("make") == ("M", "AE", "K")
+        assert letter_to_sound("city") == ("S", "IH", "T", "IY")
@@ -0,0 +1,184 @@
+# 题目语音预渲染测试
+# 文件路径: tests/unit/test_question_audio_service.py
+
+import asyncio
+
+from src.services.question_audio_service import QuestionAudioPrerenderer
+
+
+class FakeQuestion:
+    """Question with the audio_urls helpers of models.question.Question"""
+
+    def __init__(self, question_id, content):
+        self.id = question_id
+        self.content = content
+        self.audio_urls = None
+
+    def get_audio_url(self, style, key=None):
+        entry = (self.audio_urls or {}).get(style)
+        if not entry or (key is not None and entry.get("key") != key):
+            return None
+        return entry.get("url")
+
+    def set_audio_url(self, style, key, url):
+        self.audio_urls = {**(self.audio_urls or {}), style: {"key": key, "url": url}}
+
+
+class FakeTTSService:
+    """TTS service whose cache can evict and whose synthesis can fail"""
+
+    def __init__(self, fail_on=()):
+        self.presets = {"academic": "-10%", "friendly": "+0%"}
+        self.fail_on = set(fail_on)
+        self.stored = {}
+        self.calls = []
+
+    def get_available_styles(self):
+        return dict(self.presets)
+
+    def cache_key(self, text, style="friendly"):
+        return f"{style}:{self.presets[style]}:{text}"
+
+    def available_url(self, key, audio_url):
+        return self.stored.get(key)
+
+    async def synthesize(self, text, style="friendly"):
+        self.calls.append((text, style))
+        if text in self.fail_on:
+            raise RuntimeError("edge-tts unavailable")
+        key = self.cache_key(text, style)
+        self.stored[key] = f"minio://audio/tts/cache/{len(self.calls)}.mp3"
+        return self.stored[key]
+
+
+class FakeRepository:
+    """Question repository recording saved questions"""
+
+    def __init__(self, questions=()):
+        self.questions = list(questions)
+        self.updated = []
+
+    def iter_active_questions(self):
+        return iter(self.questions)
+
+    def update(self, question):
+        self.updated.append(question.id)
+        return question
+
+
+def make_prerenderer(tts, repository, **kwargs):
+    return QuestionAudioPrerenderer(tts_service=tts, repository=repository, **kwargs)
+
+
+class TestQuestionAudioPrerenderer:
+    """Test bank-wide question audio pre-rendering"""
+
+    def test_renders_every_style_and_saves(self):
+        questions = [FakeQuestion("q1", "Why here?"), FakeQuestion("q2", "Why now?")]
+        tts = FakeTTSService()
+        repository = FakeRepository(questions)
+
+        stats = asyncio.run(make_prerenderer(tts, repository).prerender())
+
+        assert stats["questions"] == 2
+        assert stats["rendered"] == 4
+        assert repository.updated == ["q1", "q2"]
+        assert questions[0].get_audio_url("academic") is not None
+
+    def test_unchanged_key_is_skipped(self):
+        question = FakeQuestion("q1", "Why here?")
+        tts = FakeTTSService()
+        repository = FakeRepository([question])
+        prerenderer = make_prerenderer(tts, repository)
+
+        asyncio.run(prerenderer.prerender())
+        stats = asyncio.run(prerenderer.prerender())
+
+        assert stats["skipped"] == 2
+        assert stats["rendered"] == 0
+        assert len(tts.calls) == 2
+        assert repository.updated == ["q1"]
+
+    def test_changed_content_or_style_is_rendered_again(self):
+        question = FakeQuestion("q1", "Why here?")
+        tts = FakeTTSService()
+        prerenderer = make_prerenderer(tts, FakeRepository([question]))
+        asyncio.run(prerenderer.prerender())
+
+        question.content = "Why this major?"
+        stats = asyncio.run(prerenderer.prerender())
+        assert stats["rendered"] == 2
+
+        tts.presets["academic"] = "-20%"
+        stats = asyncio.run(prerenderer.prerender())
+        assert stats["rendered"] == 1
+        assert stats["skipped"] == 1
+
+    def test_evicted_audio_is_rendered_again(self):
+        question = FakeQuestion("q1", "Why here?")
+        tts = FakeTTSService()
+        prerenderer = make_prerenderer(tts, FakeRepository([question]), styles=["friendly"])
+        asyncio.run(prerenderer.prerender())
+
+        tts.stored.clear()
+        stats = asyncio.run(prerenderer.prerender())
+
+        assert stats["rendered"] == 1
+        assert question.get_audio_url("friendly") == tts.stored[
+            tts.cache_key("Why here?", "friendly")
+        ]
+
+    def test_single_failure_does_not_stop_the_run(self):
+        questions = [
+            FakeQuestion("q1", "Broken"),
+            FakeQuestion("q2", "Why here?"),
+            FakeQuestion("q3", "Why now?"),
+        ]
+        tts = FakeTTSService(fail_on={"Broken"})
+        repository = FakeRepository(questions)
+
+        stats = asyncio.run(
+            make_prerenderer(tts, repository, styles=["friendly"], concurrency=1).prerender()
+        )
+
+        assert stats["failed"] == 1
+        assert stats["errors"] == [
+            {"question_id": "q1", "style": "friendly", "error": "edge-tts unavailable"}
+        ]
+        assert stats["rendered"] == 2
+        assert repository.updated == ["q2", "q3"]
+
+    def test_failed_save_is_recorded(self):
+        class FailingRepository(FakeRepository):
+            def update(self, question):
+                raise ConnectionError("database down")
+
+        question = FakeQuestion("q1", "Why here?")
+        stats = asyncio.run(
+            make_prerenderer(
+                FakeTTSService(), FailingRepository([question]), styles=["friendly"]
+            ).prerender()
+        )
+
+        assert stats["failed"] == 1
+        assert stats["errors"][0]["style"] is None
+
+
+class TestUpgradeDb:
+    """Test adding new columns to existing tables"""
+
+    def test_adds_audio_urls_to_existing_questions_table(self, tmp_path):
+        import sqlalchemy
+        from src.utils.database import upgrade_db
+
+        engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+        with engine.begin() as connection:
+            connection.execute(
+                sqlalchemy.text("CREATE TABLE questions (id VARCHAR(36) PRIMARY KEY)")
+            )
+
+        upgrade_db(engine)
+        upgrade_db(engine)
+
+        columns = {c["name"] for c in sqlalchemy.inspect(engine).get_columns("questions")}
+        assert columns == {"id", "audio_urls"}
@@ -0,0 +1,248 @@
+# 评分结果缓存测试
+# 文件路径: tests/unit/test_scoring_cache.py
+
+import asyncio
+import json
+
+import numpy as np
+from src.ai.audio_fetcher import AudioBuffer
+from src.services.scoring_cache import ScoringResultCache
+from src.services.scoring_service import ScoringService
+from src.algorithms.gop_scorer import GOPScorer
+from src.algorithms.fluency_scorer import FluencyScorer
+from src.algorithms.vocabulary_scorer import VocabularyScorer
+from src.algorithms.grammar_scorer import GrammarScorer
+from src.algorithms.university_match_scorer import UniversityMatchScorer
+from src.algorithms.knowledge_base import KnowledgeBaseStore
+from src.algorithms.lexicon import Lexicon
+
+
+class CountingGOPScorer(GOPScorer):
+    """GOP scorer that counts how often it runs"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def calculate_gop_score(self, audio_url, text):
+        self.calls += 1
+        return super().calculate_gop_score(audio_url, text)
+
+
+class FailingGrammarScorer(GrammarScorer):
+    """Grammar scorer that always raises"""
+
+    def calculate_grammar_score(self, text):
+        raise RuntimeError("grammar backend unavailable")
+
+
+class FakeRedis:
+    """In-memory stand-in for a Redis client"""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+
+    def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+
+
+class BytesFetcher:
+    """Audio fetcher serving fixed bytes per URL"""
+
+    def __init__(self, files, versions=None):
+        self.files = files
+        self.versions = versions or {}
+        self.fetches = 0
+
+    def content_version(self, audio_url):
+        return self.versions.get(audio_url)
+
+    def fetch_bytes(self, audio_url):
+        self.fetches += 1
+        return self.files[audio_url]
+
+
+def make_service(cache=None, **overrides):
+    scorers = {
+        "gop_scorer": CountingGOPScorer(),
+        "fluency_scorer": FluencyScorer(),
+        "vocabulary_scorer": VocabularyScorer(),
+        "grammar_scorer": GrammarScorer(),
+        "university_match_scorer": UniversityMatchScorer(),
+    }
+    scorers.update(overrides)
+    return ScoringService(result_cache=cache or ScoringResultCache(), **scorers)
+
+
+KWARGS = dict(
+    question="Why do you want to study here?",
+    answer="I want to study computer science and algorithms",
+    audio_url="http://example.com/audio.wav",
+    university="西安交通大学",
+    major="计算机科学与技术",
+)
+
+
+class TestScoringResultCache:
+    """Test evaluation memoization"""
+
+    def test_repeated_evaluation_hits_cache(self):
+        service = make_service()
+
+        first = service.evaluate(**KWARGS)
+        second = service.evaluate(**KWARGS)
+
+        assert second == first
+        assert second is not first
+        assert service.gop_scorer.calls == 1
+        stats = service.result_cache.stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_key_includes_answer_and_target(self):
+        service = make_service()
+
+        service.evaluate(**KWARGS)
+        service.evaluate(**{**KWARGS, "answer": "A different answer"})
+        service.evaluate(**{**KWARGS, "major": "电子工程"})
+
+        assert service.gop_scorer.calls == 3
+
+    def test_weight_change_invalidates(self):
+        service = make_service()
+        version = service.scorer_version()
+
+        service.evaluate(**{**KWARGS, "university": None, "major": None})
+        service.weights["pronunciation"] = 0.4
+        service.evaluate(**{**KWARGS, "university": None, "major": None})
+
+        assert service.scorer_version() != version
+        assert service.gop_scorer.calls == 2
+
+    def test_audio_is_keyed_by_content(self):
+        service = make_service()
+        samples = np.linspace(-0.5, 0.5, 16000, dtype=np.float32)
+
+        service.evaluate(**{**KWARGS, "audio_url": AudioBuffer(samples)})
+        service.evaluate(**{**KWARGS, "audio_url": AudioBuffer(samples.copy())})
+        service.evaluate(**{**KWARGS, "audio_url": AudioBuffer(samples * 0.5)})
+
+        assert service.gop_scorer.calls == 2
+
+    def test_urls_are_hashed_by_fetched_bytes(self):
+        service = make_service()
+        service.audio_fetcher = BytesFetcher(
+            {"a": b"same", "b": b"same", "c": b"new"}
+        )
+
+        for url in ["a", "b", "c"]:
+            service.evaluate(**{**KWARGS, "audio_url": url})
+
+        assert service.gop_scorer.calls == 2
+
+    def test_urls_with_content_version_are_not_downloaded(self):
+        service = make_service()
+        fetcher = BytesFetcher({}, versions={"a": "etag-1"})
+        service.audio_fetcher = fetcher
+
+        service.evaluate(**{**KWARGS, "audio_url": "a"})
+        service.evaluate(**{**KWARGS, "audio_url": "a"})
+        fetcher.versions["a"] = "etag-2"
+        service.evaluate(**{**KWARGS, "audio_url": "a"})
+
+        assert fetcher.fetches == 0
+        assert service.gop_scorer.calls == 2
+
+    def test_degraded_results_are_not_cached(self):
+        service = make_service(grammar_scorer=FailingGrammarScorer())
+
+        result = asyncio.run(service.evaluate_async(**KWARGS))
+        asyncio.run(service.evaluate_async(**KWARGS))
+
+        assert result["degraded_dimensions"] == ["grammar"]
+        assert service.gop_scorer.calls == 2
+        assert len(service.result_cache._memory) == 0
+
+    def test_redis_tier_is_shared_between_processes(self):
+        redis = FakeRedis()
+        first = make_service(ScoringResultCache(redis_client=redis))
+        second = make_service(ScoringResultCache(redis_client=redis))
+
+        expected = first.evaluate(**KWARGS)
+        result = second.evaluate(**KWARGS)
+
+        assert result == expected
+        assert second.gop_scorer.calls == 0
+        assert second.result_cache.stats()["redis_hits"] == 1
+
+    def test_redis_errors_fall_back_to_scoring(self):
+        cache = ScoringResultCache(redis_client=FakeRedis(fail=True))
+        service = make_service(cache)
+
+        result = service.evaluate(**KWARGS)
+
+        assert result["overall_score"] >= 0
+        assert cache.stats()["redis_errors"] == 2
+
+    def test_corrupt_redis_payload_is_a_miss(self):
+        redis = FakeRedis()
+        service = make_service(ScoringResultCache(redis_client=redis))
+        expected = service.evaluate(**KWARGS)
+        for key in redis.data:
+            redis.data[key] = '{"overall_score": 8'
+
+        cache = ScoringResultCache(redis_client=redis)
+        result = make_service(cache).evaluate(**KWARGS)
+
+        assert result == expected
+        stats = cache.stats()
+        assert stats["redis_hits"] == 0
+        assert stats["misses"] == 1
+        assert stats["redis_errors"] == 1
+
+    def test_async_and_batch_paths_share_cache(self):
+        service = make_service()
+
+        first = asyncio.run(service.evaluate_async(**KWARGS))
+        again = asyncio.run(service.evaluate_async(**KWARGS))
+        item = {k: KWARGS[k] for k in ("answer", "audio_url", "university", "major")}
+        other = {**item, "answer": "Something else entirely"}
+        report = service.evaluate_batch([item, other])
+
+        assert again == first
+        assert report["results"][0] == first
+        assert report["stats"]["cache_hits"] == 1
+        assert service.gop_scorer.calls == 2
+
+    def test_lexicon_content_change_invalidates(self):
+        before = make_service(
+            vocabulary_scorer=VocabularyScorer(Lexicon.build([("study", "A1", False)]))
+        )
+        after = make_service(
+            vocabulary_scorer=VocabularyScorer(Lexicon.build([("study", "B2", False)]))
+        )
+
+        assert after.scorer_version() != before.scorer_version()
+
+    def test_knowledge_base_content_change_invalidates(self, tmp_path):
+        path = tmp_path / "knowledge_base.json"
+        data = {"version": "1", "universities": {}, "majors": {"计算机": ["algorithm"]}}
+        path.write_text(json.dumps(data), encoding="utf-8")
+        store = KnowledgeBaseStore(str(path))
+        service = make_service(university_match_scorer=UniversityMatchScorer(store))
+        version = service.scorer_version()
+
+        data["majors"]["计算机"].append("compiler")
+        path.write_text(json.dumps(data), encoding="utf-8")
+        store.reload()
+
+        assert service.scorer_version() != version
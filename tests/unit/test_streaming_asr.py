@@ -0,0 +1,125 @@
+"""
+Tests for incremental streaming ASR.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from src.ai.streaming_asr import StreamingRecognizer
+
+
+SAMPLE_RATE = 16000
+VAD_CONFIG = {"threshold": 0.5, "min_speech_ms": 90, "min_silence_ms": 300}
+
+
+def tone(ms, amplitude=8000):
+    t = np.arange(SAMPLE_RATE * ms // 1000) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype("<i2").tobytes()
+
+
+def silence(ms):
+    return np.zeros(SAMPLE_RATE * ms // 1000, dtype="<i2").tobytes()
+
+
+class CountingDecoder:
+    """Decoder that reports how many seconds of audio it received."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, audio):
+        self.calls.append(len(audio))
+        return {"text": f"{len(audio) / SAMPLE_RATE:.2f}s"}
+
+
+def make_recognizer(decoder, **kwargs):
+    return StreamingRecognizer(
+        decoder, sample_rate=SAMPLE_RATE, vad_config=VAD_CONFIG,
+        partial_interval_ms=300, **kwargs
+    )
+
+
+def feed(recognizer, pcm, chunk_ms=20):
+    """Feed PCM in small chunks that do not align with VAD frames."""
+    chunk = SAMPLE_RATE * chunk_ms // 1000 * 2
+
+    async def run():
+        events = []
+        for i in range(0, len(pcm), chunk):
+            events.extend(await recognizer.accept_chunk(pcm[i:i + chunk]))
+        return events
+
+    return asyncio.run(run())
+
+
+class TestStreamingRecognizer:
+    def test_partials_precede_final_on_silence(self):
+        decoder = CountingDecoder()
+        recognizer = make_recognizer(decoder)
+
+        events = feed(recognizer, silence(300) + tone(1200) + silence(600))
+
+        types = [e["type"] for e in events]
+        assert types.count("final") == 1
+        assert types[-1] == "final"
+        assert "partial" in types[:-1]
+        assert all(e["segment"] == 0 for e in events)
+
+        final = events[-1]
+        assert final["is_final"] is True
+        # Trailing silence is trimmed from the final hypothesis.
+        assert final["end"] - final["start"] == pytest.approx(1.2, abs=0.05)
+        assert final["start"] == pytest.approx(0.3, abs=0.05)
+
+    def test_pauses_split_segments(self):
+        recognizer = make_recognizer(CountingDecoder())
+
+        events = feed(recognizer, tone(300) + silence(400) + tone(300) + silence(400))
+
+        finals = [e for e in events if e["is_final"]]
+        assert [e["segment"] for e in finals] == [0, 1]
+        assert recognizer.transcript == " ".join(e["text"] for e in finals)
+
+    def test_short_noise_is_ignored(self):
+        decoder = CountingDecoder()
+        recognizer = make_recognizer(decoder)
+
+        events = feed(recognizer, silence(210) + tone(30) + silence(500))
+        events += asyncio.run(recognizer.finish())
+
+        assert events == []
+        assert decoder.calls == []
+
+    def test_finish_flushes_open_segment(self):
+        recognizer = make_recognizer(CountingDecoder())
+
+        feed(recognizer, tone(500))
+        events = asyncio.run(recognizer.finish())
+
+        assert len(events) == 1
+        assert events[0]["type"] == "final"
+        assert recognizer.transcript == events[0]["text"]
+        assert asyncio.run(recognizer.finish()) == []
+
+    def test_discard_drops_open_segment_without_decoding(self):
+        decoder = CountingDecoder()
+        recognizer = make_recognizer(decoder)
+
+        feed(recognizer, tone(300) + silence(400) + tone(500))
+        calls = len(decoder.calls)
+        recognizer.discard()
+
+        assert asyncio.run(recognizer.finish()) == []
+        assert len(decoder.calls) == calls
+        assert len(recognizer.finals) == 1
+
+    def test_speech_probability_is_vectorized(self):
+        recognizer = make_recognizer(CountingDecoder())
+        frames = np.frombuffer(silence(30) + tone(30), dtype="<i2").reshape(2, -1)
+
+        probs = recognizer.speech_probability(frames)
+
+        assert probs.shape == (2,)
+        assert probs[0] == 0.0
+        assert probs[1] > VAD_CONFIG["threshold"]
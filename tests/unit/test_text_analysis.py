@@ -0,0 +1,85 @@
+"""
+Tests for the shared text analysis pass.
+"""
+
+import pytest
+from src.algorithms import text_analysis
+from src.algorithms.fluency_scorer import FluencyScorer
+from src.algorithms.gop_scorer import GOPScorer
+from src.algorithms.grammar_scorer import GrammarScorer
+from src.algorithms.text_analysis import AnalyzedText
+from src.algorithms.university_match_scorer import UniversityMatchScorer
+from src.algorithms.vocabulary_scorer import VocabularyScorer
+from src.services import scoring_service
+from src.services.scoring_service import ScoringService
+
+
+TEXT = "  I study Computer science.  He is a student. It was a-OK..  Machine learning "
+
+
+class TestAnalyzedText:
+    def test_tokens_and_words(self):
+        analysis = AnalyzedText(TEXT)
+
+        assert analysis.tokens == TEXT.split()
+        assert analysis.lower_tokens == TEXT.lower().split()
+        assert analysis.words[:3] == ["study", "computer", "science"]
+        assert "a" not in analysis.words
+        assert analysis.word_count == len(TEXT.split())
+
+    def test_sentence_spans_point_into_text(self):
+        analysis = AnalyzedText(TEXT)
+
+        assert analysis.sentences == [
+            "I study Computer science",
+            "He is a student",
+            "It was a-OK",
+            "Machine learning",
+        ]
+        assert [TEXT[a:b] for a, b in analysis.sentence_spans] == analysis.sentences
+        assert analysis.sentence_word_counts == [4, 4, 3, 2]
+
+    def test_of_reuses_existing_analysis(self):
+        analysis = AnalyzedText(TEXT)
+
+        assert AnalyzedText.of(analysis) is analysis
+        assert AnalyzedText.of("text").tokens == ["text"]
+
+
+class TestScorersConsumeAnalysis:
+    @pytest.mark.parametrize(
+        "score",
+        [
+            lambda t: VocabularyScorer().calculate_vocabulary_score(t),
+            lambda t: GrammarScorer().calculate_grammar_score(t),
+            lambda t: FluencyScorer().calculate_fluency_score("a.wav", t),
+            lambda t: GOPScorer().calculate_gop_score("a.wav", t),
+            lambda t: UniversityMatchScorer().calculate_match_score(
+                t, "西安交通大学", "计算机科学与技术"
+            ),
+        ],
+    )
+    def test_same_result_for_text_and_analysis(self, score):
+        assert score(AnalyzedText(TEXT)) == score(TEXT)
+
+    def test_evaluate_analyzes_answer_once(self, monkeypatch):
+        calls = []
+
+        class CountingAnalyzedText(text_analysis.AnalyzedText):
+            def __init__(self, text):
+                calls.append(text)
+                super().__init__(text)
+
+        monkeypatch.setattr(scoring_service, "AnalyzedText", CountingAnalyzedText)
+        monkeypatch.setattr(text_analysis.AnalyzedText, "of", classmethod(
+            lambda cls, text: pytest.fail("scorer re-analyzed text")
+            if isinstance(text, str) else text
+        ))
+        service = ScoringService(
+            GOPScorer(), FluencyScorer(), VocabularyScorer(), GrammarScorer(),
+            UniversityMatchScorer(),
+        )
+
+        service.evaluate("q", TEXT, "a.wav", "西安交通大学", "计算机科学与技术")
+
+        assert calls == [TEXT]
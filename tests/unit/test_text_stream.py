@@ -0,0 +1,76 @@
+"""
+Tests for sentence splitting of streamed text.
+"""
+
+import asyncio
+
+from src.ai.text_stream import iter_sentences, split_sentences
+
+
+async def tokens(text, size=3, events=None):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+    if events is not None:
+        events.append("done")
+
+
+def collect(stream):
+    async def run():
+        return [sentence async for sentence in stream]
+
+    return asyncio.run(run())
+
+
+class TestSplitSentences:
+    """Test cases for split_sentences."""
+
+    def test_keeps_unfinished_tail(self):
+        """Test that text after the last boundary is kept for later."""
+        sentences, rest = split_sentences("Good job! Your pace was steady. Next")
+
+        assert sentences == ["Good job!", "Your pace was steady."]
+        assert rest == " Next"
+
+    def test_needs_whitespace_after_punctuation(self):
+        """Test that decimals and unfinished sentences are not split."""
+        assert split_sentences("Your score was 85.5")[0] == []
+        assert split_sentences("Well done.")[0] == []
+
+    def test_skips_abbreviations(self):
+        """Test that common abbreviations do not end a sentence."""
+        sentences, rest = split_sentences('Use linking words, e.g. "however." Try')
+
+        assert sentences == ['Use linking words, e.g. "however."']
+        assert rest == " Try"
+
+
+class TestIterSentences:
+    """Test cases for iter_sentences."""
+
+    def test_regroups_tokens_into_sentences(self):
+        """Test that arbitrary token boundaries yield whole sentences."""
+        text = "Great answer! Mr. Smith would agree.\nTry to slow down a little"
+
+        assert collect(iter_sentences(tokens(text))) == [
+            "Great answer!",
+            "Mr. Smith would agree.",
+            "Try to slow down a little",
+        ]
+
+    def test_yields_before_stream_ends(self):
+        """Test that a sentence is emitted as soon as it is complete."""
+        events = []
+
+        async def run():
+            text = "First point. Second point."
+            stream = iter_sentences(tokens(text, events=events))
+            first = await stream.__anext__()
+            seen = list(events)
+            rest = [sentence async for sentence in stream]
+            return first, seen, rest
+
+        first, seen, rest = asyncio.run(run())
+
+        assert first == "First point."
+        assert seen == []
+        assert rest == ["Second point."]
@@ -0,0 +1,114 @@
+"""
+Tests for the content-addressed TTS audio cache.
+"""
+
+import os
+
+from src.ai.tts_cache import FileAudioStore, TTSAudioCache, tts_cache_key
+
+
+class TestCacheKey:
+    """Test cases for tts_cache_key."""
+
+    def test_key_is_stable(self):
+        """Test that identical parameters produce the same key."""
+        a = tts_cache_key("Hello", "en-US-GuyNeural", "-10%", "-10%", "+0%")
+        b = tts_cache_key("Hello", "en-US-GuyNeural", "-10%", "-10%", "+0%")
+        assert a == b
+        assert len(a) == 64
+
+    def test_key_depends_on_every_parameter(self):
+        """Test that changing any parameter changes the key."""
+        base = ["Hello", "en-US-GuyNeural", "-10%", "-10%", "+0%"]
+        keys = {tts_cache_key(*base)}
+        for i in range(len(base)):
+            params = list(base)
+            params[i] = params[i] + "x"
+            keys.add(tts_cache_key(*params))
+        assert len(keys) == len(base) + 1
+
+
+class TestFileAudioStore:
+    """Test cases for FileAudioStore."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test storing and retrieving audio."""
+        store = FileAudioStore(str(tmp_path), url_prefix="minio://audio/tts")
+
+        url = store.put("abc", b"audio")
+
+        assert url == "minio://audio/tts/abc.mp3"
+        assert store.get("abc") == url
+        assert store.get("missing") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test size-bounded LRU eviction."""
+        store = FileAudioStore(str(tmp_path), max_bytes=10)
+        store.put("a", b"12345")
+        store.put("b", b"12345")
+        store.get("a")
+        store.put("c", b"12345")
+
+        assert store.get("a") is not None
+        assert store.get("b") is None
+        assert store.total_bytes == 10
+        assert store.evictions == 1
+        assert not os.path.exists(tmp_path / "b.mp3")
+
+    def test_index_survives_restart(self, tmp_path):
+        """Test that a new store instance sees existing files."""
+        FileAudioStore(str(tmp_path)).put("a", b"12345")
+
+        store = FileAudioStore(str(tmp_path))
+
+        assert store.get("a") is not None
+        assert store.total_bytes == 5
+
+
+class TestTTSAudioCache:
+    """Test cases for TTSAudioCache."""
+
+    def test_memory_tier(self):
+        """Test in-process caching without a persistent store."""
+        cache = TTSAudioCache(max_memory_items=1)
+
+        assert cache.get("a") is None
+        cache.put("a", b"x", audio_url="minio://a.mp3")
+        assert cache.get("a") == "minio://a.mp3"
+
+        cache.put("b", b"x", audio_url="minio://b.mp3")
+        assert cache.get("a") is None
+
+        stats = cache.stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == round(1 / 3, 4)
+
+    def test_store_tier_backfills_memory(self, tmp_path):
+        """Test that a store hit is promoted into the memory tier."""
+        store = FileAudioStore(str(tmp_path))
+        store.put("a", b"audio")
+        cache = TTSAudioCache(store=store)
+
+        first = cache.get("a")
+        second = cache.get("a")
+
+        assert first == second == store.url_for("a")
+        stats = cache.stats()
+        assert stats["store_hits"] == 1
+        assert stats["memory_hits"] == 1
+        assert stats["store_items"] == 1
+
+    def test_store_eviction_invalidates_memory(self, tmp_path):
+        """Test that audio evicted by the store is not served from memory."""
+        store = FileAudioStore(str(tmp_path), max_bytes=150)
+        cache = TTSAudioCache(store=store)
+
+        cache.put("a", b"x" * 100)
+        assert cache.get("a") == store.url_for("a")
+        cache.put("b", b"x" * 100)
+
+        assert store.get("a") is None
+        assert cache.get("a") is None
+        assert cache.get("b") == store.url_for("b")
+        assert cache.stats()["memory_items"] == 1
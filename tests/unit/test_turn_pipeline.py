@@ -0,0 +1,118 @@
+# 答题流水线测试
+# 文件路径: tests/unit/test_turn_pipeline.py
+
+import asyncio
+import time
+
+import pytest
+from src.services.turn_pipeline import TurnPipeline
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestTurnPipeline:
+    """Test staged turn execution"""
+
+    def test_independent_branches_overlap(self):
+        """Test that stages sharing only a dependency run concurrently"""
+
+        async def scenario():
+            async def transcript():
+                return "answer"
+
+            async def slow(text):
+                await asyncio.sleep(0.1)
+                return text.upper()
+
+            pipeline = TurnPipeline()
+            pipeline.add_stage("transcript", transcript)
+            pipeline.add_stage("feedback", slow, "transcript")
+            pipeline.add_stage("follow_up", slow, "transcript")
+
+            start = time.perf_counter()
+            results = await pipeline.run()
+            return results, time.perf_counter() - start
+
+        results, elapsed = run(scenario())
+
+        assert results == {
+            "transcript": "answer",
+            "feedback": "ANSWER",
+            "follow_up": "ANSWER",
+        }
+        assert elapsed < 0.18
+
+    def test_dependencies_passed_in_order(self):
+        """Test that dependency results are passed positionally"""
+
+        async def scenario():
+            async def a():
+                return 1
+
+            async def b():
+                return 2
+
+            async def combine(x, y):
+                return (x, y)
+
+            pipeline = TurnPipeline()
+            pipeline.add_stage("a", a).add_stage("b", b)
+            pipeline.add_stage("c", combine, "b", "a")
+            return await pipeline.result("c")
+
+        assert run(scenario()) == (2, 1)
+
+    def test_on_stage_reports_completion_order(self):
+        """Test that each stage is reported as soon as it finishes"""
+        seen = []
+
+        async def scenario():
+            async def on_stage(name, result):
+                seen.append(name)
+
+            async def fast():
+                return "fast"
+
+            async def slow():
+                await asyncio.sleep(0.05)
+                return "slow"
+
+            pipeline = TurnPipeline(on_stage=on_stage)
+            pipeline.add_stage("slow", slow)
+            pipeline.add_stage("fast", fast)
+            await pipeline.run()
+
+        run(scenario())
+        assert seen == ["fast", "slow"]
+
+    def test_failure_cancels_pending_stages(self):
+        """Test that a failing stage cancels the rest"""
+
+        async def scenario():
+            async def broken():
+                raise RuntimeError("asr failed")
+
+            async def never():
+                await asyncio.sleep(10)
+
+            pipeline = TurnPipeline()
+            pipeline.add_stage("transcript", broken)
+            pipeline.add_stage("other", never)
+            await pipeline.run()
+
+        with pytest.raises(RuntimeError):
+            run(scenario())
+
+    def test_unknown_dependency_rejected(self):
+        """Test that stages must be added after their dependencies"""
+
+        async def scenario():
+            async def stage(x):
+                return x
+
+            TurnPipeline().add_stage("score", stage, "transcript")
+
+        with pytest.raises(ValueError):
+            run(scenario())